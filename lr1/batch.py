@@ -0,0 +1,258 @@
+import sys
+
+import numpy as np
+
+from softfloat import BINARY16, BINARY32, BINARY64, float_add, float_div, float_mul, float_sqrt, float_sub
+
+_FLOAT_TYPES = {
+    BINARY16: (np.float16, np.uint16),
+    BINARY32: (np.float32, np.uint32),
+    BINARY64: (np.float64, np.uint64),
+}
+_BIG_ENDIAN_TYPES = {
+    np.dtype(np.float16): np.dtype('>f2'),
+    np.dtype(np.float32): np.dtype('>f4'),
+    np.dtype(np.float64): np.dtype('>f8'),
+}
+_UNSIGNED_TYPES = {np.dtype(float_type): np.dtype(unsigned) for float_type, unsigned in _FLOAT_TYPES.values()}
+_FLOAT_OPERATIONS = {
+    'add': (float_add, np.add),
+    'sub': (float_sub, np.subtract),
+    'mul': (float_mul, np.multiply),
+    'div': (float_div, np.divide),
+    'sqrt': (float_sqrt, np.sqrt),
+}
+
+
+def _check_width(width):
+    if width < 1 or width > 64:
+        raise ValueError("Разрядность пакетных операций должна быть от 1 до 64")
+
+
+def _to_register_bits(values, width):
+    """Переводит массив знаковых чисел в битовые образы регистров (uint64)"""
+    values = np.ravel(np.asarray(values, dtype=np.int64))
+    if width < 64:
+        limit = 1 << (width - 1)
+        if values.size and (values.min() < -limit or values.max() >= limit):
+            raise ValueError(f"Числа не помещаются в {width}-битный регистр")
+    mask = np.uint64((1 << width) - 1)
+    return values.astype(np.uint64) & mask
+
+
+def _to_signed(bits, width):
+    """Расширяет знак битовых образов до int64"""
+    sign = np.uint64(1 << (width - 1))
+    return ((bits ^ sign) - sign).view(np.int64)
+
+
+def to_bit_matrix(values, width=8):
+    """
+    Возвращает матрицу дополнительных кодов формы N×width (uint8),
+    старший бит — в нулевом столбце.
+    """
+    _check_width(width)
+    return _bit_matrix(_to_register_bits(values, width), width)
+
+
+def _bit_matrix(bits, width):
+    shifts = np.arange(width - 1, -1, -1, dtype=np.uint64)
+    return ((bits[:, None] >> shifts) & np.uint64(1)).astype(np.uint8)
+
+
+def _result(bits, overflow, width):
+    return {
+        'result': _to_signed(bits, width),
+        'overflow': overflow,
+        'bits': _bit_matrix(bits, width),
+    }
+
+
+def batch_addition(a, b, width=8):
+    """
+    Поэлементное сложение двух массивов в дополнительном коде.
+    Возвращает словарь с результатами, маской переполнений и матрицей битов результата.
+    """
+    _check_width(width)
+    a_bits = _to_register_bits(a, width)
+    b_bits = _to_register_bits(b, width)
+    mask = np.uint64((1 << width) - 1)
+    sign = np.uint64(1 << (width - 1))
+    bits = (a_bits + b_bits) & mask
+    overflow = ((a_bits ^ bits) & (b_bits ^ bits) & sign) != 0
+    return _result(bits, overflow, width)
+
+
+def batch_subtraction(a, b, width=8):
+    """Поэлементное вычитание двух массивов в дополнительном коде"""
+    _check_width(width)
+    a_bits = _to_register_bits(a, width)
+    b_bits = _to_register_bits(b, width)
+    mask = np.uint64((1 << width) - 1)
+    sign = np.uint64(1 << (width - 1))
+    bits = (a_bits - b_bits) & mask
+    overflow = ((a_bits ^ b_bits) & (a_bits ^ bits) & sign) != 0
+    return _result(bits, overflow, width)
+
+
+def batch_multiplication(a, b, width=8):
+    """
+    Поэлементное умножение с полным произведением двойной разрядности.
+    Поддерживаются разрядности до 32 бит, чтобы произведение помещалось в int64.
+    """
+    if width < 1 or width > 32:
+        raise ValueError("Разрядность пакетного умножения должна быть от 1 до 32")
+    a_values = _to_signed(_to_register_bits(a, width), width)
+    b_values = _to_signed(_to_register_bits(b, width), width)
+    product = a_values * b_values
+    bits = product.astype(np.uint64) & np.uint64((1 << (2 * width)) - 1)
+    return {
+        'result': product,
+        'bits': _bit_matrix(bits, 2 * width),
+    }
+
+
+def batch_division(a, b, width=8, precision=5):
+    """
+    Поэлементное деление с precision дробными битами частного.
+    Частное совпадает с результатом divide(): модуль усекается, знак — по правилу прямого кода.
+    """
+    if width < 1 or width + precision > 62:
+        raise ValueError("Сумма разрядности и точности пакетного деления не должна превышать 62")
+    a_values = _to_signed(_to_register_bits(a, width), width)
+    b_values = _to_signed(_to_register_bits(b, width), width)
+    if np.any(b_values == 0):
+        raise ZeroDivisionError("Деление на ноль")
+    numerator = np.abs(a_values) << precision
+    magnitude, remainder = np.divmod(numerator, np.abs(b_values))
+    negative = (a_values < 0) != (b_values < 0)
+    return {
+        'quotient': np.where(negative, -1.0, 1.0) * np.ldexp(magnitude.astype(np.float64), -precision),
+        'raw': np.where(negative, -magnitude, magnitude),
+        'remainder': remainder,
+    }
+
+
+def batch_float_operation(operation, a, b=None, fmt=BINARY32, rounding="nearest_even"):
+    """
+    Поэлементная операция над массивами чисел формата fmt ('add', 'sub', 'mul', 'div', 'sqrt').
+    При округлении к ближайшему чётному используются собственные типы NumPy: для binary16/32
+    промежуточная точность NumPy не меньше 2p + 2 бит, поэтому двойное округление даёт тот же
+    результат, что и программная реализация. Остальные режимы округления вычисляются
+    поэлементно через softfloat над битовыми образами.
+    """
+    if operation not in _FLOAT_OPERATIONS:
+        raise ValueError(f"Неизвестная операция: {operation}")
+    float_type, bits_type = _FLOAT_TYPES[fmt]
+    soft, native = _FLOAT_OPERATIONS[operation]
+    operands = [np.ascontiguousarray(a, dtype=float_type)]
+    if operation != 'sqrt':
+        operands.append(np.ascontiguousarray(b, dtype=float_type))
+    if rounding == "nearest_even":
+        with np.errstate(all='ignore'):
+            return native(*operands).astype(float_type)
+    elementwise = np.frompyfunc(lambda *bits: soft(*map(int, bits), fmt=fmt, rounding=rounding),
+                                len(operands), 1)
+    result = elementwise(*(operand.view(bits_type) for operand in operands))
+    return np.asarray(result, dtype=bits_type).view(float_type)
+
+
+def _check_fixed_format(fmt):
+    if fmt.word_bits > 32:
+        raise ValueError("Пакетные операции с фиксированной точкой поддерживают слова до 32 бит")
+
+
+def _fit_fixed(raw, fmt):
+    if fmt.overflow == "saturate":
+        return np.clip(raw, fmt.min_raw, fmt.max_raw)
+    return ((raw - fmt.min_raw) & ((1 << fmt.word_bits) - 1)) + fmt.min_raw
+
+
+def _round_divide_fixed(numerator, denominator, rounding):
+    """Векторный аналог fixed_point.round_divide (denominator > 0)"""
+    quotient, remainder = np.divmod(numerator, denominator)
+    if rounding == "floor":
+        return quotient
+    inexact = remainder != 0
+    if rounding == "toward_zero":
+        return quotient + (inexact & (numerator < 0))
+    twice = 2 * remainder
+    if rounding == "nearest_even":
+        tie_up = quotient & 1
+    else:
+        tie_up = numerator > 0
+    return quotient + np.where(twice == denominator, tie_up, twice > denominator)
+
+
+def quantize(values, fmt):
+    """Переводит массив вещественных чисел в масштабированные целые формата fmt"""
+    _check_fixed_format(fmt)
+    scaled = np.ldexp(np.asarray(values, dtype=np.float64), fmt.fractional_bits)
+    if fmt.rounding == "floor":
+        raw = np.floor(scaled)
+    elif fmt.rounding == "toward_zero":
+        raw = np.trunc(scaled)
+    elif fmt.rounding == "nearest_even":
+        raw = np.rint(scaled)
+    else:
+        raw = np.sign(scaled) * np.floor(np.abs(scaled) + 0.5)
+    return _fit_fixed(raw.astype(np.int64), fmt)
+
+
+def dequantize(raw, fmt):
+    """Переводит масштабированные целые формата fmt в вещественные числа"""
+    return np.ldexp(np.asarray(raw, dtype=np.int64).astype(np.float64), -fmt.fractional_bits)
+
+
+def batch_fixed_point_operation(operation, a, b, fmt):
+    """
+    Поэлементная операция ('add', 'sub', 'mul', 'div') над масштабированными целыми формата fmt.
+    Результат совпадает с операциями FixedPoint.
+    """
+    _check_fixed_format(fmt)
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    if operation == 'add':
+        raw = a + b
+    elif operation == 'sub':
+        raw = a - b
+    elif operation == 'mul':
+        raw = _round_divide_fixed(a * b, 1 << fmt.fractional_bits, fmt.rounding)
+    elif operation == 'div':
+        if np.any(b == 0):
+            raise ZeroDivisionError("Деление на ноль")
+        numerator = np.where(b < 0, -a, a) << fmt.fractional_bits
+        raw = _round_divide_fixed(numerator, np.abs(b), fmt.rounding)
+    else:
+        raise ValueError(f"Неизвестная операция: {operation}")
+    return _fit_fixed(raw, fmt)
+
+
+def floats_to_bit_matrix(values, dtype=None):
+    """
+    Переводит массив чисел в матрицу битов IEEE-754 формы N×16, N×32 или N×64 (uint8),
+    знаковый бит — в нулевом столбце. Без dtype ширина берётся из типа массива numpy
+    (float16, float32 или float64), для прочих значений — float32. Массив нужного типа
+    не копируется: его слова читаются как целые без знака через view.
+    """
+    if dtype is None:
+        dtype = values.dtype if isinstance(values, np.ndarray) and values.dtype in _UNSIGNED_TYPES else np.float32
+    dtype = np.dtype(dtype)
+    if dtype not in _UNSIGNED_TYPES:
+        raise ValueError(f"Неподдерживаемый тип: {dtype}")
+    words = np.ravel(np.ascontiguousarray(values, dtype=dtype)).view(_UNSIGNED_TYPES[dtype])
+    octets = words.view(np.uint8).reshape(len(words), dtype.itemsize)
+    if sys.byteorder == "little":
+        # Младший байт слова идёт первым: разворачиваем биты с младшего и переставляем столбцы
+        return np.unpackbits(octets, axis=1, bitorder="little")[:, ::-1]
+    return np.unpackbits(octets, axis=1, bitorder="big")
+
+
+def bit_matrix_to_floats(bits, dtype=np.float32):
+    """Обратное преобразование матрицы битов IEEE-754 в массив чисел"""
+    big_endian = _BIG_ENDIAN_TYPES[np.dtype(dtype)]
+    bits = np.asarray(bits, dtype=np.uint8)
+    if bits.ndim != 2 or bits.shape[1] != 8 * big_endian.itemsize:
+        raise ValueError(f"Матрица битов должна иметь форму N×{8 * big_endian.itemsize}")
+    packed = np.packbits(bits, axis=1)
+    return packed.view(big_endian).ravel().astype(dtype)
@@ -0,0 +1,184 @@
+import argparse
+import json
+import platform
+import struct
+import sys
+import time
+
+import numpy as np
+
+import tables
+from batch import batch_addition, batch_division, batch_float_operation, batch_multiplication, batch_subtraction
+from divider import divide
+from functions import addition_float, addition_result, subtraction_result
+from multiplier import multiply
+from register import Register
+
+PRECISION = 5
+
+
+def _scalar(function):
+    return lambda a_values, b_values, width: [function(a, b, width) for a, b in zip(a_values, b_values)]
+
+
+def _round_float32(value):
+    return struct.unpack("<f", struct.pack("<f", value))[0]
+
+
+def _native_add(a, b, width):
+    total = a + b
+    wrapped = ((total + (1 << (width - 1))) & ((1 << width) - 1)) - (1 << (width - 1))
+    return wrapped, wrapped != total
+
+
+def _native_sub(a, b, width):
+    return _native_add(a, -b, width)
+
+
+def _native_div(a, b, width):
+    magnitude = (abs(a) << PRECISION) // abs(b) / (1 << PRECISION)
+    return -magnitude if (a < 0) != (b < 0) else magnitude
+
+
+def _native_float_add(a, b, width):
+    # Сумма двух float32 в double и повторное округление до float32 даёт корректно округлённый результат
+    return _round_float32(_round_float32(a) + _round_float32(b))
+
+
+def _batch_add(a_values, b_values, width):
+    result = batch_addition(np.array(a_values), np.array(b_values), width)
+    return list(zip(result['result'].tolist(), result['overflow'].tolist()))
+
+
+def _batch_sub(a_values, b_values, width):
+    result = batch_subtraction(np.array(a_values), np.array(b_values), width)
+    return list(zip(result['result'].tolist(), result['overflow'].tolist()))
+
+
+def _register_add(a, b, width):
+    result, overflow = Register(a, width).add(Register(b, width))
+    return result.value, overflow
+
+
+def _register_sub(a, b, width):
+    result, overflow = Register(a, width).subtract(Register(b, width))
+    return result.value, overflow
+
+
+def _functions_add(a, b, width):
+    result = addition_result(a, b, width)
+    return result.value, result.overflow
+
+
+def _functions_sub(a, b, width):
+    result = subtraction_result(a, b, width)
+    return result.value, result.overflow
+
+
+def _batch_float_add(a_values, b_values, width):
+    return batch_float_operation('add', np.array(a_values), np.array(b_values)).tolist()
+
+
+# Для каждой операции: эталон на встроенной арифметике и реализации из lr1
+OPERATIONS = {
+    'add': (_native_add, {
+        'functions': _scalar(_functions_add),
+        'register': _scalar(_register_add),
+        'tables': _scalar(tables.add),
+        'batch': _batch_add,
+    }),
+    'sub': (_native_sub, {
+        'functions': _scalar(_functions_sub),
+        'register': _scalar(_register_sub),
+        'tables': _scalar(tables.subtract),
+        'batch': _batch_sub,
+    }),
+    'mul': (lambda a, b, width: a * b, {
+        'shift_add': _scalar(lambda a, b, width: multiply(a, b, width, "shift_add").value),
+        'booth': _scalar(lambda a, b, width: multiply(a, b, width, "booth").value),
+        'karatsuba': _scalar(lambda a, b, width: multiply(a, b, width, "karatsuba").value),
+        'tables': _scalar(tables.multiply),
+        'batch': lambda a, b, width: batch_multiplication(np.array(a), np.array(b), width)['result'].tolist(),
+    }),
+    'div': (_native_div, {
+        'restoring': _scalar(lambda a, b, width: divide(a, b, width, PRECISION, "restoring").to_decimal()),
+        'non_restoring': _scalar(lambda a, b, width: divide(a, b, width, PRECISION, "non_restoring").to_decimal()),
+        'srt': _scalar(lambda a, b, width: divide(a, b, width, PRECISION, "srt").to_decimal()),
+        'tables': _scalar(lambda a, b, width: tables.divide(a, b, width, PRECISION).to_decimal()),
+        'batch': lambda a, b, width: batch_division(np.array(a), np.array(b), width, PRECISION)['quotient'].tolist(),
+    }),
+    'float_add': (_native_float_add, {
+        'softfloat': _scalar(lambda a, b, width: addition_float(a, b)),
+        'batch': _batch_float_add,
+    }),
+}
+
+
+def operand_pairs(operation, width):
+    """
+    Все пары операндов заданной разрядности.
+    Для деления исключается нулевой делитель, для вещественного сложения
+    целые операнды масштабируются на 0.1, чтобы проверялось округление.
+    """
+    values = range(-(1 << (width - 1)), 1 << (width - 1))
+    if operation == 'div':
+        # Прямой код не представляет -2 ** (width - 1), как и в binary_division
+        values = range(-(1 << (width - 1)) + 1, 1 << (width - 1))
+        pairs = [(a, b) for a in values for b in values if b != 0]
+    elif operation == 'float_add':
+        pairs = [(a * 0.1, b * 0.1) for a in values for b in values]
+    else:
+        pairs = [(a, b) for a in values for b in values]
+    return [a for a, _ in pairs], [b for _, b in pairs]
+
+
+def run_benchmark(width=8, operations=None):
+    """
+    Прогоняет все пары операндов через каждую реализацию, сравнивает с эталоном
+    и возвращает словарь с числом расхождений и скоростью (оп/с) для каждой реализации.
+    """
+    report = {
+        'width': width,
+        'python': platform.python_version(),
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'operations': {},
+    }
+    for operation in operations or OPERATIONS:
+        reference, implementations = OPERATIONS[operation]
+        a_values, b_values = operand_pairs(operation, width)
+        expected = [reference(a, b, width) for a, b in zip(a_values, b_values)]
+        results = {}
+        for name, implementation in implementations.items():
+            start = time.perf_counter()
+            actual = implementation(a_values, b_values, width)
+            elapsed = time.perf_counter() - start
+            mismatches = sum(1 for x, y in zip(actual, expected) if x != y)
+            results[name] = {
+                'checked': len(expected),
+                'mismatches': mismatches,
+                'seconds': elapsed,
+                'ops_per_second': len(expected) / elapsed if elapsed else None,
+            }
+        report['operations'][operation] = results
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Полный перебор и замер скорости арифметики lr1")
+    parser.add_argument("--width", type=int, default=8)
+    parser.add_argument("--operations", nargs="+", choices=list(OPERATIONS), default=list(OPERATIONS))
+    parser.add_argument("--output", default="-", help="файл для JSON-отчёта или '-' для stdout")
+    args = parser.parse_args(argv)
+    report = run_benchmark(args.width, args.operations)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    failed = any(result['mismatches'] for results in report['operations'].values() for result in results.values())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
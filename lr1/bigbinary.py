@@ -0,0 +1,40 @@
+def parse_bits(bits):
+    """Переводит строку из '0' и '1' в целое число"""
+    if bits.strip("01"):
+        raise ValueError(f"Строка должна состоять только из 0 и 1: {bits!r}")
+    return int(bits, 2) if bits else 0
+
+
+def format_bits(value, width):
+    """Записывает младшие width бит числа в виде строки"""
+    if width == 0:
+        return ""
+    return format(value & ((1 << width) - 1), f"0{width}b")
+
+
+def add_bits(bin1, bin2, width=None):
+    """
+    Складывает две беззнаковые двоичные строки.
+    Возвращает (сумма в width битах, перенос из старшего разряда);
+    по умолчанию width — длина более длинного операнда.
+    """
+    if width is None:
+        width = max(len(bin1), len(bin2))
+    total = parse_bits(bin1) + parse_bits(bin2)
+    return format_bits(total, width), total >> width & 1
+
+
+def subtract_bits(bin1, bin2, width=8):
+    """Вычитает двоичные строки в дополнительном коде по модулю 2 ** width"""
+    mask = (1 << width) - 1
+    return format_bits((parse_bits(bin1) & mask) - (parse_bits(bin2) & mask), width)
+
+
+def signed_value(bits, is_twos_complement=True):
+    """Знаковое значение строки в дополнительном или прямом коде"""
+    value = parse_bits(bits)
+    if not bits or bits[0] == '0':
+        return value
+    if is_twos_complement:
+        return value - (1 << len(bits))
+    return -(value ^ (1 << (len(bits) - 1)))
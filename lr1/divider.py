@@ -0,0 +1,129 @@
+import math
+
+from register import Register
+
+METHODS = ("restoring", "non_restoring", "srt")
+
+
+class DivisionResult:
+    """
+    Результат деления в прямом коде с фиксированной точкой.
+    quotient — модуль частного, умноженный на 2 ** precision,
+    remainder — остаток от деления масштабированного делимого на модуль делителя.
+    """
+    __slots__ = ("quotient", "remainder", "negative", "precision", "width")
+
+    def __init__(self, quotient, remainder, negative, precision, width):
+        self.quotient = quotient
+        self.remainder = remainder
+        self.negative = negative
+        self.precision = precision
+        self.width = width
+
+    @property
+    def integer_part(self):
+        return self.quotient >> self.precision
+
+    @property
+    def fractional_part(self):
+        return self.quotient & ((1 << self.precision) - 1)
+
+    def to_decimal(self):
+        """Значение частного без разбора строки"""
+        value = math.ldexp(self.quotient, -self.precision)
+        return -value if self.negative else value
+
+    def to_string(self):
+        """Строка вида 'знак + целая часть . дробная часть', как у binary_division"""
+        integer_bits = self.width - 1
+        if self.integer_part >> integer_bits:
+            raise ValueError(f"Целая часть частного не помещается в {integer_bits} бит")
+        result = ('1' if self.negative else '0') + format(self.integer_part, f"0{integer_bits}b")
+        if self.precision:
+            result += '.' + format(self.fractional_part, f"0{self.precision}b")
+        return result
+
+    def __float__(self):
+        return self.to_decimal()
+
+    def __repr__(self):
+        return (f"DivisionResult({self.to_decimal()!r}, remainder={self.remainder}, "
+                f"precision={self.precision})")
+
+
+def _restoring(numerator, divisor, steps):
+    remainder = numerator
+    quotient = 0
+    for i in range(steps - 1, -1, -1):
+        shifted = divisor << i
+        if remainder >= shifted:
+            remainder -= shifted
+            quotient |= 1 << i
+    return quotient, remainder
+
+
+def _non_restoring(numerator, divisor, steps):
+    """Цифры частного ±1 без восстановления остатка, коррекция — один раз в конце"""
+    remainder = numerator
+    positive = 0
+    for i in range(steps - 1, -1, -1):
+        if remainder >= 0:
+            remainder -= divisor << i
+            positive |= 1 << i
+        else:
+            remainder += divisor << i
+    # Цифры -1 стоят во всех разрядах, где нет +1
+    quotient = 2 * positive - ((1 << steps) - 1)
+    if remainder < 0:
+        remainder += divisor
+        quotient -= 1
+    return quotient, remainder
+
+
+def _srt(numerator, divisor, steps):
+    """SRT по основанию 2: избыточные цифры {-1, 0, 1}, выбор по сравнению с половиной делителя"""
+    remainder = numerator
+    positive = negative = 0
+    for i in range(steps - 1, -1, -1):
+        shifted = divisor << i
+        half = shifted >> 1
+        if remainder >= half:
+            remainder -= shifted
+            positive |= 1 << i
+        elif remainder < -half:
+            remainder += shifted
+            negative |= 1 << i
+    quotient = positive - negative
+    if remainder < 0:
+        remainder += divisor
+        quotient -= 1
+    return quotient, remainder
+
+
+def divide(dividend, divisor, width=8, precision=5, method="restoring"):
+    """
+    Делит два знаковых числа разрядности width, получая precision дробных бит частного.
+    Возвращает DivisionResult.
+    """
+    dividend = Register(dividend, width).value
+    divisor = Register(divisor, width).value
+    if divisor == 0:
+        raise ZeroDivisionError("Деление на ноль")
+    if precision < 0:
+        raise ValueError("Количество дробных бит не может быть отрицательным")
+    numerator = abs(dividend) << precision
+    steps = width + precision
+    if method == "restoring":
+        quotient, remainder = _restoring(numerator, abs(divisor), steps)
+    elif method == "non_restoring":
+        quotient, remainder = _non_restoring(numerator, abs(divisor), steps)
+    elif method == "srt":
+        quotient, remainder = _srt(numerator, abs(divisor), steps)
+    else:
+        raise ValueError(f"Неизвестный метод деления: {method}")
+    return DivisionResult(quotient, remainder, (dividend < 0) != (divisor < 0), precision, width)
+
+
+def divide_batch(dividends, divisors, width=8, precision=5, method="restoring"):
+    """Попарно делит две последовательности операндов"""
+    return [divide(a, b, width, precision, method) for a, b in zip(dividends, divisors)]
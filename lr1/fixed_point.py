@@ -0,0 +1,157 @@
+import math
+from collections import namedtuple
+from fractions import Fraction
+
+OVERFLOW_POLICIES = ("saturate", "wrap")
+ROUNDING_MODES = ("nearest", "nearest_even", "floor", "toward_zero")
+
+QFormatBase = namedtuple("QFormatBase", ["integer_bits", "fractional_bits", "overflow", "rounding"])
+
+
+class QFormat(QFormatBase):
+    """
+    Формат Qm.n: знаковый бит, m целых и n дробных бит.
+    overflow — поведение при выходе за диапазон ('saturate' или 'wrap'),
+    rounding — режим округления отбрасываемых дробных бит.
+    """
+    __slots__ = ()
+
+    def __new__(cls, integer_bits, fractional_bits, overflow="saturate", rounding="nearest"):
+        if integer_bits < 0 or fractional_bits < 0:
+            raise ValueError("Количество бит формата не может быть отрицательным")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Неизвестная политика переполнения: {overflow}")
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Неизвестный режим округления: {rounding}")
+        return super().__new__(cls, integer_bits, fractional_bits, overflow, rounding)
+
+    @property
+    def word_bits(self):
+        return 1 + self.integer_bits + self.fractional_bits
+
+    @property
+    def min_raw(self):
+        return -(1 << (self.word_bits - 1))
+
+    @property
+    def max_raw(self):
+        return (1 << (self.word_bits - 1)) - 1
+
+    def fit(self, raw):
+        """Приводит масштабированное целое к диапазону формата по политике переполнения"""
+        if self.min_raw <= raw <= self.max_raw:
+            return raw
+        if self.overflow == "saturate":
+            return self.max_raw if raw > 0 else self.min_raw
+        return ((raw - self.min_raw) & ((1 << self.word_bits) - 1)) + self.min_raw
+
+
+def round_divide(numerator, denominator, rounding):
+    """Делит целые числа (denominator > 0) с заданным режимом округления"""
+    quotient, remainder = divmod(numerator, denominator)
+    if rounding == "floor" or remainder == 0:
+        return quotient
+    if rounding == "toward_zero":
+        return quotient + (numerator < 0)
+    twice = 2 * remainder
+    if twice != denominator:
+        return quotient + (twice > denominator)
+    if rounding == "nearest_even":
+        return quotient + (quotient & 1)
+    # Половина округляется от нуля
+    return quotient + (numerator > 0)
+
+
+class FixedPoint:
+    """Число с фиксированной точкой, хранящееся как масштабированное целое raw = value * 2 ** n"""
+    __slots__ = ("raw", "fmt")
+
+    def __init__(self, raw, fmt):
+        self.raw = fmt.fit(raw)
+        self.fmt = fmt
+
+    @classmethod
+    def from_float(cls, value, fmt):
+        if math.isnan(value) or math.isinf(value):
+            raise ValueError(f"Число {value} нельзя представить в формате с фиксированной точкой")
+        scaled = Fraction(value) * (1 << fmt.fractional_bits)
+        return cls(round_divide(scaled.numerator, scaled.denominator, fmt.rounding), fmt)
+
+    @classmethod
+    def from_string(cls, text, overflow="saturate", rounding="nearest"):
+        """
+        Разбирает строку прямого кода вида binary_division ('00000011.01010').
+        Формат выводится из длины целой и дробной частей, поэтому преобразование без потерь.
+        """
+        integer_part, _, fractional_part = text.partition('.')
+        fmt = QFormat(len(integer_part) - 1, len(fractional_part), overflow, rounding)
+        magnitude = int(integer_part[1:] + fractional_part or '0', 2)
+        return cls(-magnitude if integer_part[0] == '1' else magnitude, fmt)
+
+    def to_float(self):
+        return math.ldexp(self.raw, -self.fmt.fractional_bits)
+
+    def to_string(self):
+        """Строка прямого кода: знак, целая часть, точка, дробная часть"""
+        magnitude = abs(self.raw)
+        if magnitude >> (self.fmt.integer_bits + self.fmt.fractional_bits):
+            raise ValueError(f"Число {self.to_float()} не имеет прямого кода в формате {self!r}")
+        n = self.fmt.fractional_bits
+        result = ('1' if self.raw < 0 else '0')
+        if self.fmt.integer_bits:
+            result += format(magnitude >> n, f"0{self.fmt.integer_bits}b")
+        if n:
+            result += '.' + format(magnitude & ((1 << n) - 1), f"0{n}b")
+        return result
+
+    def _check_format(self, other):
+        if other.fmt != self.fmt:
+            raise ValueError("Форматы операндов с фиксированной точкой должны совпадать")
+
+    def __add__(self, other):
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        self._check_format(other)
+        return FixedPoint(self.raw + other.raw, self.fmt)
+
+    def __sub__(self, other):
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        self._check_format(other)
+        return FixedPoint(self.raw - other.raw, self.fmt)
+
+    def __mul__(self, other):
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        self._check_format(other)
+        product = self.raw * other.raw
+        return FixedPoint(round_divide(product, 1 << self.fmt.fractional_bits, self.fmt.rounding), self.fmt)
+
+    def __truediv__(self, other):
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        self._check_format(other)
+        if other.raw == 0:
+            raise ZeroDivisionError("Деление на ноль")
+        numerator = self.raw << self.fmt.fractional_bits
+        denominator = other.raw
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        return FixedPoint(round_divide(numerator, denominator, self.fmt.rounding), self.fmt)
+
+    def __neg__(self):
+        return FixedPoint(-self.raw, self.fmt)
+
+    def __float__(self):
+        return self.to_float()
+
+    def __eq__(self, other):
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        return self.raw == other.raw and self.fmt == other.fmt
+
+    def __hash__(self):
+        return hash((self.raw, self.fmt))
+
+    def __repr__(self):
+        return f"FixedPoint({self.to_float()!r}, Q{self.fmt.integer_bits}.{self.fmt.fractional_bits})"
@@ -0,0 +1,93 @@
+from register import Register
+
+METHODS = ("shift_add", "booth", "karatsuba")
+# Операнды не длиннее машинного слова умножаются «аппаратно», как в базовом случае Карацубы
+KARATSUBA_THRESHOLD = 64
+
+
+def _shift_add(a, b, trace):
+    """Умножение сдвигами и сложениями: по одному частичному произведению на единичный бит |b|"""
+    magnitude = abs(b)
+    partial = a if b >= 0 else -a
+    product = 0
+    while magnitude:
+        low_bit = magnitude & -magnitude
+        shift = low_bit.bit_length() - 1
+        product += partial << shift
+        if trace is not None:
+            trace.append((shift, partial))
+        magnitude ^= low_bit
+    return product
+
+
+def _booth(a, b, width, trace):
+    """Умножение с перекодировкой Бута по основанию 4 (цифры -2..2)"""
+    product = 0
+    previous = 0
+    for i in range(0, width, 2):
+        low = (b >> i) & 1
+        high = (b >> (i + 1)) & 1
+        digit = -2 * high + low + previous
+        previous = high
+        if digit:
+            partial = digit * a
+            product += partial << i
+            if trace is not None:
+                trace.append((i, partial))
+    return product
+
+
+def _karatsuba_parts(x, y):
+    """Возвращает произведения верхнего уровня рекурсии Карацубы в виде (сдвиг, значение)"""
+    if x.bit_length() <= KARATSUBA_THRESHOLD or y.bit_length() <= KARATSUBA_THRESHOLD:
+        return [(0, x * y)]
+    half = max(x.bit_length(), y.bit_length()) // 2
+    mask = (1 << half) - 1
+    x_high, x_low = x >> half, x & mask
+    y_high, y_low = y >> half, y & mask
+    z2 = _karatsuba_magnitude(x_high, y_high)
+    z0 = _karatsuba_magnitude(x_low, y_low)
+    z1 = _karatsuba_magnitude(x_high + x_low, y_high + y_low) - z2 - z0
+    return [(2 * half, z2), (half, z1), (0, z0)]
+
+
+def _karatsuba_magnitude(x, y):
+    return sum(value << shift for shift, value in _karatsuba_parts(x, y))
+
+
+def _karatsuba(a, b, trace):
+    """Умножение Карацубы над модулями операндов с последующей коррекцией знака"""
+    sign = -1 if (a < 0) != (b < 0) else 1
+    parts = _karatsuba_parts(abs(a), abs(b))
+    if trace is not None:
+        trace.extend((shift, sign * value) for shift, value in parts if value)
+    return sign * sum(value << shift for shift, value in parts)
+
+
+def multiply(a, b, width=8, method="shift_add", trace=False):
+    """
+    Умножает два знаковых числа разрядности width и возвращает полное
+    произведение в регистре двойной разрядности.
+    При trace=True дополнительно возвращается список частичных произведений
+    (сдвиг, значение), сумма которых со сдвигами равна произведению.
+    """
+    a = Register(a, width).value
+    b = Register(b, width).value
+    partials = [] if trace else None
+    if method == "shift_add":
+        product = _shift_add(a, b, partials)
+    elif method == "booth":
+        product = _booth(a, b, width, partials)
+    elif method == "karatsuba":
+        product = _karatsuba(a, b, partials)
+    else:
+        raise ValueError(f"Неизвестный метод умножения: {method}")
+    result = Register(product, 2 * width)
+    if trace:
+        return result, partials
+    return result
+
+
+def multiply_batch(a_values, b_values, width=8, method="shift_add"):
+    """Попарно умножает две последовательности операндов"""
+    return [multiply(a, b, width, method) for a, b in zip(a_values, b_values)]
@@ -0,0 +1,53 @@
+from register import Register
+
+
+class OperationResult:
+    """
+    Результат операции lr1 с необязательной трассой промежуточных значений.
+    Трасса хранит исходные объекты (регистры, числа) и превращается в текст
+    только при выводе.
+    """
+    __slots__ = ("value", "overflow", "trace")
+
+    def __init__(self, value, overflow=False, trace=None):
+        self.value = value
+        self.overflow = overflow
+        self.trace = trace
+
+    def add(self, label, value, spec=None):
+        """Добавляет запись в трассу, если трасса собирается"""
+        if self.trace is not None:
+            self.trace.append((label, value, spec))
+
+    def render(self):
+        lines = []
+        for label, value, spec in self.trace or ():
+            if isinstance(value, Register):
+                lines.extend(_render_register(label, value))
+            elif spec is not None:
+                lines.append(f"{label}: {format(value, spec)}")
+            else:
+                lines.append(f"{label}: {value}")
+        if self.overflow:
+            lines.append("Переполнение!")
+        lines.append(f"Результат: {self.value}")
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.render()
+
+    def __repr__(self):
+        return f"OperationResult({self.value!r}, overflow={self.overflow})"
+
+
+def _render_register(label, register):
+    try:
+        direct_code = register.direct_code()
+    except ValueError:
+        direct_code = "не представимо"
+    return [
+        f"{label}: {register.value}",
+        f"  прямой код: {direct_code}",
+        f"  обратный код: {register.reverse_code()}",
+        f"  дополнительный код: {register.additional_code()}",
+    ]
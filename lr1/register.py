@@ -0,0 +1,126 @@
+class Register:
+    """
+    Регистр фиксированной разрядности в дополнительном коде.
+    Значение хранится как обычное целое число (битовый образ регистра),
+    а прямой, обратный и дополнительный коды строятся по запросу.
+    """
+    __slots__ = ("width", "bits")
+
+    def __init__(self, value=0, width=8):
+        if width < 1:
+            raise ValueError("Разрядность регистра должна быть положительной")
+        limit = 1 << (width - 1)
+        if value < -limit or value >= limit:
+            raise ValueError(f"Число {value} не помещается в {width}-битный регистр")
+        self.width = width
+        self.bits = value & ((1 << width) - 1)
+
+    @classmethod
+    def from_bits(cls, bits, width=8):
+        """Создаёт регистр из битового образа (беззнакового целого)"""
+        register = cls.__new__(cls)
+        register.width = width
+        register.bits = bits & ((1 << width) - 1)
+        return register
+
+    @classmethod
+    def from_direct_code(cls, code):
+        """Создаёт регистр из строки прямого кода (знак + модуль)"""
+        magnitude = int(code[1:], 2) if len(code) > 1 else 0
+        return cls(-magnitude if code[0] == '1' else magnitude, len(code))
+
+    @classmethod
+    def from_reverse_code(cls, code):
+        """Создаёт регистр из строки обратного кода"""
+        bits = int(code, 2)
+        if code[0] == '1':
+            bits += 1
+        return cls.from_bits(bits, len(code))
+
+    @classmethod
+    def from_additional_code(cls, code):
+        """Создаёт регистр из строки дополнительного кода"""
+        return cls.from_bits(int(code, 2), len(code))
+
+    @property
+    def mask(self):
+        return (1 << self.width) - 1
+
+    @property
+    def value(self):
+        """Знаковое значение регистра"""
+        if self.bits >> (self.width - 1):
+            return self.bits - (1 << self.width)
+        return self.bits
+
+    def direct(self):
+        """Прямой код в виде целого числа"""
+        value = self.value
+        if value == -(1 << (self.width - 1)):
+            raise ValueError(f"Число {value} не имеет прямого кода в {self.width} битах")
+        if value < 0:
+            return (1 << (self.width - 1)) | -value
+        return value
+
+    def reverse(self):
+        """Обратный код в виде целого числа"""
+        if self.bits >> (self.width - 1):
+            return (self.bits - 1) & self.mask
+        return self.bits
+
+    def additional(self):
+        """Дополнительный код в виде целого числа"""
+        return self.bits
+
+    def direct_code(self):
+        return format(self.direct(), f"0{self.width}b")
+
+    def reverse_code(self):
+        return format(self.reverse(), f"0{self.width}b")
+
+    def additional_code(self):
+        return format(self.bits, f"0{self.width}b")
+
+    def _check_width(self, other):
+        if other.width != self.width:
+            raise ValueError("Разрядности регистров должны совпадать")
+
+    def add(self, other):
+        """Сложение в дополнительном коде. Возвращает (регистр, флаг переполнения)"""
+        self._check_width(other)
+        bits = (self.bits + other.bits) & self.mask
+        sign = 1 << (self.width - 1)
+        overflow = bool((self.bits ^ bits) & (other.bits ^ bits) & sign)
+        return Register.from_bits(bits, self.width), overflow
+
+    def subtract(self, other):
+        """Вычитание в дополнительном коде. Возвращает (регистр, флаг переполнения)"""
+        self._check_width(other)
+        bits = (self.bits - other.bits) & self.mask
+        sign = 1 << (self.width - 1)
+        overflow = bool((self.bits ^ other.bits) & (self.bits ^ bits) & sign)
+        return Register.from_bits(bits, self.width), overflow
+
+    def multiply(self, other):
+        """
+        Умножение с усечением до разрядности регистра.
+        Возвращает (регистр, флаг переполнения).
+        """
+        self._check_width(other)
+        product = self.value * other.value
+        result = Register.from_bits(product, self.width)
+        return result, result.value != product
+
+    def __int__(self):
+        return self.value
+
+    def __eq__(self, other):
+        if not isinstance(other, Register):
+            return NotImplemented
+        return self.width == other.width and self.bits == other.bits
+
+    def __hash__(self):
+        return hash((self.width, self.bits))
+
+    def __repr__(self):
+        return f"Register({self.value}, width={self.width})"
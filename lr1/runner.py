@@ -0,0 +1,137 @@
+import argparse
+import csv
+import json
+import struct
+import sys
+import time
+from functools import partial
+from multiprocessing import Pool
+
+from functions import (BACKENDS, addition_result, binary_data, division_result, float_addition_result,
+                       multiplication_result, subtraction_result)
+
+OPERATIONS = {
+    'convert': lambda operands, width, backend: binary_data(operands[0], width),
+    'add': lambda operands, width, backend: addition_result(operands[0], operands[1], width, backend=backend),
+    'sub': lambda operands, width, backend: subtraction_result(operands[0], operands[1], width, backend=backend),
+    'mul': lambda operands, width, backend: multiplication_result(operands[0], operands[1], width,
+                                                                  backend=backend),
+    'div': lambda operands, width, backend: division_result(operands[0], operands[1], width, backend=backend),
+    'float_add': lambda operands, width, backend: float_addition_result(operands[0], operands[1]),
+}
+FORMATS = ("jsonl", "csv")
+
+
+def _parse_operand(op, text):
+    return float(text) if op == 'float_add' else int(text)
+
+
+def read_operations(stream, fmt="jsonl"):
+    """
+    Лениво читает операции из потока.
+    JSONL: {"op": "add", "operands": [5, 3], "width": 8} в каждой строке.
+    CSV: заголовок op,a,b,width; пустой b для унарных операций, width необязателен.
+    Вместо строки, которую не удалось разобрать, выдаётся {'error': ..., 'line': номер строки}.
+    """
+    if fmt == "jsonl":
+        for number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as error:
+                yield {'error': f"Некорректный JSON: {error}", 'line': number}
+                continue
+            if not isinstance(record, dict):
+                yield {'error': "Ожидался объект JSON", 'line': number}
+                continue
+            yield record
+    elif fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            try:
+                op = row['op']
+                operands = [_parse_operand(op, row[key]) for key in ('a', 'b') if row.get(key)]
+                yield {'op': op, 'operands': operands, 'width': int(row.get('width') or 8)}
+            except (KeyError, ValueError, TypeError) as error:
+                yield {'error': f"Некорректная строка CSV: {error}", 'line': reader.line_num}
+    else:
+        raise ValueError(f"Неизвестный формат: {fmt}")
+
+
+def evaluate_record(record, backend="algorithmic"):
+    """
+    Выполняет одну операцию и возвращает словарь, пригодный для записи в JSON.
+    Поле 'backend' записи, если есть, заменяет backend (см. functions.BACKENDS).
+    """
+    if not isinstance(record, dict):
+        return {'error': "Ожидался словарь с операцией"}
+    if 'error' in record:
+        # Ошибка разбора из read_operations передаётся как есть
+        return record
+    op = record.get('op')
+    operands = record.get('operands', [])
+    width = record.get('width', 8)
+    response = {'op': op, 'operands': operands, 'width': width}
+    if op not in OPERATIONS:
+        response['error'] = f"Неизвестная операция: {op}"
+        return response
+    try:
+        result = OPERATIONS[op](operands, width, record.get('backend', backend))
+    except (ValueError, IndexError, TypeError, ZeroDivisionError, struct.error, OverflowError,
+            AttributeError) as error:
+        response['error'] = str(error)
+        return response
+    response['value'] = result.value
+    response['overflow'] = result.overflow
+    return response
+
+
+def run_batch(records, output, workers=1, chunk_size=256, backend="algorithmic"):
+    """
+    Вычисляет операции пулом процессов и по мере готовности пишет результаты в output
+    (по строке JSON на операцию, в исходном порядке). Возвращает (число операций, время в секундах).
+    """
+    start = time.perf_counter()
+    count = 0
+    evaluate = partial(evaluate_record, backend=backend)
+    if workers > 1:
+        with Pool(workers) as pool:
+            for response in pool.imap(evaluate, records, chunksize=chunk_size):
+                output.write(json.dumps(response, ensure_ascii=False) + "\n")
+                count += 1
+    else:
+        for response in map(evaluate, records):
+            output.write(json.dumps(response, ensure_ascii=False) + "\n")
+            count += 1
+    output.flush()
+    return count, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетное выполнение операций lr1")
+    parser.add_argument("--batch", required=True, help="файл с операциями или '-' для stdin")
+    parser.add_argument("--format", choices=FORMATS, default="jsonl")
+    parser.add_argument("--output", default="-", help="файл для результатов или '-' для stdout")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--backend", choices=BACKENDS, default="algorithmic",
+                        help="tables — готовые таблицы для 8-битных операций")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.batch == "-" else open(args.batch, encoding="utf-8", newline="")
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        count, elapsed = run_batch(read_operations(source, args.format), output,
+                                   args.workers, args.chunk_size, args.backend)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    rate = count / elapsed if elapsed else float('inf')
+    print(f"Выполнено операций: {count} за {elapsed:.3f} с ({rate:.0f} оп/с)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+import math
+import struct
+from collections import namedtuple
+
+FloatFormat = namedtuple("FloatFormat", ["name", "exponent_bits", "mantissa_bits", "struct_code"])
+
+BINARY16 = FloatFormat("binary16", 5, 10, "e")
+BINARY32 = FloatFormat("binary32", 8, 23, "f")
+BINARY64 = FloatFormat("binary64", 11, 52, "d")
+
+ROUNDING_MODES = ("nearest_even", "toward_zero", "up", "down")
+
+
+def _bias(fmt):
+    return (1 << (fmt.exponent_bits - 1)) - 1
+
+
+def _max_exponent(fmt):
+    return (1 << fmt.exponent_bits) - 1
+
+
+def _sign_bit(fmt):
+    return 1 << (fmt.exponent_bits + fmt.mantissa_bits)
+
+
+def _pack(sign, exponent, mantissa, fmt):
+    return (sign << (fmt.exponent_bits + fmt.mantissa_bits)) | (exponent << fmt.mantissa_bits) | mantissa
+
+
+def _unpack(bits, fmt):
+    """Разбивает битовый образ на (знак, смещённый порядок, мантисса)"""
+    mantissa = bits & ((1 << fmt.mantissa_bits) - 1)
+    exponent = (bits >> fmt.mantissa_bits) & _max_exponent(fmt)
+    sign = bits >> (fmt.exponent_bits + fmt.mantissa_bits) & 1
+    return sign, exponent, mantissa
+
+
+def _significand(exponent, mantissa, fmt):
+    """Конечное число в виде (целая мантисса, порядок младшего бита)"""
+    if exponent == 0:
+        return mantissa, 1 - _bias(fmt) - fmt.mantissa_bits
+    return mantissa | (1 << fmt.mantissa_bits), exponent - _bias(fmt) - fmt.mantissa_bits
+
+
+def _infinity(sign, fmt):
+    return _pack(sign, _max_exponent(fmt), 0, fmt)
+
+
+def _quiet_nan(fmt, bits=None):
+    """Тихий NaN: либо канонический, либо входной с установленным старшим битом мантиссы"""
+    quiet = 1 << (fmt.mantissa_bits - 1)
+    if bits is None:
+        return _pack(0, _max_exponent(fmt), quiet, fmt)
+    return bits | quiet
+
+
+def _is_nan(exponent, mantissa, fmt):
+    return exponent == _max_exponent(fmt) and mantissa != 0
+
+
+def _is_infinity(exponent, mantissa, fmt):
+    return exponent == _max_exponent(fmt) and mantissa == 0
+
+
+def _check_rounding(rounding):
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Неизвестный режим округления: {rounding}")
+
+
+def _overflow(sign, fmt, rounding):
+    to_infinity = (rounding == "nearest_even"
+                   or (rounding == "up" and sign == 0)
+                   or (rounding == "down" and sign == 1))
+    if to_infinity:
+        return _infinity(sign, fmt)
+    return _pack(sign, _max_exponent(fmt) - 1, (1 << fmt.mantissa_bits) - 1, fmt)
+
+
+def _round_pack(sign, significand, exponent, fmt, rounding, sticky=False):
+    """
+    Округляет точное значение (-1) ** sign * significand * 2 ** exponent до формата fmt.
+    sticky отмечает ненулевой хвост ниже младшего бита significand; в этом случае
+    significand должен содержать хотя бы mantissa_bits + 3 бит.
+    """
+    if sticky:
+        significand = (significand << 1) | 1
+        exponent -= 1
+    if significand == 0:
+        return _pack(sign, 0, 0, fmt)
+    precision = fmt.mantissa_bits + 1
+    min_exponent = 1 - _bias(fmt)
+    top = exponent + significand.bit_length() - 1
+    quantum = max(top, min_exponent) - fmt.mantissa_bits
+    shift = quantum - exponent
+    if shift > 0:
+        kept = significand >> shift
+        rest = significand & ((1 << shift) - 1)
+        half = 1 << (shift - 1)
+        if rounding == "nearest_even":
+            increment = rest > half or (rest == half and kept & 1)
+        elif rounding == "up":
+            increment = rest != 0 and sign == 0
+        elif rounding == "down":
+            increment = rest != 0 and sign == 1
+        else:
+            increment = False
+        kept += increment
+    else:
+        kept = significand << -shift
+    if kept >> precision:
+        kept >>= 1
+        quantum += 1
+    if kept >> fmt.mantissa_bits == 0:
+        return _pack(sign, 0, kept, fmt)
+    biased = quantum + fmt.mantissa_bits + _bias(fmt)
+    if biased >= _max_exponent(fmt):
+        return _overflow(sign, fmt, rounding)
+    return _pack(sign, biased, kept & ((1 << fmt.mantissa_bits) - 1), fmt)
+
+
+def to_bits(value, fmt=BINARY32, rounding="nearest_even"):
+    """Битовый образ числа Python в формате fmt"""
+    bits = int.from_bytes(memoryview(struct.pack("<d", value)), "little")
+    if fmt == BINARY64:
+        return bits
+    return convert(bits, BINARY64, fmt, rounding)
+
+
+def from_bits(bits, fmt=BINARY32):
+    """Число Python по битовому образу формата fmt"""
+    size = (1 + fmt.exponent_bits + fmt.mantissa_bits) // 8
+    return struct.unpack("<" + fmt.struct_code, bits.to_bytes(size, "little"))[0]
+
+
+def convert(bits, source, target, rounding="nearest_even"):
+    """Переводит битовый образ из одного формата в другой с округлением"""
+    _check_rounding(rounding)
+    sign, exponent, mantissa = _unpack(bits, source)
+    if _is_nan(exponent, mantissa, source):
+        return _quiet_nan(target)
+    if _is_infinity(exponent, mantissa, source):
+        return _infinity(sign, target)
+    significand, power = _significand(exponent, mantissa, source)
+    return _round_pack(sign, significand, power, target, rounding)
+
+
+def float_add(a, b, fmt=BINARY32, rounding="nearest_even"):
+    """Сложение битовых образов a и b"""
+    _check_rounding(rounding)
+    sign_a, exponent_a, mantissa_a = _unpack(a, fmt)
+    sign_b, exponent_b, mantissa_b = _unpack(b, fmt)
+    if _is_nan(exponent_a, mantissa_a, fmt):
+        return _quiet_nan(fmt, a)
+    if _is_nan(exponent_b, mantissa_b, fmt):
+        return _quiet_nan(fmt, b)
+    if _is_infinity(exponent_a, mantissa_a, fmt):
+        if _is_infinity(exponent_b, mantissa_b, fmt) and sign_a != sign_b:
+            return _quiet_nan(fmt)
+        return a
+    if _is_infinity(exponent_b, mantissa_b, fmt):
+        return b
+    significand_a, power_a = _significand(exponent_a, mantissa_a, fmt)
+    significand_b, power_b = _significand(exponent_b, mantissa_b, fmt)
+    power = min(power_a, power_b)
+    value_a = significand_a << (power_a - power)
+    value_b = significand_b << (power_b - power)
+    total = (-value_a if sign_a else value_a) + (-value_b if sign_b else value_b)
+    if total == 0:
+        # Точный ноль: знак сохраняется у одинаковых слагаемых, иначе +0 (-0 при округлении вниз)
+        sign = sign_a if sign_a == sign_b else int(rounding == "down")
+        return _pack(sign, 0, 0, fmt)
+    return _round_pack(int(total < 0), abs(total), power, fmt, rounding)
+
+
+def float_sub(a, b, fmt=BINARY32, rounding="nearest_even"):
+    """Вычитание битовых образов: a + (-b)"""
+    sign, exponent, mantissa = _unpack(b, fmt)
+    if _is_nan(exponent, mantissa, fmt):
+        return float_add(a, b, fmt, rounding)
+    return float_add(a, b ^ _sign_bit(fmt), fmt, rounding)
+
+
+def float_mul(a, b, fmt=BINARY32, rounding="nearest_even"):
+    """Умножение битовых образов a и b"""
+    _check_rounding(rounding)
+    sign_a, exponent_a, mantissa_a = _unpack(a, fmt)
+    sign_b, exponent_b, mantissa_b = _unpack(b, fmt)
+    sign = sign_a ^ sign_b
+    if _is_nan(exponent_a, mantissa_a, fmt):
+        return _quiet_nan(fmt, a)
+    if _is_nan(exponent_b, mantissa_b, fmt):
+        return _quiet_nan(fmt, b)
+    zero_a = exponent_a == 0 and mantissa_a == 0
+    zero_b = exponent_b == 0 and mantissa_b == 0
+    if _is_infinity(exponent_a, mantissa_a, fmt) or _is_infinity(exponent_b, mantissa_b, fmt):
+        if zero_a or zero_b:
+            return _quiet_nan(fmt)
+        return _infinity(sign, fmt)
+    significand_a, power_a = _significand(exponent_a, mantissa_a, fmt)
+    significand_b, power_b = _significand(exponent_b, mantissa_b, fmt)
+    return _round_pack(sign, significand_a * significand_b, power_a + power_b, fmt, rounding)
+
+
+def float_div(a, b, fmt=BINARY32, rounding="nearest_even"):
+    """Деление битовых образов a / b"""
+    _check_rounding(rounding)
+    sign_a, exponent_a, mantissa_a = _unpack(a, fmt)
+    sign_b, exponent_b, mantissa_b = _unpack(b, fmt)
+    sign = sign_a ^ sign_b
+    if _is_nan(exponent_a, mantissa_a, fmt):
+        return _quiet_nan(fmt, a)
+    if _is_nan(exponent_b, mantissa_b, fmt):
+        return _quiet_nan(fmt, b)
+    infinite_a = _is_infinity(exponent_a, mantissa_a, fmt)
+    infinite_b = _is_infinity(exponent_b, mantissa_b, fmt)
+    zero_a = exponent_a == 0 and mantissa_a == 0
+    zero_b = exponent_b == 0 and mantissa_b == 0
+    if (infinite_a and infinite_b) or (zero_a and zero_b):
+        return _quiet_nan(fmt)
+    if infinite_a or zero_b:
+        return _infinity(sign, fmt)
+    if infinite_b or zero_a:
+        return _pack(sign, 0, 0, fmt)
+    significand_a, power_a = _significand(exponent_a, mantissa_a, fmt)
+    significand_b, power_b = _significand(exponent_b, mantissa_b, fmt)
+    # Частное должно содержать не меньше mantissa_bits + 3 бит для корректного округления
+    shift = max(0, fmt.mantissa_bits + 4 + significand_b.bit_length() - significand_a.bit_length())
+    quotient, remainder = divmod(significand_a << shift, significand_b)
+    return _round_pack(sign, quotient, power_a - power_b - shift, fmt, rounding, remainder != 0)
+
+
+def float_sqrt(a, fmt=BINARY32, rounding="nearest_even"):
+    """Квадратный корень битового образа a"""
+    _check_rounding(rounding)
+    sign, exponent, mantissa = _unpack(a, fmt)
+    if _is_nan(exponent, mantissa, fmt):
+        return _quiet_nan(fmt, a)
+    if exponent == 0 and mantissa == 0:
+        return a
+    if sign:
+        return _quiet_nan(fmt)
+    if _is_infinity(exponent, mantissa, fmt):
+        return a
+    significand, power = _significand(exponent, mantissa, fmt)
+    shift = max(0, 2 * (fmt.mantissa_bits + 4) - significand.bit_length())
+    if (power - shift) % 2:
+        shift += 1
+    scaled = significand << shift
+    root = math.isqrt(scaled)
+    return _round_pack(0, root, (power - shift) // 2, fmt, rounding, root * root != scaled)
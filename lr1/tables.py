@@ -0,0 +1,99 @@
+from array import array
+
+from divider import DivisionResult, divide as divide_algorithmic
+from multiplier import multiply as multiply_algorithmic
+from register import Register
+
+# Табличный режим покрывает 8-битный знаковый диапазон прямого кода: -127..127
+TABLE_WIDTH = 8
+TABLE_PRECISION = 5
+LIMIT = (1 << (TABLE_WIDTH - 1)) - 1
+SIZE = 2 * LIMIT + 1
+
+_values = range(-LIMIT, LIMIT + 1)
+
+_DIRECT = bytes(Register(x, TABLE_WIDTH).direct() for x in _values)
+_REVERSE = bytes(Register(x, TABLE_WIDTH).reverse() for x in _values)
+_ADDITIONAL = bytes(Register(x, TABLE_WIDTH).additional() for x in _values)
+
+
+def _wrap(value):
+    return ((value + 128) & 0xFF) - 128
+
+
+_sums = [a + b for a in _values for b in _values]
+_SUM = array('b', map(_wrap, _sums))
+_SUM_OVERFLOW = bytes(_wrap(s) != s for s in _sums)
+_differences = [a - b for a in _values for b in _values]
+_DIFFERENCE = array('b', map(_wrap, _differences))
+_DIFFERENCE_OVERFLOW = bytes(_wrap(d) != d for d in _differences)
+_PRODUCT = array('h', (a * b for a in _values for b in _values))
+# Частное хранится как модуль, умноженный на 2 ** TABLE_PRECISION; для делителя 0 — заглушка 0
+_QUOTIENT = array('h', ((abs(a) << TABLE_PRECISION) // abs(b) if b else 0
+                        for a in _values for b in _values))
+del _sums, _differences
+
+
+def _in_table(width, *operands):
+    return width == TABLE_WIDTH and all(-LIMIT <= x <= LIMIT for x in operands)
+
+
+def _index(a, b):
+    return (a + LIMIT) * SIZE + b + LIMIT
+
+
+def direct(x, width=8):
+    """Прямой код числа в виде целого"""
+    if _in_table(width, x):
+        return _DIRECT[x + LIMIT]
+    return Register(x, width).direct()
+
+
+def reverse(x, width=8):
+    """Обратный код числа в виде целого"""
+    if _in_table(width, x):
+        return _REVERSE[x + LIMIT]
+    return Register(x, width).reverse()
+
+
+def additional(x, width=8):
+    """Дополнительный код числа в виде целого"""
+    if _in_table(width, x):
+        return _ADDITIONAL[x + LIMIT]
+    return Register(x, width).additional()
+
+
+def add(a, b, width=8):
+    """Сложение в дополнительном коде. Возвращает (результат, флаг переполнения)"""
+    if _in_table(width, a, b):
+        i = _index(a, b)
+        return _SUM[i], bool(_SUM_OVERFLOW[i])
+    result, overflow = Register(a, width).add(Register(b, width))
+    return result.value, overflow
+
+
+def subtract(a, b, width=8):
+    """Вычитание в дополнительном коде. Возвращает (результат, флаг переполнения)"""
+    if _in_table(width, a, b):
+        i = _index(a, b)
+        return _DIFFERENCE[i], bool(_DIFFERENCE_OVERFLOW[i])
+    result, overflow = Register(a, width).subtract(Register(b, width))
+    return result.value, overflow
+
+
+def multiply(a, b, width=8):
+    """Полное произведение двух чисел"""
+    if _in_table(width, a, b):
+        return _PRODUCT[_index(a, b)]
+    return multiply_algorithmic(a, b, width).value
+
+
+def divide(a, b, width=8, precision=TABLE_PRECISION):
+    """Деление с фиксированной точкой, результат — DivisionResult"""
+    if precision != TABLE_PRECISION or not _in_table(width, a, b):
+        return divide_algorithmic(a, b, width, precision)
+    if b == 0:
+        raise ZeroDivisionError("Деление на ноль")
+    quotient = _QUOTIENT[_index(a, b)]
+    remainder = (abs(a) << precision) - quotient * abs(b)
+    return DivisionResult(quotient, remainder, (a < 0) != (b < 0), precision, width)
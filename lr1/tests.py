@@ -1,10 +1,33 @@
+import json
 import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+import numpy as np
+
+import tables
+from batch import (batch_addition, batch_division, batch_fixed_point_operation, batch_float_operation,
+                   batch_multiplication, batch_subtraction, bit_matrix_to_floats, dequantize,
+                   floats_to_bit_matrix, quantize, to_bit_matrix)
+from benchmark import OPERATIONS as BENCHMARK_OPERATIONS, run_benchmark
+from bigbinary import add_bits, format_bits, parse_bits, signed_value, subtract_bits
+from divider import METHODS as DIVISION_METHODS, divide, divide_batch
+from fixed_point import FixedPoint, QFormat
 from functions import *
+from multiplier import METHODS, multiply, multiply_batch
+from register import Register
+from runner import evaluate_record, read_operations, run_batch
+from softfloat import (BINARY16, BINARY32, BINARY64, float_add, float_div, float_mul, float_sqrt, float_sub,
+                       from_bits, to_bits)
 class TestBinaryOperations(unittest.TestCase):
     def test_convert_number_to_binary_code(self):
         # Проверяем корректное преобразование чисел
         self.assertEqual(convert_number_to_binary_code(5), "00000101")
         self.assertEqual(convert_number_to_binary_code(-5), "10000101")
+        with self.assertRaises(ValueError):
+            convert_number_to_binary_code(128)
+        with self.assertRaises(ValueError):
+            convert_number_to_binary_code(-128)
 
     def test_get_revers_code(self):
         # Проверяем обратный код
@@ -59,5 +82,423 @@ class TestBinaryOperations(unittest.TestCase):
         if hasattr(addition_float, "__call__"):
             self.assertAlmostEqual(addition_float(1.5, 2.75), 4.25)
 
+class TestRegister(unittest.TestCase):
+    def test_codes(self):
+        register = Register(-5, 8)
+        self.assertEqual(register.direct_code(), "10000101")
+        self.assertEqual(register.reverse_code(), "11111010")
+        self.assertEqual(register.additional_code(), "11111011")
+        self.assertEqual(Register(5, 16).additional_code(), "0000000000000101")
+
+    def test_from_codes(self):
+        self.assertEqual(Register.from_direct_code("10000101").value, -5)
+        self.assertEqual(Register.from_reverse_code("11111010").value, -5)
+        self.assertEqual(Register.from_additional_code("11111011").value, -5)
+
+    def test_range(self):
+        self.assertEqual(Register(-128, 8).value, -128)
+        with self.assertRaises(ValueError):
+            Register(128, 8)
+        with self.assertRaises(ValueError):
+            Register(-128, 8).direct_code()
+
+    def test_add_overflow(self):
+        result, overflow = Register(100).add(Register(100))
+        self.assertEqual(result.value, -56)
+        self.assertTrue(overflow)
+        result, overflow = Register(-100).add(Register(50))
+        self.assertEqual(result.value, -50)
+        self.assertFalse(overflow)
+
+    def test_subtract_overflow(self):
+        result, overflow = Register(-128).subtract(Register(1))
+        self.assertEqual(result.value, 127)
+        self.assertTrue(overflow)
+        result, overflow = Register(2 ** 62, 64).subtract(Register(-2 ** 62, 64))
+        self.assertTrue(overflow)
+
+    def test_multiply_overflow(self):
+        result, overflow = Register(-12).multiply(Register(10))
+        self.assertEqual(result.value, -120)
+        self.assertFalse(overflow)
+        result, overflow = Register(20).multiply(Register(20))
+        self.assertTrue(overflow)
+
+    def test_width_mismatch(self):
+        with self.assertRaises(ValueError):
+            Register(1, 8).add(Register(1, 16))
+
+class TestBatchArithmetic(unittest.TestCase):
+    def test_batch_addition_matches_register(self):
+        grid = np.arange(-128, 128)
+        a, b = (x.ravel() for x in np.meshgrid(grid, grid))
+        batch = batch_addition(a, b, 8)
+        for i in range(0, len(a), 251):
+            expected, overflow = Register(int(a[i])).add(Register(int(b[i])))
+            self.assertEqual(batch['result'][i], expected.value)
+            self.assertEqual(batch['overflow'][i], overflow)
+            self.assertEqual("".join(map(str, batch['bits'][i])), expected.additional_code())
+
+    def test_batch_subtraction(self):
+        batch = batch_subtraction(np.array([10, -128, 2 ** 63 - 1]), np.array([3, 1, -1]), 64)
+        self.assertEqual(batch['result'].tolist(), [7, -129, -2 ** 63])
+        self.assertEqual(batch['overflow'].tolist(), [False, False, True])
+        batch = batch_subtraction(np.array([-128]), np.array([1]), 8)
+        self.assertEqual(batch['result'].tolist(), [127])
+        self.assertTrue(batch['overflow'][0])
+
+    def test_to_bit_matrix(self):
+        matrix = to_bit_matrix(np.array([5, -5]), 8)
+        self.assertEqual(matrix.dtype, np.uint8)
+        self.assertEqual(matrix.shape, (2, 8))
+        self.assertEqual(matrix[1].tolist(), [1, 1, 1, 1, 1, 0, 1, 1])
+        with self.assertRaises(ValueError):
+            to_bit_matrix(np.array([128]), 8)
+
+class TestMultiplier(unittest.TestCase):
+    def test_methods_agree(self):
+        operands = [(0, 0), (5, 3), (-5, 3), (-128, -128), (127, -128), (-1, 1)]
+        for method in METHODS:
+            for a, b in operands:
+                product = multiply(a, b, 8, method)
+                self.assertEqual(product.value, a * b)
+                self.assertEqual(product.width, 16)
+
+    def test_wide_operands(self):
+        a, b = 3 ** 400 - 7, -(5 ** 300)
+        for method in METHODS:
+            self.assertEqual(multiply(a, b, 1024, method).value, a * b)
+
+    def test_trace(self):
+        for method in METHODS:
+            product, partials = multiply(-93, 117, 8, method, trace=True)
+            self.assertEqual(sum(value << shift for shift, value in partials), product.value)
+        _, partials = multiply(5, 3, 8, "shift_add", trace=True)
+        self.assertEqual(partials, [(0, 5), (1, 5)])
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            multiply(1, 1, 8, "wallace")
+
+    def test_batch(self):
+        self.assertEqual([r.value for r in multiply_batch([2, -3], [4, 5], 8, "booth")], [8, -15])
+        batch = batch_multiplication(np.array([-128, 7]), np.array([-128, -3]), 8)
+        self.assertEqual(batch['result'].tolist(), [16384, -21])
+        self.assertEqual(batch['bits'].shape, (2, 16))
+
+    def test_binary_multiplication_overflow(self):
+        with self.assertRaises(ValueError):
+            binary_multiplication(20, 20)
+
+class TestDivider(unittest.TestCase):
+    def test_methods_agree(self):
+        for method in DIVISION_METHODS:
+            for dividend in range(-128, 128, 7):
+                for divisor in (-128, -7, -1, 1, 3, 5, 127):
+                    result = divide(dividend, divisor, 8, 5, method)
+                    expected = (abs(dividend) << 5) // abs(divisor)
+                    self.assertEqual(result.quotient, expected)
+                    self.assertEqual(result.remainder, (abs(dividend) << 5) % abs(divisor))
+
+    def test_result(self):
+        result = divide(-10, 3, 8, 5, "srt")
+        self.assertEqual(result.to_string(), "10000011.01010")
+        self.assertEqual(result.to_decimal(), -3.3125)
+        self.assertEqual(divide(1, 3, 32, 20, "non_restoring").to_decimal(), 349525 / 2 ** 20)
+
+    def test_errors(self):
+        with self.assertRaises(ZeroDivisionError):
+            divide(1, 0)
+        with self.assertRaises(ValueError):
+            divide(-128, 1).to_string()
+
+    def test_batch(self):
+        results = divide_batch([10, -10], [3, 3], 8, 5, "srt")
+        self.assertEqual([r.to_decimal() for r in results], [3.3125, -3.3125])
+        batch = batch_division(np.array([10, -10, 7]), np.array([3, 3, -2]), 8, 5)
+        self.assertEqual(batch['quotient'].tolist(), [3.3125, -3.3125, -3.5])
+        self.assertEqual(batch['raw'].tolist(), [106, -106, -112])
+        with self.assertRaises(ZeroDivisionError):
+            batch_division(np.array([1]), np.array([0]))
+
+class TestSoftFloat(unittest.TestCase):
+    def test_round_trip(self):
+        for fmt in (BINARY16, BINARY32, BINARY64):
+            self.assertEqual(from_bits(to_bits(1.5, fmt), fmt), 1.5)
+        self.assertEqual(to_bits(-2.0), 0xC0000000)
+        self.assertEqual(to_bits(1e300), 0x7F800000)
+        self.assertEqual(to_bits(1e300, BINARY32, "toward_zero"), 0x7F7FFFFF)
+
+    def test_arithmetic_matches_native(self):
+        a, b = to_bits(0.1, BINARY64), to_bits(0.2, BINARY64)
+        self.assertEqual(from_bits(float_add(a, b, BINARY64), BINARY64), 0.1 + 0.2)
+        self.assertEqual(from_bits(float_sub(a, b, BINARY64), BINARY64), 0.1 - 0.2)
+        self.assertEqual(from_bits(float_mul(a, b, BINARY64), BINARY64), 0.1 * 0.2)
+        self.assertEqual(from_bits(float_div(a, b, BINARY64), BINARY64), 0.1 / 0.2)
+        self.assertEqual(from_bits(float_sqrt(b, BINARY64), BINARY64), 0.2 ** 0.5)
+
+    def test_rounding_modes(self):
+        one, three = to_bits(1.0), to_bits(3.0)
+        self.assertEqual(float_div(one, three, BINARY32, "toward_zero"), 0x3EAAAAAA)
+        self.assertEqual(float_div(one, three, BINARY32, "nearest_even"), 0x3EAAAAAB)
+        self.assertEqual(float_div(one, three, BINARY32, "up"), 0x3EAAAAAB)
+        self.assertEqual(float_div(one, three, BINARY32, "down"), 0x3EAAAAAA)
+        with self.assertRaises(ValueError):
+            float_add(one, three, BINARY32, "stochastic")
+
+    def test_special_values(self):
+        infinity, zero, negative_zero = 0x7F800000, 0, 0x80000000
+        self.assertEqual(float_add(infinity, infinity | 0x80000000) & 0x7FC00000, 0x7FC00000)
+        self.assertEqual(float_mul(infinity, zero) & 0x7FC00000, 0x7FC00000)
+        self.assertEqual(float_div(to_bits(1.0), negative_zero), 0xFF800000)
+        self.assertEqual(float_sqrt(negative_zero), negative_zero)
+        self.assertEqual(float_sub(to_bits(1.0), to_bits(1.0), BINARY32, "down"), negative_zero)
+        smallest = 1
+        self.assertEqual(float_add(smallest, smallest), 2)
+        self.assertEqual(float_mul(smallest, to_bits(0.5)), 0)
+        self.assertEqual(float_mul(smallest, to_bits(0.5), BINARY32, "up"), 1)
+
+    def test_batch(self):
+        a = np.array([1.0, 0.1, 65504.0], dtype=np.float16)
+        b = np.array([3.0, 0.2, 65504.0], dtype=np.float16)
+        native = batch_float_operation('add', a, b, BINARY16)
+        self.assertEqual(native.dtype, np.float16)
+        self.assertTrue(np.isinf(native[2]))
+        truncated = batch_float_operation('add', a, b, BINARY16, "toward_zero")
+        self.assertEqual(truncated[2], np.float16(65504.0))
+        quotient = batch_float_operation('div', a, b, BINARY16, "down")
+        self.assertEqual(quotient.view(np.uint16)[0], float_div(0x3C00, 0x4200, BINARY16, "down"))
+        roots = batch_float_operation('sqrt', np.array([4.0, 2.0]), fmt=BINARY64, rounding="down")
+        self.assertEqual(roots[0], 2.0)
+        self.assertLess(roots[1], 2.0 ** 0.5)
+
+class TestTables(unittest.TestCase):
+    def test_codes(self):
+        self.assertEqual(tables.direct(-5), 0b10000101)
+        self.assertEqual(tables.reverse(-5), 0b11111010)
+        self.assertEqual(tables.additional(-5), 0b11111011)
+
+    def test_matches_algorithmic_path(self):
+        for a in range(-127, 128, 9):
+            for b in range(-127, 128, 11):
+                expected, overflow = Register(a).add(Register(b))
+                self.assertEqual(tables.add(a, b), (expected.value, overflow))
+                expected, overflow = Register(a).subtract(Register(b))
+                self.assertEqual(tables.subtract(a, b), (expected.value, overflow))
+                self.assertEqual(tables.multiply(a, b), a * b)
+                if b:
+                    self.assertEqual(tables.divide(a, b).to_decimal(), divide(a, b).to_decimal())
+
+    def test_fallback(self):
+        self.assertEqual(tables.add(30000, 10000, 16), (-25536, True))
+        self.assertEqual(tables.multiply(-128, -128), 16384)
+        self.assertEqual(tables.divide(1, 3, 8, 10).to_decimal(), divide(1, 3, 8, 10).to_decimal())
+        with self.assertRaises(ZeroDivisionError):
+            tables.divide(5, 0)
+
+    def test_backend_switch(self):
+        for a, b, width in ((100, 100, 8), (-77, 13, 8), (-128, 127, 8), (3000, -700, 16)):
+            for operation in (addition_result, subtraction_result, multiplication_result, division_result):
+                expected = operation(a, b, width)
+                result = operation(a, b, width, backend="tables")
+                self.assertEqual((result.value, result.overflow), (expected.value, expected.overflow))
+        self.assertIsNotNone(multiplication_result(5, 3, trace=True, backend="tables").trace)
+        with self.assertRaises(ValueError):
+            addition_result(1, 2, backend="fpga")
+
+class TestBigBinary(unittest.TestCase):
+    def test_small_values(self):
+        self.assertEqual(add_bits("0111", "0001"), ("1000", 0))
+        self.assertEqual(add_bits("1111", "1"), ("0000", 1))
+        self.assertEqual(subtract_bits("00000101", "00000111"), "11111110")
+        self.assertEqual(signed_value("11111011"), -5)
+        self.assertEqual(signed_value("10000101", False), -5)
+        self.assertEqual(format_bits(5, 0), "")
+
+    def test_long_strings(self):
+        width = 50000
+        a = "1" * width
+        total, carry = add_bits(a, "1")
+        self.assertEqual(total, "0" * width)
+        self.assertEqual(carry, 1)
+        self.assertEqual(subtract_bits("0" * width, "1", width), a)
+        self.assertEqual(signed_value(a), -1)
+        self.assertEqual(binary_addition_binary_strings(a, "1"), "0" * width)
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            parse_bits("10_1")
+        with self.assertRaises(ValueError):
+            parse_bits(" 101")
+
+class TestOperationTrace(unittest.TestCase):
+    def test_silent_by_default(self):
+        output = StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(binary_addition(100, 100), -56)
+            result = addition_result(5, 3)
+        self.assertEqual(output.getvalue(), "")
+        self.assertIsNone(result.trace)
+        self.assertEqual(result.render(), "Результат: 8")
+
+    def test_trace(self):
+        result = addition_result(100, 100, trace=True)
+        self.assertTrue(result.overflow)
+        text = result.render()
+        self.assertIn("Переполнение!", text)
+        self.assertIn("дополнительный код: 11001000", text)
+        self.assertIn("Переносы: 01100100", text)
+
+    def test_binary_data(self):
+        text = str(binary_data(-5))
+        self.assertIn("прямой код: 10000101", text)
+        self.assertIn("обратный код: 11111010", text)
+        self.assertIn("прямой код: не представимо", str(binary_data(-128)))
+
+    def test_other_operations(self):
+        self.assertEqual(subtraction_result(-128, 1).value, 127)
+        self.assertEqual(multiplication_result(-5, 3, trace=True).value, -15)
+        self.assertIn("Частное: 00000011.01010", division_result(10, 3, trace=True).render())
+        self.assertEqual(float_addition_result(1.5, 2.75).value, 4.25)
+
+class TestFixedPoint(unittest.TestCase):
+    def test_string_round_trip(self):
+        for text in ("00000011.01010", "10000011.01010", "0110", "1.101"):
+            self.assertEqual(FixedPoint.from_string(text).to_string(), text)
+        value = FixedPoint.from_string(binary_division(-10, 3))
+        self.assertEqual(value.to_float(), -3.3125)
+        self.assertEqual(value.fmt[:2], (7, 5))
+
+    def test_arithmetic(self):
+        fmt = QFormat(3, 4)
+        a, b = FixedPoint.from_float(1.5, fmt), FixedPoint.from_float(-0.75, fmt)
+        self.assertEqual((a + b).to_float(), 0.75)
+        self.assertEqual((a - b).to_float(), 2.25)
+        self.assertEqual((a * b).to_float(), -1.125)
+        self.assertEqual((a / b).to_float(), -2.0)
+        with self.assertRaises(ZeroDivisionError):
+            a / FixedPoint(0, fmt)
+        with self.assertRaises(ValueError):
+            a + FixedPoint(1, QFormat(3, 5))
+
+    def test_overflow_policies(self):
+        saturate, wrap = QFormat(3, 4, "saturate"), QFormat(3, 4, "wrap")
+        self.assertEqual((FixedPoint.from_float(7, saturate) + FixedPoint.from_float(2, saturate)).raw, 127)
+        self.assertEqual((FixedPoint.from_float(7, wrap) + FixedPoint.from_float(2, wrap)).to_float(), -7.0)
+
+    def test_rounding_modes(self):
+        expected = {"nearest": (1, -1), "nearest_even": (0, 0), "floor": (0, -1), "toward_zero": (0, 0)}
+        for rounding, (positive, negative) in expected.items():
+            fmt = QFormat(3, 0, rounding=rounding)
+            self.assertEqual(FixedPoint.from_float(0.5, fmt).raw, positive)
+            self.assertEqual(FixedPoint.from_float(-0.5, fmt).raw, negative)
+
+    def test_batch_matches_scalar(self):
+        fmt = QFormat(3, 4, "wrap", "nearest_even")
+        raws = np.arange(fmt.min_raw, fmt.max_raw + 1)
+        a, b = raws, raws[::-1]
+        for operation, function in (("add", FixedPoint.__add__), ("mul", FixedPoint.__mul__)):
+            batch = batch_fixed_point_operation(operation, a, b, fmt)
+            for i in range(0, len(a), 13):
+                expected = function(FixedPoint(int(a[i]), fmt), FixedPoint(int(b[i]), fmt))
+                self.assertEqual(batch[i], expected.raw)
+        values = np.array([0.03125, -1.53, 100.0])
+        self.assertEqual(quantize(values, QFormat(3, 4)).tolist(), [1, -24, 127])
+        self.assertEqual(dequantize(np.array([-24]), fmt).tolist(), [-1.5])
+
+class TestIeee754Conversion(unittest.TestCase):
+    def test_scalar_sign_and_zero(self):
+        self.assertEqual(float_to_ieee754(-1.5)[:2], [1, 0])
+        self.assertEqual(float_to_ieee754(0.0), [0] * 32)
+        self.assertEqual(ieee754_to_float(float_to_ieee754(-0.15625)), -0.15625)
+
+    def test_bit_matrix_round_trip(self):
+        values = np.array([1.5, -2.0, 0.0, np.inf, 1e-40], dtype=np.float32)
+        matrix = floats_to_bit_matrix(values)
+        self.assertEqual(matrix.shape, (5, 32))
+        self.assertEqual(matrix[0].tolist(), float_to_ieee754(1.5))
+        self.assertEqual(matrix[1].tolist(), float_to_ieee754(-2.0))
+        np.testing.assert_array_equal(bit_matrix_to_floats(matrix), values)
+        wide = floats_to_bit_matrix(np.array([0.1]), np.float64)
+        self.assertEqual(wide.shape, (1, 64))
+        self.assertEqual(bit_matrix_to_floats(wide, np.float64)[0], 0.1)
+        with self.assertRaises(ValueError):
+            bit_matrix_to_floats(wide)
+
+    def test_bit_matrix_width_from_dtype(self):
+        values = np.array([0.1, -2.5, 5e-324])
+        matrix = floats_to_bit_matrix(values)
+        self.assertEqual(matrix.shape, (3, 64))
+        np.testing.assert_array_equal(bit_matrix_to_floats(matrix, np.float64), values)
+        self.assertEqual(matrix[1, :12].tolist(), [1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(floats_to_bit_matrix(values.astype(np.float16)).shape, (3, 16))
+        self.assertEqual(floats_to_bit_matrix([1.5]).tolist(), [float_to_ieee754(1.5)])
+
+class TestBatchRunner(unittest.TestCase):
+    def test_read_operations(self):
+        jsonl = StringIO('{"op": "add", "operands": [5, 3], "width": 8}\n\n')
+        self.assertEqual(list(read_operations(jsonl)), [{'op': 'add', 'operands': [5, 3], 'width': 8}])
+        rows = StringIO("op,a,b,width\nfloat_add,1.5,2.75,\nconvert,-5,,16\n")
+        self.assertEqual(list(read_operations(rows, "csv")), [
+            {'op': 'float_add', 'operands': [1.5, 2.75], 'width': 8},
+            {'op': 'convert', 'operands': [-5], 'width': 16},
+        ])
+
+    def test_evaluate_record(self):
+        self.assertEqual(evaluate_record({'op': 'add', 'operands': [100, 100]})['overflow'], True)
+        self.assertEqual(evaluate_record({'op': 'div', 'operands': [10, 3]})['value'], 3.3125)
+        self.assertIn('error', evaluate_record({'op': 'div', 'operands': [1, 0]}))
+        self.assertIn('error', evaluate_record({'op': 'pow', 'operands': [1, 2]}))
+
+    def test_run_batch(self):
+        output = StringIO()
+        records = [{'op': 'mul', 'operands': [i, 3], 'width': 8} for i in range(10)]
+        count, _ = run_batch(iter(records), output)
+        self.assertEqual(count, 10)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(json.loads(lines[-1])['value'], 27)
+
+    def test_bad_records_are_reported(self):
+        jsonl = StringIO('{"op": "add", "operands": [5, 3]}\n'
+                         '{"op": "add", "operands": [5\n'
+                         '[1, 2]\n'
+                         '{"op": "float_add", "operands": ["1.5", 2]}\n'
+                         '{"op": "sub", "operands": [5, 3]}\n')
+        rows = StringIO("op,a,b,width\nadd,x,1,\nadd,1,2,wide\nmul,2,3,\n")
+        for records, expected_values in ((read_operations(jsonl), [8, None, None, None, 2]),
+                                         (read_operations(rows, "csv"), [None, None, 6])):
+            output = StringIO()
+            count, _ = run_batch(records, output, workers=2, chunk_size=1)
+            responses = [json.loads(line) for line in output.getvalue().splitlines()]
+            self.assertEqual(count, len(expected_values))
+            self.assertEqual([response.get('value') for response in responses], expected_values)
+            for response, value in zip(responses, expected_values):
+                self.assertEqual('error' in response, value is None)
+        jsonl.seek(0)
+        self.assertEqual([record.get('line') for record in read_operations(jsonl)], [None, 2, 3, None, None])
+        self.assertIn('error', evaluate_record(None))
+
+    def test_tables_backend(self):
+        records = [{'op': op, 'operands': [a, 7], 'width': width}
+                   for op in ('add', 'sub', 'mul', 'div') for a in (-120, 0, 90) for width in (8, 16)]
+        outputs = []
+        for backend in BACKENDS:
+            output = StringIO()
+            run_batch(iter(records), output, workers=2, chunk_size=4, backend=backend)
+            outputs.append(output.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(evaluate_record({'op': 'add', 'operands': [100, 100], 'backend': 'tables'})['overflow'], True)
+        self.assertIn('error', evaluate_record({'op': 'add', 'operands': [1, 2], 'backend': 'fpga'}))
+
+class TestBenchmark(unittest.TestCase):
+    def test_exhaustive_sweep_has_no_mismatches(self):
+        report = run_benchmark(width=4)
+        self.assertEqual(set(report['operations']), set(BENCHMARK_OPERATIONS))
+        for operation, results in report['operations'].items():
+            for name, result in results.items():
+                self.assertEqual(result['mismatches'], 0, f"{operation}/{name}")
+                self.assertGreater(result['checked'], 0)
+        json.dumps(report)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
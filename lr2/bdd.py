@@ -0,0 +1,314 @@
+from itertools import product
+
+from bitparallel import format_index_form
+from expression import expression_variables, parse, topological_order
+
+FALSE = 0
+TRUE = 1
+
+
+class BDD:
+    """
+    Сокращённые упорядоченные двоичные диаграммы решений (ROBDD).
+    Функция — целый номер корневой вершины; 0 и 1 — терминальные вершины.
+    Порядок переменных в таблице истинности задаётся при создании (variables)
+    и не меняется при перестановке уровней диаграммы в sift().
+    """
+
+    def __init__(self, variables=()):
+        self.variables = []
+        # Для каждой вершины: номер переменной, младший (x=0) и старший (x=1) потомки
+        self._var = [None, None]
+        self._low = [FALSE, TRUE]
+        self._high = [FALSE, TRUE]
+        self._unique = {}
+        self._cache = {}
+        self._level = []
+        self._order = []
+        self._nodes_by_var = []
+        for name in variables:
+            self.add_variable(name)
+
+    def add_variable(self, name):
+        """Добавляет переменную в конец таблицы и на нижний уровень диаграммы"""
+        if name in self.variables:
+            raise ValueError(f"Переменная {name} уже объявлена")
+        index = len(self.variables)
+        self.variables.append(name)
+        self._level.append(len(self._order))
+        self._order.append(index)
+        self._nodes_by_var.append(set())
+        return index
+
+    def _level_of(self, node):
+        var = self._var[node]
+        return len(self._order) if var is None else self._level[var]
+
+    def _make(self, var, low, high):
+        if low == high:
+            return low
+        key = (var, low, high)
+        node = self._unique.get(key)
+        if node is None:
+            node = len(self._var)
+            self._var.append(var)
+            self._low.append(low)
+            self._high.append(high)
+            self._unique[key] = node
+            self._nodes_by_var[var].add(node)
+        return node
+
+    def variable(self, name):
+        """Функция, равная переменной name (объявляет её при необходимости)"""
+        if name not in self.variables:
+            self.add_variable(name)
+        return self._make(self.variables.index(name), FALSE, TRUE)
+
+    def _cofactors(self, node, var):
+        if self._var[node] == var:
+            return self._low[node], self._high[node]
+        return node, node
+
+    def ite(self, f, g, h):
+        """if f then g else h — базовая операция, через которую выражаются остальные"""
+        if f == TRUE:
+            return g
+        if f == FALSE:
+            return h
+        if g == h:
+            return g
+        if g == TRUE and h == FALSE:
+            return f
+        key = (f, g, h)
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+        level = min(self._level_of(f), self._level_of(g), self._level_of(h))
+        var = self._order[level]
+        f0, f1 = self._cofactors(f, var)
+        g0, g1 = self._cofactors(g, var)
+        h0, h1 = self._cofactors(h, var)
+        result = self._make(var, self.ite(f0, g0, h0), self.ite(f1, g1, h1))
+        self._cache[key] = result
+        return result
+
+    def negate(self, f):
+        return self.ite(f, FALSE, TRUE)
+
+    def apply(self, op, f, g):
+        """Бинарная операция с обозначением из expression: & | ^ ↑ ↓ -> ~"""
+        if op == "&":
+            return self.ite(f, g, FALSE)
+        if op == "|":
+            return self.ite(f, TRUE, g)
+        if op == "^":
+            return self.ite(f, self.negate(g), g)
+        if op == "~":
+            return self.ite(f, g, self.negate(g))
+        if op == "->":
+            return self.ite(f, g, TRUE)
+        if op == "↑":
+            return self.negate(self.ite(f, g, FALSE))
+        if op == "↓":
+            return self.negate(self.ite(f, TRUE, g))
+        raise ValueError(f"Неизвестная операция: {op}")
+
+    def restrict(self, f, name, value):
+        """Кофактор f при name = value"""
+        var = self.variables.index(name)
+        level = self._level[var]
+        memo = {}
+
+        def walk(node):
+            if self._level_of(node) > level:
+                return node
+            if node not in memo:
+                if self._var[node] == var:
+                    memo[node] = self._high[node] if value else self._low[node]
+                else:
+                    memo[node] = self._make(self._var[node], walk(self._low[node]), walk(self._high[node]))
+            return memo[node]
+
+        return walk(f)
+
+    def exists(self, f, names):
+        """Квантор существования по переменным names"""
+        quantified = {self.variables.index(name) for name in names}
+        if not quantified:
+            return f
+        bottom = max(self._level[var] for var in quantified)
+        memo = {}
+
+        def walk(node):
+            if self._level_of(node) > bottom:
+                return node
+            if node not in memo:
+                low, high = walk(self._low[node]), walk(self._high[node])
+                var = self._var[node]
+                memo[node] = self.ite(low, TRUE, high) if var in quantified else self._make(var, low, high)
+            return memo[node]
+
+        return walk(f)
+
+    def from_node(self, node):
+        """Строит диаграмму по дереву из expression.parse"""
+        values = {}
+        for item in topological_order(node):
+            if item.op == "var":
+                values[item] = self.variable(item.name)
+            elif item.op in ("0", "1"):
+                values[item] = TRUE if item.op == "1" else FALSE
+            elif item.op == "!":
+                values[item] = self.negate(values[item.operands[0]])
+            else:
+                values[item] = self.apply(item.op, *(values[operand] for operand in item.operands))
+        return values[node]
+
+    def from_expression(self, text):
+        """Разбирает выражение; новые переменные объявляются в отсортированном порядке"""
+        for name in expression_variables(text):
+            if name not in self.variables:
+                self.add_variable(name)
+        return self.from_node(parse(text))
+
+    def equivalent(self, f, g):
+        # Диаграммы канонические, поэтому равносильные функции — одна и та же вершина
+        return f == g
+
+    def sat_count(self, f):
+        """Число наборов всех объявленных переменных, на которых f = 1"""
+        memo = {FALSE: 0, TRUE: 1}
+
+        def count(node):
+            if node not in memo:
+                level = self._level_of(node)
+                low, high = self._low[node], self._high[node]
+                memo[node] = (count(low) << (self._level_of(low) - level - 1)) + \
+                             (count(high) << (self._level_of(high) - level - 1))
+            return memo[node]
+
+        return count(f) << self._level_of(f)
+
+    def _cubes(self, f, target):
+        # Пути к терминалу target: словари {номер переменной: значение}
+        stack = [(f, {})]
+        while stack:
+            node, cube = stack.pop()
+            if node == target:
+                yield cube
+            elif node in (FALSE, TRUE):
+                continue
+            else:
+                var = self._var[node]
+                stack.append((self._high[node], {**cube, var: 1}))
+                stack.append((self._low[node], {**cube, var: 0}))
+
+    def _indices(self, f, target):
+        n = len(self.variables)
+        indices = []
+        for cube in self._cubes(f, target):
+            free = [var for var in range(n) if var not in cube]
+            base = sum(1 << (n - 1 - var) for var, value in cube.items() if value)
+            for values in product((0, 1), repeat=len(free)):
+                indices.append(base + sum(1 << (n - 1 - var) for var, value in zip(free, values) if value))
+        return sorted(indices)
+
+    def sdnf_indices(self, f):
+        """Номера наборов (в порядке variables), где f = 1, в виде строк, как в generate_sdnf_sknf"""
+        return [str(index) for index in self._indices(f, TRUE)]
+
+    def sknf_indices(self, f):
+        """Номера наборов, где f = 0"""
+        return [str(index) for index in self._indices(f, FALSE)]
+
+    def index_form(self, f):
+        n = len(self.variables)
+        column = 0
+        for index in self._indices(f, TRUE):
+            column |= 1 << ((1 << n) - 1 - index)
+        return format_index_form(column, n)
+
+    def _reachable(self, roots):
+        seen = set()
+        stack = [root for root in roots if root > TRUE]
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.extend(child for child in (self._low[node], self._high[node]) if child > TRUE)
+        return seen
+
+    def node_count(self, roots):
+        """Число нетерминальных вершин, достижимых из корней"""
+        return len(self._reachable(roots))
+
+    def _collect(self, roots):
+        # Сборка мусора: вершины, недостижимые из roots, удаляются из таблиц и больше не участвуют в обменах
+        live = self._reachable(roots)
+        for var, nodes in enumerate(self._nodes_by_var):
+            for node in nodes - live:
+                del self._unique[(var, self._low[node], self._high[node])]
+            nodes &= live
+        self._cache.clear()
+        return len(live)
+
+    def order(self):
+        """Имена переменных сверху вниз по уровням диаграммы"""
+        return [self.variables[var] for var in self._order]
+
+    def _swap(self, level):
+        """
+        Меняет местами переменные уровней level и level + 1.
+        Вершины изменяются на месте, поэтому номера функций остаются прежними.
+        """
+        x, y = self._order[level], self._order[level + 1]
+        for node in list(self._nodes_by_var[x]):
+            low, high = self._low[node], self._high[node]
+            if self._var[low] != y and self._var[high] != y:
+                continue
+            f00, f01 = self._cofactors(low, y)
+            f10, f11 = self._cofactors(high, y)
+            del self._unique[(x, low, high)]
+            self._nodes_by_var[x].discard(node)
+            new_low, new_high = self._make(x, f00, f10), self._make(x, f01, f11)
+            self._var[node], self._low[node], self._high[node] = y, new_low, new_high
+            self._unique[(y, new_low, new_high)] = node
+            self._nodes_by_var[y].add(node)
+        self._order[level], self._order[level + 1] = y, x
+        self._level[x], self._level[y] = level + 1, level
+
+    def sift(self, roots, max_growth=1.2):
+        """
+        Перестановка переменных просеиванием (Rudell): каждая переменная по очереди
+        проходит уровни вниз и вверх (пока диаграмма не вырастет больше чем в max_growth раз)
+        и остаётся там, где диаграмма для roots меньше всего. Сохраняются только функции,
+        достижимые из roots, — номера остальных после вызова недействительны.
+        Возвращает итоговое число вершин.
+        """
+        n = len(self._order)
+        best_size = self._collect(roots)
+        for var in sorted(range(n), key=lambda v: -len(self._nodes_by_var[v])):
+            best_level = self._level[var]
+            limit = best_size * max_growth
+            while self._level[var] < n - 1:
+                self._swap(self._level[var])
+                size = self._collect(roots)
+                if size < best_size:
+                    best_size, best_level = size, self._level[var]
+                if size > limit:
+                    break
+            while self._level[var] > 0:
+                self._swap(self._level[var] - 1)
+                size = self._collect(roots)
+                if size < best_size:
+                    best_size, best_level = size, self._level[var]
+                if size > limit:
+                    break
+            while self._level[var] < best_level:
+                self._swap(self._level[var])
+                self._collect(roots)
+            while self._level[var] > best_level:
+                self._swap(self._level[var] - 1)
+                self._collect(roots)
+        return best_size
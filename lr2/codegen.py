@@ -0,0 +1,85 @@
+from functools import lru_cache
+
+from expression import BINARY_OPERATORS, topological_order
+
+_BINARY = {
+    "&": "{} and {}",
+    "|": "{} or {}",
+    "^": "{} != {}",
+    "↑": "not ({} and {})",
+    "↓": "not ({} or {})",
+    "->": "not {} or {}",
+    "~": "{} == {}",
+}
+_CONSTANTS = {"0": "False", "1": "True"}
+
+
+def _operation(token, operands):
+    if token == "!":
+        return f"not {operands[0]}"
+    if token in _BINARY:
+        return _BINARY[token].format(*operands)
+    raise ValueError(f"Неизвестный токен: {token}")
+
+
+def _define(parameters, lines, result):
+    # Каждая операция — отдельное присваивание, чтобы глубина выражения не упиралась в лимиты парсера
+    body = [f"    t{i} = {line}" for i, line in enumerate(lines)]
+    source = f"def function({', '.join(parameters)}):\n" + "\n".join(body + [f"    return {result}"])
+    namespace = {}
+    exec(compile(source, "<логическое выражение>", "exec"), namespace)
+    return namespace["function"]
+
+
+@lru_cache(maxsize=256)
+def _compile(postfix_tokens, variables):
+    names = {var: f"v{i}" for i, var in enumerate(variables)}
+    lines = []
+    stack = []
+    for token in postfix_tokens:
+        if token in names:
+            stack.append(names[token])
+        elif token in _CONSTANTS:
+            stack.append(_CONSTANTS[token])
+        else:
+            if token == "!":
+                operands = [stack.pop()]
+            elif token in BINARY_OPERATORS:
+                b, a = stack.pop(), stack.pop()
+                operands = [a, b]
+            else:
+                raise ValueError(f"Неизвестный токен: {token}")
+            lines.append(_operation(token, operands))
+            stack.append(f"t{len(lines) - 1}")
+    return _define(names.values(), lines, stack.pop())
+
+
+@lru_cache(maxsize=256)
+def _compile_node(node, variables):
+    names = {var: f"v{i}" for i, var in enumerate(variables)}
+    lines = []
+    values = {}
+    for item in topological_order(node):
+        if item.op == "var":
+            if item.name not in names:
+                raise ValueError(f"Неизвестная переменная: {item.name}")
+            values[item] = names[item.name]
+        elif item.op in _CONSTANTS:
+            values[item] = _CONSTANTS[item.op]
+        else:
+            lines.append(_operation(item.op, [values[operand] for operand in item.operands]))
+            values[item] = f"t{len(lines) - 1}"
+    return _define(names.values(), lines, values[node])
+
+
+def compile_postfix(postfix_tokens, variables):
+    """
+    Компилирует постфиксную запись в функцию Python, принимающую значения переменных
+    позиционно в порядке variables. Результат кэшируется по (токены, переменные).
+    """
+    return _compile(tuple(postfix_tokens), tuple(variables))
+
+
+def compile_node(node, variables):
+    """То же для дерева из expression.parse: общее подвыражение вычисляется один раз"""
+    return _compile_node(node, tuple(variables))
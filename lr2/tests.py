@@ -1,6 +1,15 @@
 import unittest
+from contextlib import redirect_stdout
+from io import StringIO
 from main import implication, equivalence, infix_to_postfix, evaluate_postfix, generate_truth_values, \
     generate_sdnf_sknf, truth_table
+from bdd import BDD, FALSE
+from streaming import iter_rows, iter_truth_values, write_truth_table
+from truthtable import TruthTable
+from codegen import compile_node, compile_postfix
+from expression import ExpressionSyntaxError, expression_variables, parse, to_postfix, topological_order
+from bitparallel import variable_columns, evaluate_columns, format_index_form, node_columns, sdnf_sknf_indices, \
+    table_rows
 
 
 class TestTruthTableFunctions(unittest.TestCase):
@@ -45,5 +54,148 @@ class TestTruthTableFunctions(unittest.TestCase):
     def test_truth_table(self):
         table = truth_table("!a", sorted(set(filter(str.isalpha, "!a"))))
         self.assertEqual("1 - 01", table)
+
+
+class TestBitParallel(unittest.TestCase):
+    def test_variable_columns(self):
+        self.assertEqual(variable_columns(2), [0b0011, 0b0101])
+        self.assertEqual(variable_columns(1), [0b01])
+
+    def test_evaluate_columns_matches_evaluate_postfix(self):
+        for expression in ["a & b", "!a | b", "a -> b", "(a ~ b) & !c", "(a | b) -> (c ~ d)"]:
+            variables = sorted(set(filter(str.isalpha, expression)))
+            postfix = infix_to_postfix(expression)
+            expected = ''.join(str(int(evaluate_postfix(postfix, dict(zip(variables, values)))))
+                               for values in generate_truth_values(len(variables)))
+            column = evaluate_columns(postfix, variables)
+            self.assertEqual(format_index_form(column, len(variables)), f"{int(expected, 2)} - {expected}")
+
+    def test_sdnf_sknf_indices_and_rows(self):
+        column = evaluate_columns(infix_to_postfix("a | b"), ["a", "b"])
+        self.assertEqual(sdnf_sknf_indices(column, 2), (["1", "2", "3"], ["0"]))
+        self.assertEqual(list(table_rows(column, 2)), [[0, 0, 0], [0, 1, 1], [1, 0, 1], [1, 1, 1]])
+
+    def test_unknown_token(self):
+        with self.assertRaises(ValueError):
+            evaluate_columns(["a", "x", "&"], ["a"])
+
+    def test_compile_postfix(self):
+        function = compile_postfix(infix_to_postfix("(a -> b) & !c"), ["a", "b", "c"])
+        for values in generate_truth_values(3):
+            expected = evaluate_postfix(["a", "b", "->", "c", "!", "&"], dict(zip("abc", values)))
+            self.assertEqual(function(*values), expected)
+        self.assertIs(function, compile_postfix(infix_to_postfix("(a -> b) & !c"), ("a", "b", "c")))
+        with self.assertRaises(ValueError):
+            compile_postfix(["a", "?"], ["a"])
+
+    def test_parse_identifiers_constants_and_new_operators(self):
+        self.assertEqual(expression_variables("x1 ^ Cin ↑ Q2"), ["Cin", "Q2", "x1"])
+        self.assertEqual(infix_to_postfix("x1 xor Cin"), ["x1", "Cin", "^"])
+        self.assertEqual(infix_to_postfix("a nand b"), ["a", "b", "↑"])
+        self.assertEqual(format_index_form(node_columns(parse("a ↓ b"), ["a", "b"]), 2), "8 - 1000")
+        self.assertEqual(format_index_form(node_columns(parse("!!a ^ 1"), ["a"]), 1), "2 - 10")
+
+    def test_parse_folds_constants_and_shares_subexpressions(self):
+        self.assertEqual(to_postfix(parse("a & 1 | 0")), ["a"])
+        self.assertEqual(to_postfix(parse("b -> b")), ["1"])
+        self.assertEqual(infix_to_postfix("a & 1 | 0"), ["a", "1", "&", "0", "|"])
+        self.assertEqual(infix_to_postfix("b -> b"), ["b", "b", "->"])
+        node = parse("(a & b) | !(a & b)")
+        self.assertIs(node.operands[0], node.operands[1].operands[0])
+        self.assertEqual(len(topological_order(node)), 5)
+        function = compile_node(node, ["a", "b"])
+        self.assertTrue(all(function(*values) for values in generate_truth_values(2)))
+
+    def test_parse_errors_have_positions(self):
+        for text, position in [("a &", 3), ("(a | b", 0), ("a | b)", 5), ("a $ b", 2), ("a b", 2), ("12", 0)]:
+            with self.assertRaises(ExpressionSyntaxError) as context:
+                parse(text)
+            self.assertEqual(context.exception.position, position)
+
+
+class TestBDD(unittest.TestCase):
+    def test_matches_truth_table(self):
+        bdd = BDD(["a", "b", "c"])
+        f = bdd.from_expression("(a -> b) & !c")
+        column = node_columns(parse("(a -> b) & !c"), ["a", "b", "c"])
+        self.assertEqual(bdd.index_form(f), format_index_form(column, 3))
+        self.assertEqual((bdd.sdnf_indices(f), bdd.sknf_indices(f)), sdnf_sknf_indices(column, 3))
+        self.assertEqual(bdd.sat_count(f), 3)
+
+    def test_restrict_exists_and_equivalence(self):
+        bdd = BDD(["a", "b"])
+        f = bdd.from_expression("a & b")
+        self.assertEqual(bdd.restrict(f, "a", 1), bdd.variable("b"))
+        self.assertEqual(bdd.restrict(f, "a", 0), FALSE)
+        self.assertEqual(bdd.exists(f, ["b"]), bdd.variable("a"))
+        self.assertTrue(bdd.equivalent(bdd.from_expression("!(a & b)"), bdd.from_expression("!a | !b")))
+
+    def test_sift_shrinks_bad_order_and_keeps_functions(self):
+        n = 6
+        bdd = BDD([f"x{i}" for i in range(n)] + [f"y{i}" for i in range(n)])
+        expression = " & ".join(f"(x{i} ~ y{i})" for i in range(n))
+        f = bdd.from_expression(expression)
+        before = bdd.node_count([f])
+        self.assertEqual(bdd.sift([f]), 3 * n)
+        self.assertLess(3 * n, before)
+        self.assertEqual(bdd.sat_count(f), 2 ** n)
+        self.assertEqual(bdd.from_expression(expression), f)
+
+    def test_many_variables(self):
+        bdd = BDD()
+        f = bdd.from_expression(" ^ ".join(f"x{i}" for i in range(60)))
+        self.assertEqual(bdd.node_count([f]), 119)
+        self.assertEqual(bdd.sat_count(f), 2 ** 59)
+
+
+class TestStreaming(unittest.TestCase):
+    def test_write_truth_table_matches_truth_table(self):
+        expression = "(a -> b) ~ !c"
+        variables = ["a", "b", "c"]
+        with StringIO() as buf, redirect_stdout(buf):
+            truth_table(expression, variables)
+            expected = buf.getvalue()
+        for block_bits in (1, 2, 16):
+            output = StringIO()
+            write_truth_table(expression, variables, output, block_bits)
+            self.assertTrue(expected.startswith(output.getvalue()))
+            self.assertIn("Индексная форма функции: 166 - 10100110", output.getvalue())
+
+    def test_iter_rows_and_progress(self):
+        self.assertEqual(list(iter_rows("a | b", ["a", "b"], 1)), [[0, 0, 0], [0, 1, 1], [1, 0, 1], [1, 1, 1]])
+        self.assertEqual(list(iter_truth_values(2)), [(False, False), (False, True), (True, False), (True, True)])
+        calls = []
+        write_truth_table("a & b", ["a", "b"], StringIO(), 1, lambda *args: calls.append(args))
+        self.assertIn(("таблица", 4, 4), calls)
+
+
+class TestTruthTableType(unittest.TestCase):
+    def test_rows_roundtrip_and_index_form(self):
+        table = TruthTable(["a", "b"], 0b0111)
+        self.assertEqual(table.to_rows(), [[0, 0, 0], [0, 1, 1], [1, 0, 1], [1, 1, 1]])
+        self.assertEqual(TruthTable.from_rows(table.to_rows(), ["a", "b"]), table)
+        self.assertEqual(table.index_form(), "7 - 0111")
+        self.assertEqual((list(table.minterms()), list(table.maxterms())), ([1, 2, 3], [0]))
+        self.assertEqual(TruthTable.from_minterms([1, 2, 3], ["a", "b"]), table)
+        self.assertEqual(len({table, TruthTable(["a", "b"], 7)}), 1)
+
+    def test_cofactor_complement_and_compose(self):
+        variables = ["a", "b", "c"]
+        f = TruthTable.from_function(lambda a, b, c: (a and b) or c, variables)
+        self.assertEqual(f.cofactor("a", 1), TruthTable.from_function(lambda b, c: b or c, ["b", "c"]))
+        self.assertEqual(f.cofactor("c", 0), TruthTable.from_function(lambda a, b: a and b, ["a", "b"]))
+        self.assertEqual((~f).bits, f.bits ^ 0xFF)
+        g = TruthTable.from_function(lambda a, b, c: a != b, variables)
+        self.assertEqual(f.compose("c", g), TruthTable.from_function(lambda a, b, c: (a and b) or a != b, variables))
+        with self.assertRaises(ValueError):
+            f & TruthTable(["x"], 1)
+
+    def test_large_index_form(self):
+        table = TruthTable([f"x{i}" for i in range(14)], 1 << (1 << 14) - 1)
+        decimal, binary = table.index_form().split(" - ")
+        # 2 ** 16383 ≈ 5.9486574767861588254e4931 — длиннее предела int_max_str_digits
+        self.assertEqual(len(decimal), 4932)
+        self.assertTrue(decimal.startswith("594865747678615882"))
+        self.assertEqual(binary, "1" + "0" * 16383)
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,168 @@
+from expression import BINARY_OPERATORS, expression_variables, parse, topological_order
+
+
+def decimal_string(value):
+    """Десятичная запись числа любой длины (в обход ограничения sys.get_int_max_str_digits)"""
+    if value < 10 ** 1000:
+        return str(value)
+    # Делим пополам по степени десяти, чтобы каждая часть переводилась отдельно
+    half = int(value.bit_length() * 0.30103) // 2
+    high, low = divmod(value, 10 ** half)
+    return decimal_string(high) + decimal_string(low).zfill(half)
+
+
+def _full(n):
+    return (1 << (1 << n)) - 1
+
+
+def variable_columns(n):
+    """
+    Столбцы переменных таблицы истинности в виде целых чисел из 2 ** n бит.
+    Строка i хранится в бите 2 ** n - 1 - i, поэтому нулевая строка — старший бит,
+    а столбец функции численно совпадает с её индексной формой.
+    """
+    rows = 1 << n
+    full = _full(n)
+    columns = []
+    for k in range(n):
+        block = 1 << (n - 1 - k)
+        # Период: block нулей (младшие) и block единиц, размноженный удвоением на все строки
+        standard = ((1 << block) - 1) << block
+        length = 2 * block
+        while length < rows:
+            standard |= standard << length
+            length *= 2
+        columns.append(full ^ standard)
+    return columns
+
+
+def variable_blocks(n):
+    """Шаг по строкам для каждой переменной: наборы, различающиеся только k-й, отстоят на 2 ** (n - 1 - k)"""
+    return [1 << (n - 1 - k) for k in range(n)]
+
+
+def flip_variables(column, n, polarity):
+    """
+    Столбец функции f(x ^ polarity): для каждой переменной, равной 1 в наборе polarity,
+    меняются местами строки, различающиеся только её значением
+    """
+    for variable, block in zip(variable_columns(n), variable_blocks(n)):
+        if polarity & block:
+            column = ((column & variable) << block) | ((column >> block) & variable)
+    return column
+
+
+def _apply(token, operands, full):
+    """Одна операция над столбцами; full — столбец из одних единиц"""
+    if token == "!":
+        return operands[0] ^ full
+    a, b = operands
+    if token == "&":
+        return a & b
+    if token == "|":
+        return a | b
+    if token == "^":
+        return a ^ b
+    if token == "↑":
+        return (a & b) ^ full
+    if token == "↓":
+        return (a | b) ^ full
+    if token == "->":
+        return (a ^ full) | b
+    if token == "~":
+        return a ^ b ^ full
+    raise ValueError(f"Неизвестный токен: {token}")
+
+
+def evaluate_columns(postfix_tokens, variables):
+    """Вычисляет выражение сразу для всех строк таблицы поразрядными операциями над столбцами"""
+    n = len(variables)
+    full = _full(n)
+    columns = dict(zip(variables, variable_columns(n)))
+    stack = []
+    for token in postfix_tokens:
+        if token in columns:
+            stack.append(columns[token])
+        elif token in ("0", "1"):
+            stack.append(full if token == "1" else 0)
+        elif token == "!":
+            stack.append(_apply(token, [stack.pop()], full))
+        elif token in BINARY_OPERATORS:
+            b, a = stack.pop(), stack.pop()
+            stack.append(_apply(token, [a, b], full))
+        else:
+            raise ValueError(f"Неизвестный токен: {token}")
+    return stack.pop()
+
+
+def _evaluate_nodes(order, columns, full):
+    values = {}
+    for item in order:
+        if item.op == "var":
+            if item.name not in columns:
+                raise ValueError(f"Неизвестная переменная: {item.name}")
+            values[item] = columns[item.name]
+        elif item.op in ("0", "1"):
+            values[item] = full if item.op == "1" else 0
+        else:
+            values[item] = _apply(item.op, [values[operand] for operand in item.operands], full)
+    return values[order[-1]]
+
+
+def evaluate_node(node, columns, width):
+    """Значение дерева на произвольных столбцах переменных (словарь имя -> int) ширины width"""
+    return _evaluate_nodes(topological_order(node), columns, (1 << width) - 1)
+
+
+def node_columns(node, variables):
+    """Столбец функции для дерева из expression.parse; общие подвыражения вычисляются один раз"""
+    n = len(variables)
+    return _evaluate_nodes(topological_order(node), dict(zip(variables, variable_columns(n))), _full(n))
+
+
+def expression_table(expression, variables=None):
+    """TruthTable выражения; по умолчанию над его переменными в алфавитном порядке"""
+    # truthtable сам строится на столбцах этого модуля, поэтому импортируется здесь
+    from truthtable import TruthTable
+    if variables is None:
+        variables = expression_variables(expression)
+    return TruthTable(variables, node_columns(parse(expression), variables))
+
+
+def column_blocks(node, variables, block_bits=16):
+    """
+    Столбец функции блоками по 2 ** block_bits строк: пары (номер первой строки, столбец блока).
+    Внутри блока старшие переменные постоянны, поэтому память не зависит от числа переменных.
+    """
+    n = len(variables)
+    k = min(block_bits, n)
+    high = n - k
+    full = _full(k)
+    order = topological_order(node)
+    low_columns = dict(zip(variables[high:], variable_columns(k)))
+    for block in range(1 << high):
+        columns = dict(low_columns)
+        for i, name in enumerate(variables[:high]):
+            columns[name] = full if block >> (high - 1 - i) & 1 else 0
+        yield block << k, _evaluate_nodes(order, columns, full)
+
+
+def format_index_form(column, n):
+    """Индексная форма функции в виде 'десятичное - двоичное'"""
+    return f"{decimal_string(column)} - {format(column, f'0{1 << n}b')}"
+
+
+def sdnf_sknf_indices(column, n):
+    """Номера строк, где функция равна 1 (СДНФ) и 0 (СКНФ), в виде строк"""
+    bits = format(column, f"0{1 << n}b")
+    sdnf_indices = [str(i) for i, bit in enumerate(bits) if bit == '1']
+    sknf_indices = [str(i) for i, bit in enumerate(bits) if bit == '0']
+    return sdnf_indices, sknf_indices
+
+
+def table_rows(column, n):
+    """Строки таблицы истинности [значения переменных..., результат]"""
+    bits = format(column, f"0{1 << n}b")
+    for i, bit in enumerate(bits):
+        values = [int(x) for x in format(i, f"0{n}b")] if n else []
+        yield values + [int(bit)]
@@ -0,0 +1,81 @@
+import json
+import os
+import sqlite3
+
+from expression import to_postfix
+
+# Меняется при изменении формата записей или алгоритмов: старый кэш тогда очищается.
+# 2 — минимизация через qm.minimal_cover: другие, но равноценные покрытия
+CACHE_VERSION = 2
+DEFAULT_PATH = os.environ.get("AOIS_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "aois", "lr3.sqlite3"))
+
+
+def canonical_key(node, variables):
+    """
+    Каноническая запись выражения: порядок переменных и постфиксная запись разобранного
+    (со свёрнутыми константами) дерева, так что пробелы и лишние скобки на ключ не влияют.
+    """
+    return json.dumps([list(variables), to_postfix(node)], ensure_ascii=False)
+
+
+class ResultCache:
+    """
+    Кэш результатов в файле SQLite: ключ — canonical_key, значение — словарь, записанный
+    в JSON. Хранит не больше max_entries записей, вытесняя давно не использованные.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, max_entries=4096):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.max_entries = max_entries
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT, used INTEGER);
+            CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+        """)
+        row = self._connection.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+        if row is None or row[0] != str(CACHE_VERSION):
+            with self._connection:
+                self._connection.execute("DELETE FROM entries")
+                self._connection.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(CACHE_VERSION),))
+
+    def _tick(self):
+        # Счётчик обращений: чем больше used, тем позже запись использовалась
+        return self._connection.execute("SELECT COALESCE(MAX(used), 0) + 1 FROM entries").fetchone()[0]
+
+    def get(self, key):
+        """Сохранённый словарь или None"""
+        row = self._connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        with self._connection:
+            self._connection.execute("UPDATE entries SET used = ? WHERE key = ?", (self._tick(), key))
+        return json.loads(row[0])
+
+    def put(self, key, value):
+        with self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                                     (key, json.dumps(value, ensure_ascii=False), self._tick()))
+            self._connection.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,))
+
+    def __contains__(self, key):
+        return self._connection.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone() is not None
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def clear(self):
+        with self._connection:
+            self._connection.execute("DELETE FROM entries")
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,96 @@
+from bitparallel import expression_table, flip_variables, variable_blocks, variable_columns
+
+# Классы Поста: сохраняющие 0 и 1, самодвойственные, монотонные, линейные
+POST_CLASSES = ("T0", "T1", "S", "M", "L")
+
+
+def preserves_zero(table):
+    return table[0] == 0
+
+
+def preserves_one(table):
+    return table[table.size - 1] == 1
+
+
+def is_self_dual(table):
+    """f(!x) = !f(x): столбец, прочитанный с конца, равен инверсии столбца"""
+    return flip_variables(table.bits, len(table.variables), table.size - 1) == (~table).bits
+
+
+def is_monotone(table):
+    """Для каждой переменной кофактор при 0 не больше кофактора при 1"""
+    n = len(table.variables)
+    bits = table.bits
+    for column, block in zip(variable_columns(n), variable_blocks(n)):
+        # Значения при x = 0 сдвигаются на строки с x = 1 и сравниваются с ними
+        if (bits >> block) & column & ~bits:
+            return False
+    return True
+
+
+def is_linear(table):
+    """f = c ^ a1 x1 ^ ... ^ an xn: коэффициенты берутся из строк с одной единицей"""
+    n = len(table.variables)
+    constant = table[0]
+    expected = (1 << table.size) - 1 if constant else 0
+    for column, block in zip(variable_columns(n), variable_blocks(n)):
+        if table[block] != constant:
+            expected ^= column
+    return table.bits == expected
+
+
+def essential_variables(table):
+    """Переменные, от которых функция существенно зависит"""
+    n = len(table.variables)
+    bits = table.bits
+    return [name for name, column, block in zip(table.variables, variable_columns(n), variable_blocks(n))
+            if ((bits >> block) ^ bits) & column]
+
+
+def is_symmetric(table):
+    """Функция не меняется при перестановке любых двух переменных (достаточно соседних)"""
+    n = len(table.variables)
+    columns = variable_columns(n)
+    full = (1 << table.size) - 1
+    bits = table.bits
+    for i in range(n - 1):
+        # Строки с (x_i, x_i+1) = (0, 1) и (1, 0) меняются местами
+        low = ~columns[i] & columns[i + 1] & full
+        high = columns[i] & ~columns[i + 1] & full
+        distance = (1 << (n - 1 - i)) - (1 << (n - 2 - i))
+        swapped = (bits & ~(low | high)) | ((bits & low) >> distance) | ((bits & high) << distance)
+        if swapped != bits:
+            return False
+    return True
+
+
+def post_classes(table):
+    """Словарь {класс Поста: принадлежит ли функция классу}"""
+    return {
+        "T0": preserves_zero(table),
+        "T1": preserves_one(table),
+        "S": is_self_dual(table),
+        "M": is_monotone(table),
+        "L": is_linear(table),
+    }
+
+
+def classify(table):
+    """Все свойства функции: классы Поста, симметричность и существенные переменные"""
+    result = post_classes(table)
+    result["symmetric"] = is_symmetric(table)
+    result["essential"] = essential_variables(table)
+    return result
+
+
+def is_complete(expressions):
+    """
+    Критерий Поста: система полна, если для каждого класса в ней есть функция вне его.
+    Возвращает (полна ли система, список классов, не покинутых ни одной функцией).
+    """
+    remaining = set(POST_CLASSES)
+    for expression in expressions:
+        classes = post_classes(expression_table(expression))
+        remaining -= {name for name, member in classes.items() if not member}
+    missing = [name for name in POST_CLASSES if name in remaining]
+    return not missing, missing
@@ -0,0 +1,84 @@
+import random
+
+from bitparallel import column_blocks, evaluate_node
+from expression import ExpressionBuilder, expression_variables, parse
+from sat import satisfying_assignment
+
+# До стольких переменных таблица перебирается блоками, дальше — поиск SAT-решателем
+MAX_ENUMERATE = 20
+SIMULATION_WIDTH = 256
+SIMULATION_ROUNDS = 4
+
+
+def _assignment(variables, index):
+    n = len(variables)
+    return {name: index >> (n - 1 - i) & 1 for i, name in enumerate(variables)}
+
+
+def _enumerate(node, variables, block_bits):
+    # Первая строка, где функция равна 0, — старший нулевой бит столбца блока
+    for start, column in column_blocks(node, variables, block_bits):
+        size = 1 << min(block_bits, len(variables))
+        zeros = ~column & ((1 << size) - 1)
+        if zeros:
+            return _assignment(variables, start + size - zeros.bit_length())
+    return None
+
+
+def _simulate(node, variables, seed):
+    # Случайные наборы пачкой по SIMULATION_WIDTH: быстро находят опровержение неравных функций
+    generator = random.Random(seed)
+    full = (1 << SIMULATION_WIDTH) - 1
+    for _ in range(SIMULATION_ROUNDS):
+        columns = {name: generator.getrandbits(SIMULATION_WIDTH) for name in variables}
+        zeros = ~evaluate_node(node, columns, SIMULATION_WIDTH) & full
+        if zeros:
+            bit = zeros.bit_length() - 1
+            return {name: columns[name] >> bit & 1 for name in variables}
+    return None
+
+
+def find_counterexample(node, variables, builder=None, block_bits=16, seed=0):
+    """
+    Набор значений (словарь имя -> 0/1), на котором функция равна 0, или None,
+    если функция тождественно истинна. До MAX_ENUMERATE переменных таблица перебирается
+    блоками с выходом на первом нуле, иначе — случайные наборы, затем выполнимость !f
+    CDCL-решателем по кодированию Цейтина.
+    """
+    if node.op in ("0", "1"):
+        return None if node.op == "1" else {name: 0 for name in variables}
+    if len(variables) <= MAX_ENUMERATE:
+        return _enumerate(node, variables, block_bits)
+    builder = builder or ExpressionBuilder()
+    return _simulate(node, variables, seed) or satisfying_assignment(builder.operation("!", node), variables)
+
+
+def _combine(op, first, second, variables):
+    builder = ExpressionBuilder()
+    # Общий builder: совпадающие подвыражения двух формул — одни и те же узлы, и x ~ x сразу даёт 1
+    node = builder.operation(op, parse(first, builder), parse(second, builder))
+    if variables is None:
+        variables = sorted(set(expression_variables(first)) | set(expression_variables(second)))
+    return node, variables, builder
+
+
+def is_tautology(expression, variables=None):
+    """(тождественно ли истинно выражение, опровергающий набор или None)"""
+    builder = ExpressionBuilder()
+    node = parse(expression, builder)
+    counterexample = find_counterexample(node, variables or expression_variables(expression), builder)
+    return counterexample is None, counterexample
+
+
+def check_equivalence(first, second, variables=None):
+    """(равносильны ли выражения, набор, на котором они различаются, или None)"""
+    node, variables, builder = _combine("~", first, second, variables)
+    counterexample = find_counterexample(node, variables, builder)
+    return counterexample is None, counterexample
+
+
+def check_implication(first, second, variables=None):
+    """(следует ли second из first, набор, где first истинно, а second ложно, или None)"""
+    node, variables, builder = _combine("->", first, second, variables)
+    counterexample = find_counterexample(node, variables, builder)
+    return counterexample is None, counterexample
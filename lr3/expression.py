@@ -0,0 +1,252 @@
+from collections import namedtuple
+
+Token = namedtuple("Token", ["kind", "value", "position"])
+
+# Приоритеты бинарных операций совпадают с infix_to_postfix: & и | на одном уровне,
+# все операции левоассоциативны. ↑ — штрих Шеффера (И-НЕ), ↓ — стрелка Пирса (ИЛИ-НЕ).
+PRECEDENCE = {"!": 3, "&": 2, "|": 2, "^": 2, "↑": 2, "↓": 2, "->": 1, "~": 1}
+BINARY_OPERATORS = ("&", "|", "^", "↑", "↓", "->", "~")
+CONSTANTS = ("0", "1")
+KEYWORDS = {"xor": "^", "nand": "↑", "nor": "↓"}
+
+
+class ExpressionSyntaxError(ValueError):
+    """Синтаксическая ошибка в логическом выражении с позицией символа (с нуля)"""
+
+    def __init__(self, message, position):
+        super().__init__(f"{message} (позиция {position})")
+        self.position = position
+
+
+def tokenize(text):
+    """
+    Разбивает выражение на токены: имена переменных (x1, Q2, Cin), константы 0 и 1,
+    операции ! & | ^ ↑ ↓ -> ~ (и слова xor, nand, nor) и скобки.
+    """
+    tokens = []
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char.isspace():
+            i += 1
+        elif char.isalpha() or char == '_':
+            start = i
+            while i < len(text) and (text[i].isalnum() or text[i] == '_'):
+                i += 1
+            word = text[start:i]
+            if word in KEYWORDS:
+                tokens.append(Token("op", KEYWORDS[word], start))
+            else:
+                tokens.append(Token("name", word, start))
+        elif char.isdigit():
+            start = i
+            while i < len(text) and text[i].isalnum():
+                i += 1
+            if text[start:i] not in CONSTANTS:
+                raise ExpressionSyntaxError(f"Ожидалась константа 0 или 1, получено {text[start:i]!r}", start)
+            tokens.append(Token("const", text[start:i], start))
+        elif text.startswith("->", i):
+            tokens.append(Token("op", "->", i))
+            i += 2
+        elif char in "!&|^↑↓~":
+            tokens.append(Token("op", char, i))
+            i += 1
+        elif char in "()":
+            tokens.append(Token(char, char, i))
+            i += 1
+        else:
+            raise ExpressionSyntaxError(f"Неизвестный символ {char!r}", i)
+    return tokens
+
+
+def expression_variables(text):
+    """Отсортированный список имён переменных выражения"""
+    return sorted({token.value for token in tokenize(text) if token.kind == "name"})
+
+
+class Node:
+    """
+    Узел дерева выражения. op — 'var', '0', '1', '!' или бинарная операция,
+    name — имя переменной. Узлы создаются только через ExpressionBuilder,
+    поэтому одинаковые подвыражения — один и тот же объект.
+    """
+    __slots__ = ("op", "operands", "name")
+
+    def __init__(self, op, operands=(), name=None):
+        self.op = op
+        self.operands = operands
+        self.name = name
+
+    def __repr__(self):
+        if self.op == "var":
+            return self.name
+        if self.op in CONSTANTS:
+            return self.op
+        if self.op == "!":
+            return f"!{self.operands[0]!r}"
+        return f"({self.operands[0]!r} {self.op} {self.operands[1]!r})"
+
+
+class ExpressionBuilder:
+    """
+    Создаёт узлы с разделением общих подвыражений и (при fold=True)
+    свёрткой констант и тривиальных тождеств вроде x & x, x ^ x, !!x.
+    """
+
+    def __init__(self, fold=True):
+        self.fold = fold
+        self.nodes = {}
+
+    def _intern(self, op, operands=(), name=None):
+        key = (op, name, tuple(id(operand) for operand in operands))
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = Node(op, operands, name)
+        return node
+
+    def variable(self, name):
+        return self._intern("var", name=name)
+
+    def constant(self, value):
+        return self._intern("1" if value else "0")
+
+    def operation(self, op, *operands):
+        if self.fold:
+            folded = self._fold(op, operands)
+            if folded is not None:
+                return folded
+        return self._intern(op, operands)
+
+    def _fold(self, op, operands):
+        if op == "!":
+            (a,) = operands
+            if a.op in CONSTANTS:
+                return self.constant(a.op == "0")
+            if a.op == "!":
+                return a.operands[0]
+            return None
+        a, b = operands
+        if op in ("↑", "↓") and (a.op in CONSTANTS or b.op in CONSTANTS or a is b):
+            return self.operation("!", self.operation("&" if op == "↑" else "|", a, b))
+        if op == "&":
+            if a.op == "0" or b.op == "0":
+                return self.constant(False)
+            if a.op == "1" or a is b:
+                return b
+            if b.op == "1":
+                return a
+        elif op == "|":
+            if a.op == "1" or b.op == "1":
+                return self.constant(True)
+            if a.op == "0" or a is b:
+                return b
+            if b.op == "0":
+                return a
+        elif op in ("^", "~"):
+            # x ~ y == !(x ^ y): у ~ нейтральна единица, у ^ — ноль
+            neutral, absorbing = ("0", "1") if op == "^" else ("1", "0")
+            if a is b:
+                return self.constant(op == "~")
+            if a.op == neutral:
+                return b
+            if b.op == neutral:
+                return a
+            if a.op == absorbing:
+                return self.operation("!", b)
+            if b.op == absorbing:
+                return self.operation("!", a)
+        elif op == "->":
+            if a.op == "0" or b.op == "1" or a is b:
+                return self.constant(True)
+            if a.op == "1":
+                return b
+            if b.op == "0":
+                return self.operation("!", a)
+        return None
+
+
+def parse(text, builder=None):
+    """
+    Разбирает выражение в дерево (алгоритмом сортировочной станции, без рекурсии).
+    При ошибке бросает ExpressionSyntaxError с позицией.
+    """
+    builder = builder or ExpressionBuilder()
+    operands = []
+    operators = []
+
+    def reduce():
+        token = operators.pop()
+        if token.value == "!":
+            operands.append(builder.operation("!", operands.pop()))
+        else:
+            b, a = operands.pop(), operands.pop()
+            operands.append(builder.operation(token.value, a, b))
+
+    expect_operand = True
+    for token in tokenize(text):
+        if expect_operand:
+            if token.kind == "name":
+                operands.append(builder.variable(token.value))
+                expect_operand = False
+            elif token.kind == "const":
+                operands.append(builder.constant(token.value == "1"))
+                expect_operand = False
+            elif token.kind == "(" or token.value == "!":
+                operators.append(token)
+            else:
+                raise ExpressionSyntaxError(f"Ожидался операнд, получено {token.value!r}", token.position)
+        elif token.kind == "op" and token.value in BINARY_OPERATORS:
+            while operators and operators[-1].kind != "(" and \
+                    PRECEDENCE[operators[-1].value] >= PRECEDENCE[token.value]:
+                reduce()
+            operators.append(token)
+            expect_operand = True
+        elif token.kind == ")":
+            while operators and operators[-1].kind != "(":
+                reduce()
+            if not operators:
+                raise ExpressionSyntaxError("Лишняя закрывающая скобка", token.position)
+            operators.pop()
+        else:
+            raise ExpressionSyntaxError(f"Ожидалась операция, получено {token.value!r}", token.position)
+    if expect_operand:
+        raise ExpressionSyntaxError("Неожиданный конец выражения", len(text))
+    while operators:
+        if operators[-1].kind == "(":
+            raise ExpressionSyntaxError("Незакрытая скобка", operators[-1].position)
+        reduce()
+    return operands.pop()
+
+
+def topological_order(node):
+    """Уникальные узлы дерева в порядке, где операнды идут раньше операций"""
+    order = []
+    visited = set()
+    stack = [(node, False)]
+    while stack:
+        item, expanded = stack.pop()
+        if id(item) in visited:
+            continue
+        if expanded or not item.operands:
+            visited.add(id(item))
+            order.append(item)
+        else:
+            stack.append((item, True))
+            stack.extend((operand, False) for operand in reversed(item.operands))
+    return order
+
+
+def to_postfix(node):
+    """Постфиксная запись дерева в токенах infix_to_postfix (константы — '0' и '1')"""
+    output = []
+    stack = [(node, False)]
+    while stack:
+        item, expanded = stack.pop()
+        if item.op == "var":
+            output.append(item.name)
+        elif item.op in CONSTANTS or expanded:
+            output.append(item.op)
+        else:
+            stack.append((item, True))
+            stack.extend((operand, False) for operand in reversed(item.operands))
+    return output
@@ -1,5 +1,13 @@
 from itertools import product
 
+from bitparallel import node_columns
+from cache import ResultCache, canonical_key
+from codegen import compile_postfix
+from expression import PRECEDENCE, ExpressionBuilder, expression_variables, parse, to_postfix
+from qm import merge, minimal_cover, prime_implicants, to_pair, to_pattern
+from truthtable import TruthTable
+from zhegalkin import zhegalkin_polynomial
+
 
 def implication(p, q):
     return not p or q
@@ -14,59 +22,20 @@ def generate_truth_values(n):
 
 
 def precedence(op):
-    if op == '!': return 3
-    if op in ('&', '|'): return 2
-    if op in ('->', '~'): return 1
-    return 0
+    return PRECEDENCE.get(op, 0)
 
 
 def infix_to_postfix(expression):
-    output, stack = [], []
-    i = 0
-    while i < len(expression):
-        if expression[i].isalpha():
-            output.append(expression[i])
-        elif expression[i] in "!&|":
-            while stack and precedence(stack[-1]) >= precedence(expression[i]):
-                output.append(stack.pop())
-            stack.append(expression[i])
-        elif expression[i] == '-' and i + 1 < len(expression) and expression[i + 1] == '>':
-            while stack and precedence(stack[-1]) >= precedence('->'):
-                output.append(stack.pop())
-            stack.append("->")
-            i += 1
-        elif expression[i] == '~':
-            while stack and precedence(stack[-1]) >= precedence('~'):
-                output.append(stack.pop())
-            stack.append("~")
-        elif expression[i] == '(':
-            stack.append(expression[i])
-        elif expression[i] == ')':
-            while stack and stack[-1] != '(':
-                output.append(stack.pop())
-            stack.pop()
-        i += 1
-    while stack:
-        output.append(stack.pop())
-    return output
+    """
+    Постфиксная запись выражения в том виде, как оно записано (без свёртки констант и тождеств);
+    синтаксические ошибки — ExpressionSyntaxError с позицией
+    """
+    return to_postfix(parse(expression, ExpressionBuilder(fold=False)))
 
 
 def evaluate_postfix(postfix_tokens, values):
-    stack = []
-    operators = {"&": lambda a, b: a and b, "|": lambda a, b: a or b,
-                 "!": lambda a: not a, "->": implication, "~": equivalence}
-    for token in postfix_tokens:
-        if token in values:
-            stack.append(values[token])
-        elif token in operators:
-            if token == "!":
-                stack.append(operators[token](stack.pop()))
-            else:
-                b, a = stack.pop(), stack.pop()
-                stack.append(operators[token](a, b))
-        else:
-            raise ValueError(f"Неизвестный токен: {token}")
-    return stack.pop()
+    function = compile_postfix(postfix_tokens, values)
+    return function(*values.values())
 
 
 def generate_sdnf_sknf(truth_table, variables):
@@ -90,26 +59,15 @@ def combine_implicants(implicants, n):
     Каждая импликанта представлена как кортеж (паттерн, покрытие), где:
       - паттерн – строка длины n с символами '0', '1' или '-'
       - покрытие – множество индексов минтермов, покрываемых данной импликантой.
+    Склеивание выполняет qm.merge на парах (value, mask) без попарного сравнения строк.
     """
-    new_list = []
-    used = [False] * len(implicants)
-    for i in range(len(implicants)):
-        for j in range(i + 1, len(implicants)):
-            p1, cov1 = implicants[i]
-            p2, cov2 = implicants[j]
-            # Находим позиции, где разные символы
-            diffs = [k for k in range(n) if p1[k] != p2[k]]
-            if len(diffs) == 1:
-                idx = diffs[0]
-                new_pattern = p1[:idx] + '-' + p1[idx + 1:]
-                new_cov = cov1 | cov2
-                candidate = (new_pattern, new_cov)
-                if candidate not in new_list:
-                    new_list.append(candidate)
-                used[i] = True
-                used[j] = True
-    primes = [implicants[i] for i in range(len(implicants)) if not used[i]]
-    return new_list, primes
+    terms = {}
+    for pattern, cover in implicants:
+        key = to_pair(pattern)
+        terms[key] = terms[key] | cover if key in terms else cover
+    merged, primes = merge(terms, n)
+    new_list = [(to_pattern(value, mask, n), cover) for (value, mask), cover in merged.items()]
+    return new_list, [(to_pattern(value, mask, n), cover) for (value, mask), cover in primes]
 
 def generate_prime_implicants(minterm_patterns):
     """
@@ -134,30 +92,18 @@ def literal_count(pattern):
 
 def select_minimal_cover(prime_implicants, total_minterms):
     """
-    Перебором выбирает такое подмножество простых импликант, сумма
-    которого покрывает все минтермы и имеет минимальную «стоимость» (сумму количества литералов).
+    Выбирает такое подмножество простых импликант, сумма которого покрывает все минтермы
+    и имеет минимальную «стоимость» (сумму количества литералов), через qm.minimal_cover.
     """
-    best_cover = None
-    best_cost = float('inf')
-
-    def backtrack(selected, covered, start):
-        nonlocal best_cover, best_cost
-        if covered == total_minterms:
-            cost = sum(literal_count(prime_implicants[i][0]) for i in selected)
-            if cost < best_cost:
-                best_cost = cost
-                best_cover = selected.copy()
-            return
-        for i in range(start, len(prime_implicants)):
-            new_covered = covered | prime_implicants[i][1]
-            if new_covered != covered:
-                selected.append(i)
-                backtrack(selected, new_covered, i + 1)
-                selected.pop()
-    backtrack([], set(), 0)
-    if best_cover is None:
+    positions = {m: i for i, m in enumerate(sorted(total_minterms))}
+    covers = [sum(1 << positions[m] for m in cover if m in positions) for _, cover in prime_implicants]
+    covered = 0
+    for cover in covers:
+        covered |= cover
+    if covered != (1 << len(positions)) - 1:
         return []
-    return [prime_implicants[i] for i in best_cover]
+    rows, _ = minimal_cover(covers, [literal_count(pattern) for pattern, _ in prime_implicants])
+    return [prime_implicants[i] for i in rows]
 
 def minimize_sdnf_by_calculation_method(sdnf, variables):
     """
@@ -674,44 +620,9 @@ def qm_prime_implicants(minterms, num_vars):
     Возвращает список простых импликант в виде кортежей (битовая строка, множество минтермов),
     где в битовой строке символ '-' означает «не важно».
     """
-    # Начальное представление: каждый минтерм превращается в битовую строку длины num_vars
-    terms = [(format(m, f"0{num_vars}b"), {m}) for m in sorted(minterms)]
-    prime_implicants = []
-    while True:
-        used = [False] * len(terms)
-        new_terms = []
-        # Сравниваем все пары терминов
-        for i in range(len(terms)):
-            for j in range(i + 1, len(terms)):
-                bits1, mts1 = terms[i]
-                bits2, mts2 = terms[j]
-                diff_count = 0
-                new_bits = []
-                for b1, b2 in zip(bits1, bits2):
-                    if b1 != b2:
-                        # Если оба бита явно заданы и различны
-                        if b1 != '-' and b2 != '-':
-                            diff_count += 1
-                            new_bits.append('-')
-                        else:
-                            diff_count = 999
-                            break
-                    else:
-                        new_bits.append(b1)
-                if diff_count == 1:
-                    used[i] = True
-                    used[j] = True
-                    candidate = ("".join(new_bits), mts1 | mts2)
-                    if candidate not in new_terms:
-                        new_terms.append(candidate)
-        # Все термы, которые не были объединены, являются простыми импликанантами
-        for idx, flag in enumerate(used):
-            if not flag and terms[idx] not in prime_implicants:
-                prime_implicants.append(terms[idx])
-        if not new_terms:
-            break
-        terms = new_terms
-    return prime_implicants
+    minterms = sorted(set(minterms))
+    return [(to_pattern(value, mask, num_vars), {m for i, m in enumerate(minterms) if cover >> i & 1})
+            for (value, mask), cover in prime_implicants(minterms, num_vars)]
 
 
 def prime_implicant_chart(prime_implicants, minterms):
@@ -742,33 +653,28 @@ def select_essential_primes(chart):
 
 def choose_cover(chart, prime_implicants, essential):
     """
-    Для оставшихся (не покрытых обязательными) минтермов с помощью перебора
-    выбирается такое минимальное покрытие, чтобы суммарное число литералов было минимальным.
+    Для оставшихся (не покрытых обязательными) минтермов выбирается покрытие
+    из наименьшего числа импликант, а среди них — с минимальным суммарным числом литералов.
     """
     covered = set()
     for e in essential:
         covered |= prime_implicants[e][1]
-    remaining = set(chart.keys()) - covered
-    non_essential = set(range(len(prime_implicants))) - essential
-    best = None
-    best_cost = float('inf')
-    non_essential_list = list(non_essential)
-    n = len(non_essential_list)
-    from itertools import combinations
-    for r in range(1, n + 1):
-        for combo in combinations(non_essential_list, r):
-            cover = set()
-            for idx in combo:
-                cover |= prime_implicants[idx][1]
-            if remaining.issubset(cover):
-                # Вычисляем «стоимость» набора как сумму количества установленных битов (не '-')
-                cost = sum(sum(1 for ch in prime_implicants[idx][0] if ch != '-') for idx in combo)
-                if cost < best_cost:
-                    best_cost = cost
-                    best = set(combo)
-        if best is not None:
-            break
-    return best if best is not None else set()
+    remaining = sorted(set(chart.keys()) - covered)
+    non_essential = sorted(set(range(len(prime_implicants))) - essential)
+    if not remaining:
+        return set()
+    positions = {m: i for i, m in enumerate(remaining)}
+    covers = [sum(1 << positions[m] for m in prime_implicants[idx][1] if m in positions) for idx in non_essential]
+    literals = [sum(1 for ch in prime_implicants[idx][0] if ch != '-') for idx in non_essential]
+    # Вес импликанты больше суммы литералов любого набора: сначала число импликант, затем литералы
+    weight = sum(literals) + 1
+    rows, _ = minimal_cover(covers, [weight + count for count in literals])
+    covered_bits = 0
+    for row in rows:
+        covered_bits |= covers[row]
+    if covered_bits != (1 << len(remaining)) - 1:
+        return set()
+    return {non_essential[row] for row in rows}
 
 
 def implicant_to_term(implicant, variables, is_sdnf=True):
@@ -842,29 +748,42 @@ def minimize_5var_karnaugh(truth_table, variables, is_sdnf=True):
     return minimized
 
 
-def truth_table(expression, variables):
-    postfix_tokens = infix_to_postfix(expression)
-    table = []
+def analyze(expression, variables, cache=None):
+    """
+    Таблица истинности и минимизация расчетным методом: (TruthTable, СДНФ, СКНФ).
+    С cache (ResultCache) результат ищется по канонической записи выражения и сохраняется.
+    """
+    node = parse(expression)
+    key = canonical_key(node, variables) if cache is not None else None
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return TruthTable(variables, int(cached["bits"], 16)), cached["minimized_sdnf"], cached["minimized_sknf"]
+    function = TruthTable(variables, node_columns(node, variables))
+    sdnf, sknf, _, _ = generate_sdnf_sknf(function.to_rows(), variables)
+    minimized_sdnf = minimize_sdnf_by_calculation_method(sdnf, variables)
+    minimized_sknf = minimize_sknf_by_calculation_method(sknf, variables)
+    if key is not None:
+        cache.put(key, {"bits": format(function.bits, "x"), "minimized_sdnf": minimized_sdnf,
+                        "minimized_sknf": minimized_sknf})
+    return function, minimized_sdnf, minimized_sknf
+
+
+def truth_table(expression, variables, cache=None):
+    function, minimized_sdnf, minimized_sknf = analyze(expression, variables, cache)
+    table = function.to_rows()
     print(" | ".join(variables) + " | Result")
     print("-" * (len(variables) * 4 + 10))
-    for values in generate_truth_values(len(variables)):
-        values_dict = dict(zip(variables, values))
-        result = evaluate_postfix(postfix_tokens, values_dict)
-        row = [int(values_dict[var]) for var in variables] + [int(result)]
-        table.append(row)
+    for row in table:
         print(" | ".join(map(str, row)))
     sdnf, sknf, sdnf_indices, sknf_indices = generate_sdnf_sknf(table, variables)
-    index_bits = [str(row[-1]) for row in table]
-    index_binary = ''.join(index_bits)
-    index_decimal = int(index_binary, 2)
-    index_form = f"{index_decimal} - {index_binary}"
+    index_form = function.index_form()
     print("\nСДНФ:", sdnf)
     print("Числовая форма СДНФ:", ", ".join(sdnf_indices))
     print("СКНФ:", sknf)
     print("Числовая форма СКНФ:", ", ".join(sknf_indices))
     print("Индексная форма функции:", index_form)
-    minimized_sdnf = minimize_sdnf_by_calculation_method(sdnf, variables)
-    minimized_sknf = minimize_sknf_by_calculation_method(sknf, variables)
+    print("Полином Жегалкина:", zhegalkin_polynomial(function))
     print("\nМинимизированная СДНФ (расчетный метод):", minimized_sdnf)
     print("Минимизированная СКНФ (расчетный метод):", minimized_sknf)
     minimized_sdnf_spreadsheet = minimize_sdnf_by_calculation_spreadsheet_method(sdnf, variables)
@@ -888,9 +807,10 @@ def truth_table(expression, variables):
 
 
 if __name__ == "__main__":
-    expression = input("Введите логическое выражение (a, b, c, d, e, &, |, !, ->, ~): ")
-    variables = sorted(set(filter(str.isalpha, expression)))
-    truth_table(expression, variables)
+    expression = input("Введите логическое выражение (переменные, 0, 1, &, |, !, ^, ↑, ↓, ->, ~): ")
+    variables = expression_variables(expression)
+    with ResultCache() as cache:
+        truth_table(expression, variables, cache)
 
 # (((a->b)~(c->d))->e)
 # (((a->b)->(c->d))->e)
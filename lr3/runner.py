@@ -0,0 +1,116 @@
+import argparse
+import json
+import sys
+import time
+from functools import partial
+from multiprocessing import Pool
+
+from bitparallel import expression_table
+from expression import expression_variables, parse, to_postfix
+from main import generate_sdnf_sknf, minimize_sdnf_by_calculation_method, minimize_sknf_by_calculation_method
+
+
+def read_expressions(stream):
+    """Лениво читает выражения по одному в строке; пустые строки и строки с '#' пропускаются"""
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def normalize(expression):
+    """
+    Ключ для устранения повторов: переменные и постфиксная запись после свёртки,
+    так что выражения, отличающиеся пробелами или лишними скобками, совпадают.
+    """
+    try:
+        return tuple(expression_variables(expression)), tuple(to_postfix(parse(expression)))
+    except ValueError:
+        return None, expression
+
+
+def evaluate_expression(expression, minimize=False):
+    """Таблица истинности выражения в виде словаря, пригодного для записи в JSON"""
+    response = {'expression': expression}
+    try:
+        table = expression_table(expression)
+    except ValueError as error:
+        response['error'] = str(error)
+        return response
+    variables = list(table.variables)
+    response['variables'] = variables
+    response['index_form'] = table.index_form()
+    response['sdnf'] = list(table.minterms())
+    response['sknf'] = list(table.maxterms())
+    if minimize:
+        sdnf, sknf, _, _ = generate_sdnf_sknf(table.to_rows(), variables)
+        response['minimized_sdnf'] = minimize_sdnf_by_calculation_method(sdnf, variables)
+        response['minimized_sknf'] = minimize_sknf_by_calculation_method(sknf, variables)
+    return response
+
+
+def _evaluate_json(expression, minimize=False):
+    # В процессе-исполнителе сразу сериализуем всё, кроме текста выражения
+    response = evaluate_expression(expression, minimize)
+    del response['expression']
+    return json.dumps(response, ensure_ascii=False)
+
+
+def run_batch(expressions, output, workers=1, chunk_size=64, minimize=False):
+    """
+    Нормализует и вычисляет выражения пулом процессов (одинаковые после normalize —
+    один раз) и пишет по строке JSON на каждое входное выражение в исходном порядке.
+    Возвращает (число выражений, число уникальных, время в секундах).
+    """
+    start = time.perf_counter()
+    expressions = list(expressions)
+    evaluate = partial(_evaluate_json, minimize=minimize)
+
+    def process(parallel_map):
+        keys = list(parallel_map(normalize, expressions))
+        first = {}
+        for key, expression in zip(keys, expressions):
+            first.setdefault(key, expression)
+        pending = zip(first, parallel_map(evaluate, first.values()))
+        known = {}
+        for key, expression in zip(keys, expressions):
+            while key not in known:
+                done_key, body = next(pending)
+                known[done_key] = body
+            output.write('{"expression": ' + json.dumps(expression, ensure_ascii=False) + ", " + known[key][1:] + "\n")
+        return len(first)
+
+    if workers > 1:
+        with Pool(workers) as pool:
+            unique = process(lambda function, items: pool.imap(function, items, chunksize=chunk_size))
+    else:
+        unique = process(map)
+    output.flush()
+    return len(expressions), unique, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетное построение таблиц истинности")
+    parser.add_argument("--input", default="-", help="файл с выражениями или '-' для stdin")
+    parser.add_argument("--output", default="-", help="файл для результатов или '-' для stdout")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--minimize", action="store_true", help="добавить минимизированные СДНФ и СКНФ")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        count, unique, elapsed = run_batch(read_expressions(source), output, args.workers,
+                                           args.chunk_size, args.minimize)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    rate = count / elapsed if elapsed else float('inf')
+    print(f"Выражений: {count} (уникальных {unique}) за {elapsed:.3f} с ({rate:.0f} выр/с)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,421 @@
+import argparse
+import heapq
+import sys
+
+from expression import ExpressionBuilder, expression_variables, parse, topological_order
+
+RESTART_BASE = 100
+ACTIVITY_DECAY = 0.95
+LEARNED_LIMIT = 2000
+
+
+def _luby(i):
+    # Последовательность Луби 1, 1, 2, 1, 1, 2, 4, ... (i с нуля)
+    size, power = 1, 0
+    while size < i + 1:
+        power += 1
+        size = 2 * size + 1
+    while size - 1 != i:
+        size = (size - 1) >> 1
+        power -= 1
+        i %= size
+    return 1 << power
+
+
+class SATSolver:
+    """
+    CDCL-решатель: два наблюдаемых литерала, выучивание дизъюнктов по первой точке
+    единственной импликации, выбор переменной по активности (VSIDS), сохранение фазы,
+    перезапуски по последовательности Луби и чистка выученных дизъюнктов.
+    Литералы снаружи — ненулевые целые в духе DIMACS: v или -v, переменные с единицы.
+    Внутри литерал кодируется числом 2 * v + (1 для отрицания), так что отрицание — code ^ 1.
+    """
+
+    def __init__(self):
+        self.num_variables = 0
+        self.clauses = []
+        self.learned = []
+        self.unsatisfiable = False
+        self.model = None
+        self.conflicts = self.decisions = self.propagations = 0
+        self._watches = [[], []]
+        self._values = [-1, -1]
+        self._levels = [0]
+        self._reasons = [None]
+        self._activity = [0.0]
+        self._phase = [1]
+        self._seen = [False]
+        self._trail = []
+        self._trail_limits = []
+        self._head = 0
+        self._heap = []
+        self._increment = 1.0
+        self._lbd = {}
+
+    def new_variable(self):
+        self.num_variables += 1
+        v = self.num_variables
+        self._watches += [[], []]
+        self._values += [-1, -1]
+        self._levels.append(0)
+        self._reasons.append(None)
+        self._activity.append(0.0)
+        self._phase.append(1)
+        self._seen.append(False)
+        heapq.heappush(self._heap, (0.0, v))
+        return v
+
+    def add_clause(self, literals):
+        """Добавляет дизъюнкт; возвращает False, если задача стала невыполнимой"""
+        if self.unsatisfiable:
+            return False
+        for literal in literals:
+            if literal == 0:
+                raise ValueError("Литерал 0 недопустим")
+            while abs(literal) > self.num_variables:
+                self.new_variable()
+        codes = []
+        for code in sorted({2 * abs(literal) + (literal < 0) for literal in literals}):
+            value = self._values[code]
+            if value == 1 or code ^ 1 in codes:
+                return True
+            if value == -1:
+                codes.append(code)
+        if not codes:
+            self.unsatisfiable = True
+            return False
+        if len(codes) == 1:
+            self._assign(codes[0], None)
+            if self._propagate() is not None:
+                self.unsatisfiable = True
+            return not self.unsatisfiable
+        self._attach(codes)
+        return True
+
+    def _attach(self, codes, lbd=None):
+        index = len(self.clauses)
+        self.clauses.append(codes)
+        self._watches[codes[0]].append(index)
+        self._watches[codes[1]].append(index)
+        if lbd is not None:
+            self.learned.append(index)
+            self._lbd[index] = lbd
+        return index
+
+    def _assign(self, code, reason):
+        self._values[code] = 1
+        self._values[code ^ 1] = 0
+        v = code >> 1
+        self._levels[v] = len(self._trail_limits)
+        self._reasons[v] = reason
+        self._trail.append(code)
+
+    def _propagate(self):
+        # Возвращает номер противоречивого дизъюнкта или None
+        values, clauses, watches = self._values, self.clauses, self._watches
+        while self._head < len(self._trail):
+            false_code = self._trail[self._head] ^ 1
+            self._head += 1
+            self.propagations += 1
+            watchers = watches[false_code]
+            i = j = 0
+            while i < len(watchers):
+                index = watchers[i]
+                i += 1
+                clause = clauses[index]
+                if clause is None:
+                    continue
+                if clause[0] == false_code:
+                    clause[0], clause[1] = clause[1], false_code
+                first = clause[0]
+                if values[first] == 1:
+                    watchers[j] = index
+                    j += 1
+                    continue
+                for k in range(2, len(clause)):
+                    if values[clause[k]] != 0:
+                        clause[1], clause[k] = clause[k], false_code
+                        watches[clause[1]].append(index)
+                        break
+                else:
+                    watchers[j] = index
+                    j += 1
+                    if values[first] == 0:
+                        while i < len(watchers):
+                            watchers[j] = watchers[i]
+                            i += 1
+                            j += 1
+                        del watchers[j:]
+                        return index
+                    self._assign(first, index)
+            del watchers[j:]
+        return None
+
+    def _bump(self, v):
+        activity = self._activity
+        activity[v] += self._increment
+        if activity[v] > 1e100:
+            for u in range(1, self.num_variables + 1):
+                activity[u] *= 1e-100
+            self._increment *= 1e-100
+            self._heap = [(-activity[u], u) for u in range(1, self.num_variables + 1) if self._values[2 * u] == -1]
+            heapq.heapify(self._heap)
+        elif self._values[2 * v] == -1:
+            heapq.heappush(self._heap, (-activity[v], v))
+
+    def _analyze(self, conflict):
+        # Первая точка единственной импликации: (выученный дизъюнкт, уровень возврата)
+        seen, levels, reasons, trail = self._seen, self._levels, self._reasons, self._trail
+        level = len(self._trail_limits)
+        learned = [None]
+        counter = 0
+        index = len(trail) - 1
+        clause = self.clauses[conflict]
+        start = 0
+        while True:
+            for code in clause[start:]:
+                v = code >> 1
+                if not seen[v] and levels[v] > 0:
+                    seen[v] = True
+                    self._bump(v)
+                    if levels[v] == level:
+                        counter += 1
+                    else:
+                        learned.append(code)
+            while not seen[trail[index] >> 1]:
+                index -= 1
+            code = trail[index]
+            index -= 1
+            v = code >> 1
+            seen[v] = False
+            counter -= 1
+            if counter == 0:
+                break
+            clause = self.clauses[reasons[v]]
+            start = 1
+        learned[0] = code ^ 1
+        # Литерал лишний, если все остальные литералы его причины уже в дизъюнкте
+        kept = [learned[0]]
+        for code in learned[1:]:
+            reason = reasons[code >> 1]
+            if reason is None or any(not seen[other >> 1] and levels[other >> 1] > 0
+                                     for other in self.clauses[reason][1:]):
+                kept.append(code)
+        for code in learned[1:]:
+            seen[code >> 1] = False
+        if len(kept) == 1:
+            return kept, 0
+        best = max(range(1, len(kept)), key=lambda k: levels[kept[k] >> 1])
+        kept[1], kept[best] = kept[best], kept[1]
+        return kept, levels[kept[1] >> 1]
+
+    def _backtrack(self, level):
+        if len(self._trail_limits) <= level:
+            return
+        start = self._trail_limits[level]
+        for code in self._trail[start:]:
+            v = code >> 1
+            self._values[code] = self._values[code ^ 1] = -1
+            self._reasons[v] = None
+            self._phase[v] = code & 1
+            heapq.heappush(self._heap, (-self._activity[v], v))
+        del self._trail[start:]
+        del self._trail_limits[level:]
+        self._head = start
+
+    def _decide(self):
+        while self._heap:
+            _, v = heapq.heappop(self._heap)
+            if self._values[2 * v] == -1:
+                return 2 * v + self._phase[v]
+        return None
+
+    def _reduce(self):
+        # Удаляет половину выученных дизъюнктов с наибольшим LBD, кроме служащих причинами
+        def locked(index):
+            first = self.clauses[index][0]
+            return self._values[first] == 1 and self._reasons[first >> 1] == index
+
+        candidates = sorted(self.learned, key=lambda index: (self._lbd[index], len(self.clauses[index])))
+        keep = len(candidates) // 2
+        survivors = candidates[:keep]
+        for index in candidates[keep:]:
+            if self._lbd[index] <= 2 or locked(index):
+                survivors.append(index)
+            else:
+                self.clauses[index] = None
+                del self._lbd[index]
+        self.learned = survivors
+
+    def solve(self):
+        """True, если дизъюнкты выполнимы (набор — в model: {переменная: bool}), иначе False"""
+        self.model = None
+        if self.unsatisfiable or self._propagate() is not None:
+            self.unsatisfiable = True
+            return False
+        learned_limit = max(LEARNED_LIMIT, len(self.clauses) // 3)
+        restarts = 0
+        while True:
+            budget = _luby(restarts) * RESTART_BASE
+            restarts += 1
+            while True:
+                conflict = self._propagate()
+                if conflict is not None:
+                    self.conflicts += 1
+                    budget -= 1
+                    if not self._trail_limits:
+                        self.unsatisfiable = True
+                        return False
+                    learned, level = self._analyze(conflict)
+                    self._backtrack(level)
+                    if len(learned) == 1:
+                        self._assign(learned[0], None)
+                    else:
+                        lbd = len({self._levels[code >> 1] for code in learned})
+                        self._assign(learned[0], self._attach(learned, lbd))
+                    self._increment /= ACTIVITY_DECAY
+                    continue
+                if budget <= 0:
+                    self._backtrack(0)
+                    break
+                if len(self.learned) - len(self._trail) > learned_limit:
+                    self._reduce()
+                    learned_limit = int(learned_limit * 1.1)
+                code = self._decide()
+                if code is None:
+                    self.model = {v: self._values[2 * v] == 1 for v in range(1, self.num_variables + 1)}
+                    self._backtrack(0)
+                    return True
+                self.decisions += 1
+                self._trail_limits.append(len(self._trail))
+                self._assign(code, None)
+
+
+def _literal(name, names, solver):
+    negative = name.startswith("!")
+    name = name.lstrip("!").strip()
+    if name not in names:
+        names[name] = solver.new_variable()
+    return -names[name] if negative else names[name]
+
+
+def from_clauses(clauses, solver=None, names=None):
+    """
+    Решатель по списку дизъюнктов из строковых литералов ('a', '!a'); '-' пропускается,
+    так что подходят термы parse_logic_expression(expr, is_dnf=False).
+    Возвращает (решатель, словарь имя -> номер переменной).
+    """
+    solver = solver or SATSolver()
+    names = {} if names is None else names
+    for clause in clauses:
+        solver.add_clause([_literal(item, names, solver) for item in clause if item.strip() not in ("", "-")])
+    return solver, names
+
+
+def from_cnf(text, solver=None, names=None):
+    """Решатель по КНФ в записи generate_sdnf_sknf: '(a | !b) & (!a | c)'"""
+    clauses = [[literal.strip() for literal in clause.strip().strip("()").split("|")]
+               for clause in text.split("&") if clause.strip()]
+    return from_clauses(clauses, solver, names)
+
+
+def read_dimacs(stream, solver=None):
+    """Решатель по файлу в формате DIMACS CNF (строки 'c' и 'p' пропускаются)"""
+    solver = solver or SATSolver()
+    literals = []
+    for line in stream:
+        line = line.strip()
+        if not line or line[0] in "cp%":
+            continue
+        for item in line.split():
+            literal = int(item)
+            if literal == 0:
+                solver.add_clause(literals)
+                literals = []
+            else:
+                literals.append(literal)
+    if literals:
+        solver.add_clause(literals)
+    return solver
+
+
+def tseitin(node, solver=None, names=None):
+    """
+    Кодирование Цейтина: на каждую бинарную операцию дерева — новая переменная и
+    три-четыре дизъюнкта, задающие её значение; отрицание — смена знака литерала.
+    Возвращает (решатель, имя -> номер переменной, литерал корня); корень не утверждается.
+    """
+    solver = solver or SATSolver()
+    names = {} if names is None else names
+    literals = {}
+    for item in topological_order(node):
+        if item.op == "var":
+            if item.name not in names:
+                names[item.name] = solver.new_variable()
+            literal = names[item.name]
+        elif item.op in ("0", "1"):
+            literal = solver.new_variable()
+            solver.add_clause([literal if item.op == "1" else -literal])
+        elif item.op == "!":
+            literal = -literals[id(item.operands[0])]
+        else:
+            a, b = (literals[id(operand)] for operand in item.operands)
+            # ↑ ↓ ~ — отрицания & | ^, а a -> b — это !a | b
+            base, negate = {"&": ("&", 1), "|": ("|", 1), "^": ("^", 1), "↑": ("&", -1),
+                            "↓": ("|", -1), "~": ("^", -1), "->": ("|", 1)}[item.op]
+            if item.op == "->":
+                a = -a
+            x = solver.new_variable()
+            if base == "&":
+                clauses = [[-x, a], [-x, b], [x, -a, -b]]
+            elif base == "|":
+                clauses = [[x, -a], [x, -b], [-x, a, b]]
+            else:
+                clauses = [[-x, a, b], [-x, -a, -b], [x, -a, b], [x, a, -b]]
+            for clause in clauses:
+                solver.add_clause(clause)
+            literal = negate * x
+        literals[id(item)] = literal
+    return solver, names, literals[id(node)]
+
+
+def satisfying_assignment(node, variables=()):
+    """Набор (имя -> 0/1), на котором дерево равно 1, или None; variables дополняются нулями"""
+    if node.op in ("0", "1"):
+        return {name: 0 for name in variables} if node.op == "1" else None
+    solver, names, root = tseitin(node)
+    if not solver.add_clause([root]) or not solver.solve():
+        return None
+    assignment = {name: 0 for name in variables}
+    assignment.update((name, int(solver.model[v])) for name, v in names.items())
+    return assignment
+
+
+def is_satisfiable(expression):
+    """
+    (выполнимо ли выражение, выполняющий набор или None). Набор задаёт все переменные
+    выражения, в том числе исчезнувшие при свёртке констант
+    """
+    assignment = satisfying_assignment(parse(expression, ExpressionBuilder()), expression_variables(expression))
+    return assignment is not None, assignment
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Проверка выполнимости КНФ в формате DIMACS")
+    parser.add_argument("input", nargs="?", default="-", help="файл DIMACS или '-' для stdin")
+    args = parser.parse_args(argv)
+    if args.input == "-":
+        solver = read_dimacs(sys.stdin)
+    else:
+        with open(args.input, encoding="utf-8") as source:
+            solver = read_dimacs(source)
+    if solver.solve():
+        print("s SATISFIABLE")
+        print("v " + " ".join(str(v if value else -v) for v, value in solver.model.items()) + " 0")
+    else:
+        print("s UNSATISFIABLE")
+    print(f"c conflicts {solver.conflicts} decisions {solver.decisions}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import argparse
+import sys
+from itertools import product
+
+from bitparallel import column_blocks, decimal_string
+from expression import expression_variables, parse
+
+# Десятичная часть индексной формы требует всего столбца в памяти, поэтому пишется только до этого n
+DECIMAL_INDEX_LIMIT = 20
+
+
+def iter_truth_values(n):
+    """Ленивый аналог generate_truth_values: наборы значений по одному, кортежами"""
+    return product((False, True), repeat=n)
+
+
+def iter_rows(expression, variables, block_bits=16):
+    """Лениво выдаёт строки таблицы истинности [значения переменных..., результат]"""
+    n = len(variables)
+    for start, column in column_blocks(parse(expression), variables, block_bits):
+        size = min(1 << block_bits, 1 << n)
+        for offset, bit in enumerate(format(column, f"0{size}b")):
+            index = start + offset
+            yield [index >> (n - 1 - i) & 1 for i in range(n)] + [int(bit)]
+
+
+def _literal_parts(names, size):
+    # Для каждого набора младших переменных: строка значений, терм СДНФ и дизъюнкт СКНФ
+    k = len(names)
+    values, terms, clauses = [], [], []
+    for index in range(size):
+        bits = [index >> (k - 1 - i) & 1 for i in range(k)]
+        values.append(" | ".join(map(str, bits)))
+        terms.append(" & ".join(var if bit else f"!{var}" for var, bit in zip(names, bits)))
+        clauses.append(" | ".join(f"!{var}" if bit else var for var, bit in zip(names, bits)))
+    return values, terms, clauses
+
+
+class _Joiner:
+    """Пишет элементы через разделитель, не собирая их в одну строку"""
+
+    def __init__(self, output, separator):
+        self.output = output
+        self.separator = separator
+        self.empty = True
+
+    def write(self, items):
+        if items:
+            self.output.write(("" if self.empty else self.separator) + self.separator.join(items))
+            self.empty = False
+
+
+def _join(parts, separator):
+    return separator.join(part for part in parts if part)
+
+
+def _write_indices(output, blocks, value):
+    joiner = _Joiner(output, ", ")
+    for _, start, bits in blocks:
+        joiner.write([str(start + i) for i, bit in enumerate(bits) if bit == value])
+
+
+def write_truth_table(expression, variables, output=None, block_bits=16, progress=None):
+    """
+    Пишет в output то же, что печатает truth_table (таблицу, СДНФ, СКНФ, числовые
+    и индексную формы), но по блокам из 2 ** block_bits строк за несколько проходов,
+    так что память не растёт с числом переменных. progress(stage, done, total)
+    вызывается после каждого блока.
+    """
+    output = output or sys.stdout
+    node = parse(expression)
+    n = len(variables)
+    total = 1 << n
+    k = min(block_bits, n)
+    high_names, low_names = variables[:n - k], variables[n - k:]
+    low_values, low_terms, low_clauses = _literal_parts(low_names, 1 << k)
+
+    def blocks(stage):
+        for start, column in column_blocks(node, variables, block_bits):
+            prefix_bits = [start >> (n - 1 - i) & 1 for i in range(len(high_names))]
+            yield prefix_bits, start, format(column, f"0{1 << k}b")
+            if progress:
+                progress(stage, start + (1 << k), total)
+
+    output.write(" | ".join(variables) + " | Result\n")
+    output.write("-" * (n * 4 + 10) + "\n")
+    for prefix_bits, start, bits in blocks("таблица"):
+        prefix = [" | ".join(map(str, prefix_bits))]
+        output.write("".join(_join(prefix + [low_values[i], bit], " | ") + "\n" for i, bit in enumerate(bits)))
+
+    output.write("\nСДНФ: ")
+    joiner = _Joiner(output, " | ")
+    for prefix_bits, start, bits in blocks("СДНФ"):
+        prefix = [" & ".join(var if bit else f"!{var}" for var, bit in zip(high_names, prefix_bits))]
+        joiner.write([f"({_join(prefix + [low_terms[i]], ' & ')})" for i, bit in enumerate(bits) if bit == "1"])
+    output.write("\nЧисловая форма СДНФ: ")
+    _write_indices(output, blocks("числовая форма СДНФ"), "1")
+
+    output.write("\nСКНФ: ")
+    joiner = _Joiner(output, " & ")
+    for prefix_bits, start, bits in blocks("СКНФ"):
+        prefix = [" | ".join(f"!{var}" if bit else var for var, bit in zip(high_names, prefix_bits))]
+        joiner.write([f"({_join(prefix + [low_clauses[i]], ' | ')})" for i, bit in enumerate(bits) if bit == "0"])
+    output.write("\nЧисловая форма СКНФ: ")
+    _write_indices(output, blocks("числовая форма СКНФ"), "0")
+
+    output.write("\nИндексная форма функции: ")
+    column = 0
+    if n <= DECIMAL_INDEX_LIMIT:
+        for _, _, bits in blocks("индексная форма"):
+            column = column << len(bits) | int(bits, 2)
+        output.write(decimal_string(column) + " - ")
+    for _, _, bits in blocks("индексная форма"):
+        output.write(bits)
+    output.write("\n")
+    output.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Потоковый вывод таблицы истинности и нормальных форм")
+    parser.add_argument("expression")
+    parser.add_argument("--output", default="-", help="файл для результата или '-' для stdout")
+    parser.add_argument("--block-bits", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    def report(stage, done, total):
+        print(f"\r{stage}: {done * 100 // total}%", end="", file=sys.stderr)
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        write_truth_table(args.expression, expression_variables(args.expression), output,
+                          args.block_bits, report)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,30 @@
 import unittest
 from io import StringIO
 from contextlib import redirect_stdout
+import json
+import random
 import sys
 
 
-from main12 import *
+from main import *
+from cache import CACHE_VERSION, ResultCache, canonical_key
+import cache as cache_module
+import os
+import tempfile
+from equivalence import check_equivalence, check_implication, find_counterexample, is_tautology
+import equivalence as equivalence_module
+from sat import SATSolver, from_clauses, from_cnf, is_satisfiable, read_dimacs, satisfying_assignment
+from qm import merge, minimal_cover, minimize, prime_implicants, to_pair, to_pattern
+from runner import evaluate_expression, normalize, read_expressions, run_batch
+from zhegalkin import best_polarity, reed_muller, zhegalkin_coefficients, zhegalkin_polynomial
+from classify import essential_variables, is_complete, is_symmetric, post_classes
+from streaming import iter_rows, iter_truth_values, write_truth_table
+from bdd import BDD, FALSE
+from truthtable import TruthTable
+from codegen import compile_node, compile_postfix
+from expression import ExpressionBuilder, ExpressionSyntaxError, expression_variables, parse, topological_order
+from bitparallel import evaluate_node, expression_table, variable_columns, evaluate_columns, format_index_form, node_columns, sdnf_sknf_indices, \
+    table_rows
 
 
 class TestLogicMinimization(unittest.TestCase):
@@ -297,6 +317,433 @@ class TestLogicMinimization(unittest.TestCase):
             sys.stdin = original_stdin
 
 
+class TestBitParallel(unittest.TestCase):
+
+    def test_variable_columns(self):
+        self.assertEqual(variable_columns(2), [0b0011, 0b0101])
+        self.assertEqual(variable_columns(1), [0b01])
+
+    def test_evaluate_columns_matches_evaluate_postfix(self):
+        for expression in ["a & b", "!a | b", "a -> b", "(a ~ b) & !c", "(a | b) -> (c ~ d)"]:
+            variables = sorted(set(filter(str.isalpha, expression)))
+            postfix = infix_to_postfix(expression)
+            expected = ''.join(str(int(evaluate_postfix(postfix, dict(zip(variables, values)))))
+                               for values in generate_truth_values(len(variables)))
+            column = evaluate_columns(postfix, variables)
+            self.assertEqual(format_index_form(column, len(variables)), f"{int(expected, 2)} - {expected}")
+
+    def test_sdnf_sknf_indices_and_rows(self):
+        column = evaluate_columns(infix_to_postfix("a | b"), ["a", "b"])
+        self.assertEqual(sdnf_sknf_indices(column, 2), (["1", "2", "3"], ["0"]))
+        self.assertEqual(list(table_rows(column, 2)), [[0, 0, 0], [0, 1, 1], [1, 0, 1], [1, 1, 1]])
+
+    def test_unknown_token(self):
+        with self.assertRaises(ValueError):
+            evaluate_columns(["a", "x", "&"], ["a"])
+
+    def test_compile_postfix(self):
+        function = compile_postfix(infix_to_postfix("(a -> b) & !c"), ["a", "b", "c"])
+        for values in generate_truth_values(3):
+            expected = evaluate_postfix(["a", "b", "->", "c", "!", "&"], dict(zip("abc", values)))
+            self.assertEqual(function(*values), expected)
+        self.assertIs(function, compile_postfix(infix_to_postfix("(a -> b) & !c"), ("a", "b", "c")))
+        with self.assertRaises(ValueError):
+            compile_postfix(["a", "?"], ["a"])
+
+    def test_parse_identifiers_constants_and_new_operators(self):
+        self.assertEqual(expression_variables("x1 ^ Cin ↑ Q2"), ["Cin", "Q2", "x1"])
+        self.assertEqual(infix_to_postfix("x1 xor Cin"), ["x1", "Cin", "^"])
+        self.assertEqual(infix_to_postfix("a nand b"), ["a", "b", "↑"])
+        self.assertEqual(format_index_form(node_columns(parse("a ↓ b"), ["a", "b"]), 2), "8 - 1000")
+        self.assertEqual(format_index_form(node_columns(parse("!!a ^ 1"), ["a"]), 1), "2 - 10")
+
+    def test_parse_folds_constants_and_shares_subexpressions(self):
+        self.assertEqual(to_postfix(parse("a & 1 | 0")), ["a"])
+        self.assertEqual(to_postfix(parse("b -> b")), ["1"])
+        self.assertEqual(infix_to_postfix("a & 1 | 0"), ["a", "1", "&", "0", "|"])
+        self.assertEqual(infix_to_postfix("b -> b"), ["b", "b", "->"])
+        node = parse("(a & b) | !(a & b)")
+        self.assertIs(node.operands[0], node.operands[1].operands[0])
+        self.assertEqual(len(topological_order(node)), 5)
+        function = compile_node(node, ["a", "b"])
+        self.assertTrue(all(function(*values) for values in generate_truth_values(2)))
+
+    def test_parse_errors_have_positions(self):
+        for text, position in [("a &", 3), ("(a | b", 0), ("a | b)", 5), ("a $ b", 2), ("a b", 2), ("12", 0)]:
+            with self.assertRaises(ExpressionSyntaxError) as context:
+                parse(text)
+            self.assertEqual(context.exception.position, position)
+
+
+class TestBDD(unittest.TestCase):
+
+    def test_matches_truth_table(self):
+        bdd = BDD(["a", "b", "c"])
+        f = bdd.from_expression("(a -> b) & !c")
+        column = node_columns(parse("(a -> b) & !c"), ["a", "b", "c"])
+        self.assertEqual(bdd.index_form(f), format_index_form(column, 3))
+        self.assertEqual((bdd.sdnf_indices(f), bdd.sknf_indices(f)), sdnf_sknf_indices(column, 3))
+        self.assertEqual(bdd.sat_count(f), 3)
+
+    def test_restrict_exists_and_equivalence(self):
+        bdd = BDD(["a", "b"])
+        f = bdd.from_expression("a & b")
+        self.assertEqual(bdd.restrict(f, "a", 1), bdd.variable("b"))
+        self.assertEqual(bdd.restrict(f, "a", 0), FALSE)
+        self.assertEqual(bdd.exists(f, ["b"]), bdd.variable("a"))
+        self.assertTrue(bdd.equivalent(bdd.from_expression("!(a & b)"), bdd.from_expression("!a | !b")))
+
+    def test_sift_shrinks_bad_order_and_keeps_functions(self):
+        n = 6
+        bdd = BDD([f"x{i}" for i in range(n)] + [f"y{i}" for i in range(n)])
+        expression = " & ".join(f"(x{i} ~ y{i})" for i in range(n))
+        f = bdd.from_expression(expression)
+        before = bdd.node_count([f])
+        self.assertEqual(bdd.sift([f]), 3 * n)
+        self.assertLess(3 * n, before)
+        self.assertEqual(bdd.sat_count(f), 2 ** n)
+        self.assertEqual(bdd.from_expression(expression), f)
+
+    def test_many_variables(self):
+        bdd = BDD()
+        f = bdd.from_expression(" ^ ".join(f"x{i}" for i in range(60)))
+        self.assertEqual(bdd.node_count([f]), 119)
+        self.assertEqual(bdd.sat_count(f), 2 ** 59)
+
+
+class TestStreaming(unittest.TestCase):
+
+    def test_write_truth_table_matches_truth_table(self):
+        expression = "(a -> b) ~ !c"
+        variables = ["a", "b", "c"]
+        with StringIO() as buf, redirect_stdout(buf):
+            truth_table(expression, variables)
+            expected = buf.getvalue()
+        for block_bits in (1, 2, 16):
+            output = StringIO()
+            write_truth_table(expression, variables, output, block_bits)
+            self.assertTrue(expected.startswith(output.getvalue()))
+            self.assertIn("Индексная форма функции: 166 - 10100110", output.getvalue())
+
+    def test_iter_rows_and_progress(self):
+        self.assertEqual(list(iter_rows("a | b", ["a", "b"], 1)), [[0, 0, 0], [0, 1, 1], [1, 0, 1], [1, 1, 1]])
+        self.assertEqual(list(iter_truth_values(2)), [(False, False), (False, True), (True, False), (True, True)])
+        calls = []
+        write_truth_table("a & b", ["a", "b"], StringIO(), 1, lambda *args: calls.append(args))
+        self.assertIn(("таблица", 4, 4), calls)
+
+
+class TestTruthTableType(unittest.TestCase):
+
+    def test_rows_roundtrip_and_index_form(self):
+        table = TruthTable(["a", "b"], 0b0111)
+        self.assertEqual(table.to_rows(), [[0, 0, 0], [0, 1, 1], [1, 0, 1], [1, 1, 1]])
+        self.assertEqual(TruthTable.from_rows(table.to_rows(), ["a", "b"]), table)
+        self.assertEqual(table.index_form(), "7 - 0111")
+        self.assertEqual((list(table.minterms()), list(table.maxterms())), ([1, 2, 3], [0]))
+        self.assertEqual(TruthTable.from_minterms([1, 2, 3], ["a", "b"]), table)
+        self.assertEqual(len({table, TruthTable(["a", "b"], 7)}), 1)
+
+    def test_cofactor_complement_and_compose(self):
+        variables = ["a", "b", "c"]
+        f = TruthTable.from_function(lambda a, b, c: (a and b) or c, variables)
+        self.assertEqual(f.cofactor("a", 1), TruthTable.from_function(lambda b, c: b or c, ["b", "c"]))
+        self.assertEqual(f.cofactor("c", 0), TruthTable.from_function(lambda a, b: a and b, ["a", "b"]))
+        self.assertEqual((~f).bits, f.bits ^ 0xFF)
+        g = TruthTable.from_function(lambda a, b, c: a != b, variables)
+        self.assertEqual(f.compose("c", g), TruthTable.from_function(lambda a, b, c: (a and b) or a != b, variables))
+        with self.assertRaises(ValueError):
+            f & TruthTable(["x"], 1)
+
+    def test_large_index_form(self):
+        table = TruthTable([f"x{i}" for i in range(14)], 1 << (1 << 14) - 1)
+        decimal, binary = table.index_form().split(" - ")
+        # 2 ** 16383 ≈ 5.9486574767861588254e4931 — длиннее предела int_max_str_digits
+        self.assertEqual(len(decimal), 4932)
+        self.assertTrue(decimal.startswith("594865747678615882"))
+        self.assertEqual(binary, "1" + "0" * 16383)
+
+
+class TestClassify(unittest.TestCase):
+
+    def test_post_classes(self):
+        self.assertEqual(post_classes(expression_table("a & b")),
+                         {"T0": True, "T1": True, "S": False, "M": True, "L": False})
+        self.assertEqual(post_classes(expression_table("a ^ b ^ c")),
+                         {"T0": True, "T1": True, "S": True, "M": False, "L": True})
+        self.assertEqual(post_classes(expression_table("!a")),
+                         {"T0": False, "T1": False, "S": True, "M": False, "L": True})
+
+    def test_symmetry_and_essential_variables(self):
+        self.assertTrue(is_symmetric(expression_table("(a & b) | (b & c) | (a & c)")))
+        self.assertFalse(is_symmetric(expression_table("a -> b")))
+        self.assertEqual(essential_variables(expression_table("(a & b) | (a & !b) | (c & !c)")), ["a"])
+
+    def test_functional_completeness(self):
+        self.assertEqual(is_complete(["a ↑ b"]), (True, []))
+        self.assertEqual(is_complete(["a & b", "!a"]), (True, []))
+        self.assertEqual(is_complete(["a & b", "a | b"]), (False, ["T0", "T1", "M"]))
+
+
+class TestZhegalkin(unittest.TestCase):
+
+    def test_polynomial(self):
+        self.assertEqual(zhegalkin_polynomial(expression_table("a -> b")), "1 ^ a ^ (a & b)")
+        self.assertEqual(zhegalkin_polynomial(expression_table("a & !a")), "0")
+        self.assertEqual(zhegalkin_coefficients(expression_table("a ~ b")), 0b1110)
+
+    def test_polynomial_parses_back(self):
+        table = expression_table("((a -> b) & (c ~ d)) | !(e & a)")
+        for polarity in (0, 5, 31):
+            coefficients, polynomial = reed_muller(table, polarity)
+            self.assertEqual(expression_table(polynomial, list(table.variables)), table)
+
+    def test_best_polarity(self):
+        polarity, coefficients, polynomial = best_polarity(expression_table("a | b"))
+        self.assertEqual((polarity, polynomial), (3, "1 ^ (!a & !b)"))
+
+
+class TestRunner(unittest.TestCase):
+
+    def test_read_and_normalize(self):
+        lines = list(read_expressions(StringIO("a & b\n\n# комментарий\n  (a) & (b)  \n")))
+        self.assertEqual(lines, ["a & b", "(a) & (b)"])
+        self.assertEqual(normalize(lines[0]), normalize(lines[1]))
+        self.assertNotEqual(normalize("a & b"), normalize("b & a"))
+
+    def test_evaluate_expression(self):
+        response = evaluate_expression("a -> b")
+        self.assertEqual(response["index_form"], "13 - 1101")
+        self.assertEqual((response["sdnf"], response["sknf"]), ([0, 1, 3], [2]))
+        self.assertIn("error", evaluate_expression("a & (b"))
+
+    def test_run_batch_keeps_order(self):
+        expressions = ["a | b", "a & b", "(a | b)", "a &", "!a"]
+        output = StringIO()
+        count, unique, _ = run_batch(expressions, output)
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual((count, unique), (5, 4))
+        self.assertEqual([record["expression"] for record in records], expressions)
+        self.assertEqual(records[0]["sdnf"], records[2]["sdnf"])
+        self.assertIn("error", records[3])
+
+        parallel = StringIO()
+        run_batch(expressions, parallel, workers=2, chunk_size=1)
+        self.assertEqual(parallel.getvalue(), output.getvalue())
+
+
+class TestResultCache(unittest.TestCase):
+
+    def test_canonical_key(self):
+        self.assertEqual(canonical_key(parse("((a)&(b))"), ["a", "b"]), canonical_key(parse("a & b"), ["a", "b"]))
+        self.assertNotEqual(canonical_key(parse("a & b"), ["a", "b"]), canonical_key(parse("a & b"), ["b", "a"]))
+
+    def test_lru_eviction(self):
+        with ResultCache(":memory:", max_entries=2) as cache:
+            cache.put("x", {"value": 1})
+            cache.put("y", {"value": 2})
+            self.assertEqual(cache.get("x"), {"value": 1})
+            cache.put("z", {"value": 3})
+            self.assertEqual(len(cache), 2)
+            self.assertIn("x", cache)
+            self.assertNotIn("y", cache)
+            self.assertIsNone(cache.get("y"))
+
+    def test_version_change_clears(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite3")
+            with ResultCache(path) as cache:
+                cache.put("x", {"value": 1})
+            with ResultCache(path) as cache:
+                self.assertEqual(cache.get("x"), {"value": 1})
+            cache_module.CACHE_VERSION = CACHE_VERSION + 1
+            try:
+                with ResultCache(path) as cache:
+                    self.assertEqual(len(cache), 0)
+            finally:
+                cache_module.CACHE_VERSION = CACHE_VERSION
+
+    def test_truth_table_uses_cache(self):
+        expression = "(((a->b)~(c->d))->e)"
+        variables = expression_variables(expression)
+        with ResultCache(":memory:") as cache:
+            outputs = []
+            for _ in range(2):
+                output = StringIO()
+                with redirect_stdout(output):
+                    truth_table(expression, variables, cache)
+                outputs.append(output.getvalue())
+            self.assertEqual(len(cache), 1)
+            self.assertEqual(outputs[0], outputs[1])
+            self.assertEqual(analyze(expression, variables, cache), analyze(expression, variables))
+
+
+class TestEquivalence(unittest.TestCase):
+
+    def test_equivalence(self):
+        self.assertEqual(check_equivalence("a -> b", "!a | b"), (True, None))
+        self.assertEqual(check_equivalence("a ↑ b", "!(a & b)"), (True, None))
+        self.assertEqual(check_equivalence("a -> b", "b -> a"), (False, {"a": 0, "b": 1}))
+
+    def test_implication_and_tautology(self):
+        self.assertEqual(check_implication("a & b", "a | c"), (True, None))
+        self.assertEqual(check_implication("a | c", "a & b"), (False, {"a": 0, "b": 0, "c": 1}))
+        self.assertEqual(is_tautology("(a -> b) | (b -> a)"), (True, None))
+        self.assertEqual(is_tautology("a | b"), (False, {"a": 0, "b": 0}))
+
+    def test_counterexample_in_later_block(self):
+        builder = ExpressionBuilder()
+        node = parse("!(a & b & c & d & e)", builder)
+        self.assertEqual(find_counterexample(node, list("abcde"), builder, block_bits=2),
+                         dict.fromkeys("abcde", 1))
+
+    def test_large_expressions_use_search(self):
+        names = [f"x{i}" for i in range(equivalence_module.MAX_ENUMERATE + 20)]
+        conjunction = " & ".join(names)
+        de_morgan = "!(" + " | ".join(f"!{name}" for name in names) + ")"
+        self.assertEqual(check_equivalence(conjunction, de_morgan), (True, None))
+        changed = de_morgan.replace(f"!{names[-1]})", f"!{names[0]})")
+        equal, counterexample = check_equivalence(conjunction, changed)
+        self.assertFalse(equal)
+        self.assertNotEqual(evaluate_node(parse(conjunction), counterexample, 1),
+                            evaluate_node(parse(changed), counterexample, 1))
+
+    def test_search_matches_enumeration(self):
+        pairs = [("(a -> b) ~ !c", "(!a | b) ^ c"), ("(a ^ b) & c", "(a & c) ^ (b & c)"),
+                 ("a ↓ (b | c)", "!a & !b & c")]
+        for first, second in pairs:
+            builder = ExpressionBuilder()
+            node = builder.operation("~", parse(first, builder), parse(second, builder))
+            variables = expression_variables(first + " & " + second)
+            found = satisfying_assignment(builder.operation("!", node), variables)
+            self.assertEqual(found is None, find_counterexample(node, variables) is None)
+
+
+class TestSAT(unittest.TestCase):
+
+    def test_random_cnf_matches_enumeration(self):
+        generator = random.Random(1)
+        for _ in range(200):
+            n = generator.randint(1, 8)
+            clauses = [[generator.choice([-1, 1]) * generator.randint(1, n) for _ in range(generator.randint(1, 3))]
+                       for _ in range(generator.randint(1, 40))]
+            solver = SATSolver()
+            for clause in clauses:
+                solver.add_clause(clause)
+            expected = any(all(any((literal > 0) == bool(bits >> (abs(literal) - 1) & 1) for literal in clause)
+                               for clause in clauses) for bits in range(1 << n))
+            self.assertEqual(solver.solve(), expected)
+            if expected:
+                for clause in clauses:
+                    self.assertTrue(any(solver.model[abs(literal)] == (literal > 0) for literal in clause))
+
+    def test_pigeonhole_is_unsatisfiable(self):
+        pigeons, holes = 6, 5
+        solver = SATSolver()
+        variable = lambda i, j: i * holes + j + 1
+        for i in range(pigeons):
+            solver.add_clause([variable(i, j) for j in range(holes)])
+        for j in range(holes):
+            for a in range(pigeons):
+                for b in range(a + 1, pigeons):
+                    solver.add_clause([-variable(a, j), -variable(b, j)])
+        self.assertFalse(solver.solve())
+        self.assertGreater(solver.conflicts, 0)
+
+    def test_cnf_sources(self):
+        variables = ["a", "b", "c"]
+        table = TruthTable(variables, node_columns(parse("(a -> b) & (b -> c) & a"), variables)).to_rows()
+        _, sknf, _, _ = generate_sdnf_sknf(table, variables)
+        solver, names = from_cnf(sknf)
+        self.assertTrue(solver.solve())
+        self.assertEqual({name: solver.model[v] for name, v in names.items()}, {"a": True, "b": True, "c": True})
+        solver, _ = from_clauses([["a", "-"], ["!a", "b"], ["!b", "-"]])
+        self.assertFalse(solver.solve())
+        solver = read_dimacs(StringIO("c пример\np cnf 3 3\n1 -2 0\n2 3\n0\n-1 0\n"))
+        self.assertTrue(solver.solve())
+        self.assertEqual((solver.model[1], solver.model[3]), (False, True))
+
+    def test_tseitin_expressions(self):
+        self.assertEqual(is_satisfiable("a & !a"), (False, None))
+        self.assertEqual(is_satisfiable("(a ↓ b) & (a ~ b)"), (True, {"a": 0, "b": 0}))
+        self.assertEqual(is_satisfiable("(a ^ a) | b"), (True, {"a": 0, "b": 1}))
+        self.assertEqual(is_satisfiable("a | !a"), (True, {"a": 0}))
+        names = [f"x{i}" for i in range(300)]
+        chain = " & ".join(f"({names[i]} | !{names[i + 1]})" for i in range(299))
+        self.assertFalse(is_satisfiable(f"{chain} & {names[-1]} & !{names[0]}")[0])
+        satisfiable, assignment = is_satisfiable(f"{chain} & {names[-1]}")
+        self.assertTrue(satisfiable)
+        self.assertTrue(all(assignment.values()))
+
+    def test_parity_equivalence(self):
+        names = [f"x{i}" for i in range(40)]
+        self.assertTrue(check_equivalence(" ^ ".join(names), "!(" + " ~ ".join(names) + ")")[0])
+
+
+class TestQM(unittest.TestCase):
+
+    def test_pairs(self):
+        self.assertEqual(to_pair("1-0"), (0b100, 0b010))
+        self.assertEqual(to_pattern(0b100, 0b010, 3), "1-0")
+        merged, primes = merge({(0b000, 0): {0}, (0b001, 0): {1}, (0b110, 0): {2}}, 3)
+        self.assertEqual(merged, {(0b000, 0b001): {0, 1}})
+        self.assertEqual(primes, [((0b110, 0), {2})])
+
+    def test_cyclic_function(self):
+        # Циклическая функция: шесть простых импликант по два литерала, минимум — три
+        minterms = [0, 1, 2, 5, 6, 7]
+        primes = prime_implicants(minterms, 3)
+        self.assertEqual(sorted(to_pattern(value, mask, 3) for (value, mask), _ in primes),
+                         ["-01", "-10", "0-0", "00-", "1-1", "11-"])
+        implicants, exact = minimize(minterms, 3)
+        self.assertEqual(len(implicants), 3)
+        self.assertTrue(exact)
+        # Обязательных и поглощённых импликант нет: без бюджета остаётся жадное покрытие
+        implicants, exact = minimize(minterms, 3, limit=0)
+        self.assertEqual(len(implicants), 3)
+        self.assertFalse(exact)
+
+    def test_dont_cares(self):
+        self.assertEqual(minimize([1, 3], 2, dont_cares=[0, 2]), ([(0, 0b11)], True))
+        self.assertEqual([to_pattern(value, mask, 3) for value, mask in minimize([7], 3, dont_cares=[5, 6])[0]],
+                         ["1-1"])
+
+    def test_minimal_cover(self):
+        self.assertEqual(minimal_cover([0b011, 0b110, 0b100, 0b001], [2, 3, 1, 1]), ([0, 2], True))
+        self.assertEqual(minimal_cover([], []), ([], True))
+
+    def test_minimal_cover_matches_exhaustive_search(self):
+        generator = random.Random(3)
+        for _ in range(30):
+            covers = [generator.getrandbits(8) | 1 << generator.randrange(8) for _ in range(8)]
+            costs = [generator.randint(1, 4) for _ in covers]
+            unions = [0] * (1 << 8)
+            totals = [0] * (1 << 8)
+            for subset in range(1, 1 << 8):
+                row = (subset & -subset).bit_length() - 1
+                unions[subset] = unions[subset & subset - 1] | covers[row]
+                totals[subset] = totals[subset & subset - 1] + costs[row]
+            best = min(total for union, total in zip(unions, totals) if union == unions[-1])
+            rows, exact = minimal_cover(covers, costs)
+            self.assertTrue(exact)
+            self.assertEqual(sum(costs[row] for row in rows), best)
+
+    def test_large_function(self):
+        n = 10
+        generator = random.Random(n)
+        minterms = [m for m in range(1 << n) if generator.random() < 0.5]
+        variables = [f"x{i}" for i in range(n)]
+        # Перебор по умолчанию ограничен SEARCH_LIMIT: результат — покрытие, пусть и не точно минимальное
+        implicants, exact = minimize(minterms, n)
+        self.assertFalse(exact)
+        terms = []
+        for value, mask in implicants:
+            literals = [name if value >> (n - 1 - i) & 1 else f"!{name}"
+                        for i, name in enumerate(variables) if not mask >> (n - 1 - i) & 1]
+            terms.append("(" + " & ".join(literals) + ")")
+        self.assertEqual(expression_table(" | ".join(terms), variables), TruthTable.from_minterms(minterms, variables))
+
+
 if __name__ == '__main__':
     unittest.main()
 # coverage run -m unittest test3.py
@@ -0,0 +1,164 @@
+from bitparallel import decimal_string, variable_columns
+
+
+def _full(n):
+    return (1 << (1 << n)) - 1
+
+
+class TruthTable:
+    """
+    Таблица истинности булевой функции, хранящая столбец результата одним целым числом:
+    строка i — бит 2 ** n - 1 - i, так что число совпадает с индексной формой функции.
+    Строки в прежнем формате ([значения переменных..., результат]) дают to_rows/from_rows.
+    """
+    __slots__ = ("variables", "bits")
+
+    def __init__(self, variables, bits):
+        self.variables = tuple(variables)
+        if bits < 0 or bits > _full(len(self.variables)):
+            raise ValueError(f"Столбец не помещается в таблицу из {1 << len(self.variables)} строк")
+        self.bits = bits
+
+    @classmethod
+    def from_rows(cls, rows, variables):
+        """Из списка строк [значения..., результат], перечисленных по порядку наборов"""
+        rows = list(rows)
+        if len(rows) != 1 << len(variables):
+            raise ValueError(f"Ожидалось {1 << len(variables)} строк, получено {len(rows)}")
+        return cls(variables, int("".join(str(int(row[-1])) for row in rows) or "0", 2))
+
+    @classmethod
+    def from_minterms(cls, minterms, variables):
+        size = 1 << len(variables)
+        bits = 0
+        for index in minterms:
+            bits |= 1 << (size - 1 - index)
+        return cls(variables, bits)
+
+    @classmethod
+    def from_function(cls, function, variables):
+        """Вычисляет function(*значения) на всех наборах по порядку"""
+        n = len(variables)
+        bits = 0
+        for index in range(1 << n):
+            values = [index >> (n - 1 - i) & 1 for i in range(n)]
+            bits = bits << 1 | bool(function(*values))
+        return cls(variables, bits)
+
+    @property
+    def size(self):
+        return 1 << len(self.variables)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        """Значение функции на наборе с номером index"""
+        if not 0 <= index < self.size:
+            raise IndexError("Номер набора вне таблицы")
+        return self.bits >> (self.size - 1 - index) & 1
+
+    def values(self):
+        """Столбец результата списком 0/1"""
+        return [int(bit) for bit in self.binary()]
+
+    def binary(self):
+        return format(self.bits, f"0{self.size}b")
+
+    def index_form(self):
+        return f"{decimal_string(self.bits)} - {self.binary()}"
+
+    def _indices(self, digit):
+        text = self.binary()
+        index = text.find(digit)
+        while index != -1:
+            yield index
+            index = text.find(digit, index + 1)
+
+    def minterms(self):
+        """Номера наборов, где функция равна 1, по возрастанию"""
+        return self._indices("1")
+
+    def maxterms(self):
+        """Номера наборов, где функция равна 0, по возрастанию"""
+        return self._indices("0")
+
+    def count(self):
+        return bin(self.bits).count("1")
+
+    def to_rows(self):
+        n = len(self.variables)
+        return [[index >> (n - 1 - i) & 1 for i in range(n)] + [int(bit)]
+                for index, bit in enumerate(self.binary())]
+
+    def _position(self, name):
+        if name not in self.variables:
+            raise ValueError(f"Неизвестная переменная: {name}")
+        return self.variables.index(name)
+
+    def _expanded_cofactor(self, k, value):
+        # Кофактор, записанный на прежнем наборе переменных (не зависит от k-й)
+        n = len(self.variables)
+        ones = variable_columns(n)[k]
+        block = 1 << (n - 1 - k)
+        if value:
+            part = self.bits & ones
+            return part | part << block
+        part = self.bits & ~ones & _full(n)
+        return part | part >> block
+
+    def cofactor(self, name, value):
+        """Таблица функции при name = value над остальными переменными"""
+        k = self._position(name)
+        n = len(self.variables)
+        columns = variable_columns(n)
+        block = 1 << (n - 1 - k)
+        # Нужные строки — в младшей половине каждого периода из 2 * block строк
+        bits = self.bits & columns[k] if value else (self.bits >> block) & columns[k]
+        # Соседние куски сдвигаются друг к другу: ширина удваивается, пока не останется один
+        for j in range(k - 1, -1, -1):
+            bits = (bits | bits >> block) & columns[j]
+            block *= 2
+        return TruthTable(self.variables[:k] + self.variables[k + 1:], bits)
+
+    def compose(self, name, other):
+        """Подстановка функции other (над теми же переменными) вместо переменной name"""
+        self._check_variables(other)
+        k = self._position(name)
+        high, low = self._expanded_cofactor(k, 1), self._expanded_cofactor(k, 0)
+        return TruthTable(self.variables, (other.bits & high) | (~other.bits & _full(len(self.variables)) & low))
+
+    def _check_variables(self, other):
+        if not isinstance(other, TruthTable):
+            raise TypeError("Ожидалась TruthTable")
+        if other.variables != self.variables:
+            raise ValueError("Таблицы должны быть заданы над одними и теми же переменными")
+
+    def __invert__(self):
+        return TruthTable(self.variables, self.bits ^ _full(len(self.variables)))
+
+    def complement(self):
+        return ~self
+
+    def __and__(self, other):
+        self._check_variables(other)
+        return TruthTable(self.variables, self.bits & other.bits)
+
+    def __or__(self, other):
+        self._check_variables(other)
+        return TruthTable(self.variables, self.bits | other.bits)
+
+    def __xor__(self, other):
+        self._check_variables(other)
+        return TruthTable(self.variables, self.bits ^ other.bits)
+
+    def __eq__(self, other):
+        if not isinstance(other, TruthTable):
+            return NotImplemented
+        return self.variables == other.variables and self.bits == other.bits
+
+    def __hash__(self):
+        return hash((self.variables, self.bits))
+
+    def __repr__(self):
+        return f"TruthTable({list(self.variables)!r}, {self.binary()!r})"
@@ -0,0 +1,66 @@
+from bitparallel import flip_variables, variable_blocks, variable_columns
+
+
+def zhegalkin_coefficients(table, polarity=0):
+    """
+    Коэффициенты полинома Жегалкина быстрым преобразованием Мёбиуса (n сдвигов и XOR
+    над столбцом целиком). Бит строки i результата — коэффициент при произведении
+    переменных, равных 1 в наборе i. polarity — номер набора: переменные, равные в нём 1,
+    входят в полином с отрицанием (Рида — Маллера фиксированной полярности).
+    """
+    n = len(table.variables)
+    # Полярность — подстановка f(x ^ polarity) до преобразования
+    bits = flip_variables(table.bits, n, polarity)
+    for column, block in zip(variable_columns(n), variable_blocks(n)):
+        bits ^= (bits >> block) & column
+    return bits
+
+
+def monomials(coefficients, variables, polarity=0):
+    """Одночлены полинома по возрастанию степени, в порядке переменных"""
+    n = len(variables)
+    text = format(coefficients, f"0{1 << n}b")
+    indices = []
+    index = text.find("1")
+    while index != -1:
+        indices.append(index)
+        index = text.find("1", index + 1)
+    indices.sort(key=lambda i: (bin(i).count("1"), -i))
+    terms = []
+    for i in indices:
+        literals = [f"!{var}" if polarity & block else var
+                    for var, block in zip(variables, variable_blocks(n)) if i & block]
+        if not literals:
+            terms.append("1")
+        elif len(literals) == 1:
+            terms.append(literals[0])
+        else:
+            terms.append(f"({' & '.join(literals)})")
+    return terms
+
+
+def reed_muller(table, polarity=0):
+    """(коэффициенты, строка полинома) для заданной полярности; строку можно снова разобрать parse"""
+    coefficients = zhegalkin_coefficients(table, polarity)
+    terms = monomials(coefficients, table.variables, polarity)
+    return coefficients, " ^ ".join(terms) if terms else "0"
+
+
+def zhegalkin_polynomial(table):
+    return reed_muller(table)[1]
+
+
+def best_polarity(table):
+    """
+    Полярность с наименьшим числом одночленов полным перебором 2 ** n полярностей.
+    Возвращает (полярность, коэффициенты, строка полинома).
+    """
+    best = None
+    for polarity in range(table.size):
+        coefficients = zhegalkin_coefficients(table, polarity)
+        count = bin(coefficients).count("1")
+        if best is None or count < best[0]:
+            best = count, polarity, coefficients
+    _, polarity, coefficients = best
+    terms = monomials(coefficients, table.variables, polarity)
+    return polarity, coefficients, " ^ ".join(terms) if terms else "0"
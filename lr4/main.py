@@ -1,3 +1,6 @@
+from qm import merge, minimal_cover, to_pair, to_pattern
+
+
 def generate_truth_values(n):
     return [[bool(int(x)) for x in bin(i)[2:].zfill(n)] for i in range(2 ** n)]
 
@@ -18,24 +21,13 @@ def generate_sdnf_sknf(truth_table, variables):
 
 
 def combine_implicants(implicants, n):
-    new_list = []
-    used = [False] * len(implicants)
-    for i in range(len(implicants)):
-        for j in range(i + 1, len(implicants)):
-            p1, cov1 = implicants[i]
-            p2, cov2 = implicants[j]
-            diffs = [k for k in range(n) if p1[k] != p2[k]]
-            if len(diffs) == 1:
-                idx = diffs[0]
-                new_pattern = p1[:idx] + '-' + p1[idx + 1:]
-                new_cov = cov1 | cov2
-                candidate = (new_pattern, new_cov)
-                if candidate not in new_list:
-                    new_list.append(candidate)
-                used[i] = True
-                used[j] = True
-    primes = [implicants[i] for i in range(len(implicants)) if not used[i]]
-    return new_list, primes
+    terms = {}
+    for pattern, cover in implicants:
+        key = to_pair(pattern)
+        terms[key] = terms[key] | cover if key in terms else cover
+    merged, primes = merge(terms, n)
+    new_list = [(to_pattern(value, mask, n), cover) for (value, mask), cover in merged.items()]
+    return new_list, [(to_pattern(value, mask, n), cover) for (value, mask), cover in primes]
 
 
 def generate_prime_implicants(minterm_patterns):
@@ -56,28 +48,15 @@ def literal_count(pattern):
 
 
 def select_minimal_cover(prime_implicants, total_minterms):
-    best_cover = None
-    best_cost = float('inf')
-
-    def backtrack(selected, covered, start):
-        nonlocal best_cover, best_cost
-        if covered == total_minterms:
-            cost = sum(literal_count(prime_implicants[i][0]) for i in selected)
-            if cost < best_cost:
-                best_cost = cost
-                best_cover = selected.copy()
-            return
-        for i in range(start, len(prime_implicants)):
-            new_covered = covered | prime_implicants[i][1]
-            if new_covered != covered:
-                selected.append(i)
-                backtrack(selected, new_covered, i + 1)
-                selected.pop()
-
-    backtrack([], set(), 0)
-    if best_cover is None:
+    positions = {m: i for i, m in enumerate(sorted(total_minterms))}
+    covers = [sum(1 << positions[m] for m in cover if m in positions) for _, cover in prime_implicants]
+    covered = 0
+    for cover in covers:
+        covered |= cover
+    if covered != (1 << len(positions)) - 1:
         return []
-    return [prime_implicants[i] for i in best_cover]
+    rows, _ = minimal_cover(covers, [literal_count(pattern) for pattern, _ in prime_implicants])
+    return [prime_implicants[i] for i in rows]
 
 
 def minimize_sdnf(sdnf, variables):
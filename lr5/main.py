@@ -1,5 +1,7 @@
 from itertools import product
 
+from qm import merge, to_pair, to_pattern
+
 
 class DigitalCounter:
     def __init__(self, num_states):
@@ -59,45 +61,17 @@ class DigitalCounter:
 
     def qm_minimize(self, minterms, num_vars):
         """Метод Квайна-Маккласки для минимизации"""
-        # Преобразуем минтермы в битовые строки
-        terms = [(self.to_binary(m, num_vars), {i}) for i, m in enumerate(minterms)]
+        # Минтермы — пары (value, mask), склеиваются этапами qm.merge
+        terms = {}
+        for i, m in enumerate(minterms):
+            key = to_pair(self.to_binary(m, num_vars))
+            terms[key] = terms.get(key, set()) | {i}
         prime_implicants = []
 
-        while True:
-            used = [False] * len(terms)
-            new_terms = []
-
-            # Попарное сравнение терминов
-            for i in range(len(terms)):
-                for j in range(i + 1, len(terms)):
-                    bits1, set1 = terms[i]
-                    bits2, set2 = terms[j]
-                    diff = 0
-                    new_bits = []
-
-                    for b1, b2 in zip(bits1, bits2):
-                        if b1 != b2:
-                            diff += 1
-                            new_bits.append('-')
-                        else:
-                            new_bits.append(b1)
-
-                    if diff == 1:
-                        used[i] = True
-                        used[j] = True
-                        new_term = (''.join(new_bits), set1.union(set2))
-                        if new_term not in new_terms:
-                            new_terms.append(new_term)
-
-            # Добавляем неиспользованные термины как простые импликанты
-            for idx, flag in enumerate(used):
-                if not flag and terms[idx] not in prime_implicants:
-                    prime_implicants.append(terms[idx])
-
-            if not new_terms:
-                break
-
-            terms = new_terms
+        while terms:
+            terms, primes = merge(terms, num_vars)
+            # Неиспользованные термины — простые импликанты
+            prime_implicants.extend((to_pattern(value, mask, num_vars), cover) for (value, mask), cover in primes)
 
         return prime_implicants
 
@@ -0,0 +1,277 @@
+import heapq
+
+# Бюджет перебора minimal_cover по умолчанию (просмотров столбцов): около секунды, дальше —
+# лучшее найденное покрытие с признаком неточности
+SEARCH_LIMIT = 1_000_000
+
+# Метод Квайна — Мак-Класки на целых числах. Импликанта — пара (value, mask):
+# mask — разряды, от которых она не зависит ('-'), value — единицы в остальных разрядах
+# (старший разряд — первая переменная), так что '1-0' — это (0b100, 0b010).
+
+def to_pair(pattern):
+    """Строка из '0', '1', '-' -> (value, mask)"""
+    value = mask = 0
+    for char in pattern:
+        value = value << 1 | (char == '1')
+        mask = mask << 1 | (char == '-')
+    return value, mask
+
+
+def to_pattern(value, mask, num_vars):
+    """(value, mask) -> строка из '0', '1', '-' длины num_vars"""
+    return "".join('-' if mask >> k & 1 else str(value >> k & 1) for k in range(num_vars - 1, -1, -1))
+
+
+def merge(terms, num_vars):
+    """
+    Один этап склеивания. terms — словарь {(value, mask): покрытие}, где покрытие — множество
+    или битовая маска: склеенный терм получает объединение покрытий. Терм склеивается только
+    с термом той же маски, у которого на одну единицу больше, — его ищем в словаре по каждому
+    свободному нулевому разряду, без попарного сравнения.
+    Возвращает (словарь склеенных термов, список несклеенных пар ((value, mask), покрытие)).
+    """
+    merged = {}
+    used = set()
+    full = (1 << num_vars) - 1
+    for key, cover in terms.items():
+        value, mask = key
+        free = full & ~(value | mask)
+        while free:
+            bit = free & -free
+            free ^= bit
+            partner = (value | bit, mask)
+            if partner in terms:
+                combined = (value, mask | bit)
+                if combined not in merged:
+                    merged[combined] = cover | terms[partner]
+                used.add(key)
+                used.add(partner)
+    return merged, [(key, cover) for key, cover in terms.items() if key not in used]
+
+
+def _prime_keys(values, num_vars):
+    # Простые импликанты без покрытий. Термы одной маски хранятся множеством значений, и пары
+    # по каждому разряду находятся пересечением множеств, а не поиском партнёра для каждого терма
+    full = (1 << num_vars) - 1
+    groups = {0: set(values)}
+    primes = []
+    while groups:
+        merged = {}
+        for mask, group in groups.items():
+            used = set()
+            free = full & ~mask
+            while free:
+                bit = free & -free
+                free ^= bit
+                pairs = group.intersection([value ^ bit for value in group if value & bit])
+                if pairs:
+                    # Склеенный терм строится один раз — из группы без старшего разряда его маски
+                    if bit > mask:
+                        merged.setdefault(mask | bit, set()).update(pairs)
+                    used |= pairs
+                    used.update([value | bit for value in pairs])
+            primes.extend((value, mask) for value in group - used)
+        groups = merged
+    return sorted(primes)
+
+
+def _covered(value, mask, positions):
+    # Номера покрываемых импликантой элементов: перебор подмасок mask
+    covered = []
+    sub = mask
+    while True:
+        covered.extend(positions.get(value | sub, ()))
+        if not sub:
+            return covered
+        sub = (sub - 1) & mask
+
+
+def _bits(number):
+    # Номера единичных разрядов числа по возрастанию
+    text = bin(number)[:1:-1]
+    positions = []
+    position = text.find('1')
+    while position >= 0:
+        positions.append(position)
+        position = text.find('1', position + 1)
+    return positions
+
+
+def _mask(positions, size):
+    # Число с единицами в разрядах positions (size — верхняя граница номеров)
+    octets = bytearray((size + 7) // 8)
+    for position in positions:
+        octets[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(octets, "little")
+
+
+def prime_implicants(minterms, num_vars, dont_cares=()):
+    """
+    Простые импликанты списком пар ((value, mask), cover): бит i числа cover — покрывает ли
+    импликанта i-й элемент minterms. Безразличные наборы участвуют в склеивании, но не в cover.
+    """
+    positions = {}
+    for position, minterm in enumerate(minterms):
+        positions.setdefault(minterm, []).append(position)
+    primes = _prime_keys(set(positions) | set(dont_cares), num_vars)
+    return [((value, mask), _mask(_covered(value, mask, positions), len(minterms))) for value, mask in primes]
+
+
+def _greedy_cover(covers, costs, uncovered):
+    # Жадно берём строку с наибольшим числом новых столбцов на единицу стоимости. Выигрыш
+    # строки со временем только падает, поэтому пересчитываем его лишь у вершины кучи
+    heap = [(-(cover & uncovered).bit_count() / (costs[row] + 0.5), row)
+            for row, cover in enumerate(covers) if cover & uncovered]
+    heapq.heapify(heap)
+    chosen = []
+    cost = 0
+    while uncovered:
+        _, row = heapq.heappop(heap)
+        gain = (covers[row] & uncovered).bit_count()
+        if not gain:
+            continue
+        score = -gain / (costs[row] + 0.5)
+        if heap and score > heap[0][0]:
+            heapq.heappush(heap, (score, row))
+            continue
+        chosen.append(row)
+        cost += costs[row]
+        uncovered &= ~covers[row]
+    return chosen, cost
+
+
+def _reduce(rows, costs):
+    # Обязательные строки и строки, поглощённые не более дорогой строкой, пока что-то меняется.
+    # rows — множества номеров столбцов, изменяются на месте.
+    # Возвращает (взятые строки, оставшиеся строки, {столбец: множество его строк})
+    rows_of = {}
+    for row, columns in enumerate(rows):
+        for column in columns:
+            rows_of.setdefault(column, set()).add(row)
+    active = {row for row, columns in enumerate(rows) if columns}
+    chosen = []
+
+    def take(row):
+        chosen.append(row)
+        for column in list(rows[row]):
+            for other in rows_of.pop(column):
+                rows[other].discard(column)
+                if not rows[other]:
+                    active.discard(other)
+
+    def drop(row):
+        active.discard(row)
+        for column in rows[row]:
+            rows_of[column].discard(row)
+
+    changed = True
+    while changed:
+        changed = False
+        for column in [column for column, owners in rows_of.items() if len(owners) == 1]:
+            if column in rows_of:
+                take(next(iter(rows_of[column])))
+                changed = True
+        # Кандидаты в поглощающие — строки самого редкого столбца строки (по числам на начало прохода)
+        counts = {column: len(owners) for column, owners in rows_of.items()}
+        for row in sorted(active):
+            if row not in active:
+                continue
+            part = rows[row]
+            for other in rows_of[min(part, key=counts.__getitem__)]:
+                # other покрывает всё, что row; при равенстве оставляем строку с меньшим номером
+                if other != row and part <= rows[other] and \
+                        (costs[other], len(rows[other]) == len(part), other) < (costs[row], True, row):
+                    drop(row)
+                    changed = True
+                    break
+    return chosen, active, rows_of
+
+
+def _cover(rows, costs, limit):
+    # minimal_cover для строк, заданных множествами номеров столбцов
+    chosen, active, rows_of = _reduce(rows, costs)
+    if not rows_of:
+        return sorted(chosen), True
+    # Остаток задачи перенумеровывается подряд: столбцы — разряды remaining, строки — по стоимости
+    order = sorted(active, key=lambda row: (costs[row], row))
+    rank = {row: i for i, row in enumerate(order)}
+    index = {column: i for i, column in enumerate(sorted(rows_of))}
+    candidates = [[] for _ in index]
+    masks = []
+    for row in order:
+        positions = [index[column] for column in rows[row]]
+        for position in positions:
+            candidates[position].append(row)
+        masks.append(_mask(positions, len(index)))
+    column_rows = [_mask((rank[row] for row in owners), len(order)) for owners in candidates]
+    full = (1 << len(index)) - 1
+
+    def bound(remaining):
+        # Нижняя оценка, столбец для ветвления и число просмотренных столбцов
+        lower = blocked = 0
+        column, fewest = None, None
+        columns = _bits(remaining)
+        for position in columns:
+            owners = candidates[position]
+            if fewest is None or len(owners) < fewest:
+                column, fewest = position, len(owners)
+            if not column_rows[position] & blocked:
+                blocked |= column_rows[position]
+                lower += costs[owners[0]]
+        return lower, column, len(columns)
+
+    greedy, best_cost = _greedy_cover(masks, [costs[row] for row in order], full)
+    best = [order[i] for i in greedy]
+    best_path = None
+    stack = [(full, 0, None)]
+    steps = 0
+    while stack and (limit is None or steps < limit):
+        remaining, cost, path = stack.pop()
+        if not remaining:
+            if cost < best_cost:
+                best_cost, best_path = cost, path
+            continue
+        lower, column, seen = bound(remaining)
+        steps += seen
+        if cost + lower >= best_cost:
+            continue
+        for row in reversed(candidates[column]):
+            if cost + costs[row] < best_cost:
+                stack.append((remaining & ~masks[rank[row]], cost + costs[row], (row, path)))
+    if best_path is not None:
+        best = []
+        while best_path is not None:
+            row, best_path = best_path
+            best.append(row)
+    return sorted(chosen + best), not stack
+
+
+def minimal_cover(covers, costs, limit=SEARCH_LIMIT):
+    """
+    Покрытие наименьшей суммарной стоимости, покрывающее все столбцы — биты объединения
+    covers. Сначала берутся обязательные строки и отбрасываются поглощённые, затем перебор
+    с отсечением по нижней оценке (сумма минимальных стоимостей столбцов без общих строк),
+    ветвящийся по столбцу с наименьшим числом строк и начинающий с жадного решения.
+    limit — бюджет перебора: сколько всего столбцов просматривают нижние оценки; None — без
+    ограничения. Возвращает (номера строк по возрастанию, точно ли найден минимум): если
+    бюджет кончился раньше перебора, строки — лучшее найденное покрытие, а второй элемент — False.
+    """
+    return _cover([set(_bits(cover)) for cover in covers], costs, limit)
+
+
+def minimize(minterms, num_vars, dont_cares=(), limit=SEARCH_LIMIT):
+    """
+    Минимальная по числу литералов дизъюнкция простых импликант:
+    (список пар (value, mask), точно ли найден минимум) — см. limit в minimal_cover.
+    """
+    positions = {minterm: (position,) for position, minterm in enumerate(dict.fromkeys(minterms))}
+    primes = []
+    rows = []
+    for value, mask in _prime_keys(set(positions) | set(dont_cares), num_vars):
+        covered = _covered(value, mask, positions)
+        if covered:
+            primes.append((value, mask))
+            rows.append(set(covered))
+    costs = [num_vars - bin(mask).count("1") for _, mask in primes]
+    chosen, exact = _cover(rows, costs, limit)
+    return [primes[row] for row in chosen], exact